@@ -0,0 +1,69 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JewelryCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, verbose_name='分类名称')),
+                ('description', models.TextField(blank=True, verbose_name='分类描述')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='创建时间')),
+            ],
+            options={
+                'verbose_name': '珠宝分类',
+                'verbose_name_plural': '珠宝分类管理',
+                'db_table': 'jewelry_category',
+            },
+        ),
+        migrations.CreateModel(
+            name='JewelryItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, verbose_name='珠宝名称')),
+                ('wuxing', models.CharField(choices=[('金', '金'), ('木', '木'), ('水', '水'), ('火', '火'), ('土', '土')], max_length=10, verbose_name='五行属性')),
+                ('price_tier', models.CharField(choices=[('high', '高端'), ('mid', '中端'), ('low', '入门')], max_length=10, verbose_name='价格等级')),
+                ('description', models.TextField(blank=True, verbose_name='详细描述')),
+                ('image_url', models.URLField(blank=True, max_length=500, verbose_name='图片链接')),
+                ('digital_tags', models.JSONField(default=list, help_text='存储数字磁场的标签列表，如[3, 9, "天医"]', verbose_name='数字标签')),
+                ('fengshui_tags', models.JSONField(default=list, help_text='存储风水属性的标签列表，如["东南", "土"]', verbose_name='风水标签')),
+                ('base_price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='基础价格')),
+                ('is_active', models.BooleanField(default=True, verbose_name='是否上架')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='创建时间')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+            ],
+            options={
+                'verbose_name': '珠宝商品',
+                'verbose_name_plural': '珠宝商品管理',
+                'db_table': 'jewelry_item',
+            },
+        ),
+        migrations.CreateModel(
+            name='Recommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recommend_type', models.CharField(choices=[('year_recommend', '年度五行推荐'), ('month_day_recommend', '月日数字推荐'), ('fengshui_recommend', '风水环境推荐'), ('click_based', '点击行为推荐'), ('ai_suggest', 'AI个性推荐')], max_length=20, verbose_name='推荐类型')),
+                ('fee', models.DecimalField(decimal_places=2, default=0.0, max_digits=10, verbose_name='服务费用')),
+                ('reason', models.TextField(blank=True, verbose_name='推荐理由')),
+                ('recommended_at', models.DateTimeField(auto_now_add=True, verbose_name='推荐时间')),
+                ('is_viewed', models.BooleanField(default=False, verbose_name='用户已查看')),
+                ('conversion_rate', models.FloatField(default=0.0, help_text='用户点击推荐商品的比例', verbose_name='转化率')),
+                ('jewelry_items', models.ManyToManyField(to='jewellery.jewelryitem', verbose_name='推荐珠宝')),
+            ],
+            options={
+                'verbose_name': '推荐记录',
+                'verbose_name_plural': '珠宝推荐管理',
+                'db_table': 'jewelry_recommend',
+                'ordering': ['-recommended_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jewellery', '0001_initial'),
+        ('ziwei', '0001_initial'),
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendation',
+            name='natal_chart',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='ziwei.natalchart', verbose_name='关联命盘'),
+        ),
+        migrations.AddField(
+            model_name='recommendation',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='user.user', verbose_name='所属用户'),
+        ),
+        migrations.AddField(
+            model_name='jewelryitem',
+            name='category',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='jewellery.jewelrycategory', verbose_name='所属分类'),
+        ),
+        migrations.AddField(
+            model_name='jewelrycategory',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='jewellery.jewelrycategory', verbose_name='父级分类'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['recommend_type'], name='jewelry_rec_recomme_e292dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recommendation',
+            index=models.Index(fields=['is_viewed'], name='jewelry_rec_is_view_4d4553_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jewelryitem',
+            index=models.Index(fields=['wuxing'], name='jewelry_ite_wuxing_7094e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jewelryitem',
+            index=models.Index(fields=['price_tier'], name='jewelry_ite_price_t_5cf7da_idx'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:31
+
+import django.contrib.auth.models
+import django.contrib.auth.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('jewellery', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, unique=True, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                ('first_name', models.CharField(blank=True, max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='email address')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('birth_datetime', models.DateTimeField(blank=True, null=True, verbose_name='出生时间')),
+                ('gender', models.CharField(blank=True, choices=[('male', '男'), ('female', '女')], max_length=10, null=True, verbose_name='性别')),
+                ('phone', models.CharField(blank=True, max_length=20, null=True, verbose_name='手机号')),
+                ('wechat_openid', models.CharField(blank=True, max_length=128, null=True, verbose_name='微信OpenID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='创建时间')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+                ('groups', models.ManyToManyField(blank=True, related_name='custom_user_set', to='auth.group', verbose_name='所属组')),
+                ('user_permissions', models.ManyToManyField(blank=True, related_name='custom_user_permissions_set', to='auth.permission', verbose_name='用户权限')),
+            ],
+            options={
+                'verbose_name': '用户信息',
+                'verbose_name_plural': '用户信息管理',
+                'db_table': 'user',
+            },
+            managers=[
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FengShuiSetting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tags', models.JSONField(default=list, help_text='用户设置的风水标签，如["东南", "土"]', verbose_name='风水标签')),
+                ('home_direction', models.CharField(blank=True, choices=[('north', '北'), ('south', '南'), ('east', '东'), ('west', '西')], max_length=10, verbose_name='房屋朝向')),
+                ('last_updated', models.DateTimeField(auto_now=True, verbose_name='最后更新时间')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='user.user', verbose_name='所属用户')),
+            ],
+            options={
+                'verbose_name': '风水设置',
+                'verbose_name_plural': '风水偏好管理',
+                'db_table': 'fengshui_setting',
+            },
+        ),
+        migrations.CreateModel(
+            name='ClickRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('click_time', models.DateTimeField(auto_now_add=True, verbose_name='点击时间')),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True, verbose_name='IP地址')),
+                ('jewelry', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='jewellery.jewelryitem', verbose_name='点击的珠宝')),
+                ('recommendation', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='jewellery.recommendation', verbose_name='关联推荐')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='user.clickrecord', verbose_name='用户')),
+            ],
+            options={
+                'verbose_name': '用户点击记录',
+                'verbose_name_plural': '用户点击记录管理',
+                'db_table': 'user_click_record',
+                'ordering': ['-click_time'],
+            },
+        ),
+    ]
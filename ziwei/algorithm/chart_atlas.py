@@ -0,0 +1,219 @@
+# ziwei/algorithm/chart_atlas.py
+"""
+命盘图谱：预先计算 1900-2100 年全部出生签名的命盘，按列存为二进制文件
+
+命盘只取决于(日期, 时辰地支, 性别)，共约 7.3万天 × 12时辰 × 2性别 ≈ 176万个命盘。
+离线用 build_atlas 多进程跑完整个定义域，线上用 ChartAtlas 以 mmap 方式只读打开，
+按签名直接算出记录下标，O(1) 查询，各进程共享操作系统页缓存，几乎不占进程内存。
+
+文件格式（小端）：
+    头部   : magic(8s) 版本(I) 起始日期序数(I) 天数(I) 保留(I)
+    各列依次排列，每列起点按8字节对齐，记录下标 = (天 * 12 + 时辰地支) * 2 + 性别(男0女1)
+    stars    int8    [N, 28]  StarSystem.ALL 顺序的星曜宫位
+    pillars  int8    [N, 4]   年、月、日、时柱的六十甲子序号
+    palaces  int8    [N, 2]   命宫、身宫索引
+    patterns uint64  [N]      格局位图，第 i 位对应 PATTERN_LIST[i]
+    wuxing   float32 [N, 5]   五行比例（按庙旺利陷加权，与 ChartRecord 的 wuxing_analysis 一致），顺序同 WUXING_ORDER
+版本 4 起 wuxing 列按加权后的五行比例生成；版本 2 的 wuxing 列为旧算法的比例，版本 3 没有该列，旧文件需重新生成。
+"""
+import datetime
+import mmap
+import os
+import struct
+import sys
+from multiprocessing import Pool
+from typing import Dict, Optional
+
+import numpy as np
+
+from chart_record import ChartRecord
+from ganzhi_converter import GanZhiConverter
+from sixty_pattern import PATTERN_LIST
+from star_system import WUXING_ORDER, StarSystem
+from utils import hour_branch
+from zhongzhou_calculator import ZhongZhouCalculator
+
+MAGIC = b"ZWATLAS\x00"
+VERSION = 4
+_HEADER = struct.Struct("<8sIIII")
+
+# 列定义：(列名, 数据类型, 每条记录的元素个数)
+COLUMNS = (
+    ("stars", np.int8, len(StarSystem.ALL)),
+    ("pillars", np.int8, 4),
+    ("palaces", np.int8, 2),
+    ("patterns", np.uint64, 1),
+    ("wuxing", np.float32, 5),
+)
+
+
+FIRST_DATE = datetime.date(1900, 1, 1)
+LAST_DATE = datetime.date(2100, 12, 31)
+
+# 每个日期对应 12 时辰 × 2 性别 条记录
+RECORDS_PER_DAY = 24
+
+
+def _column_layout(n_records: int):
+    """计算各列在文件中的(偏移, 数据类型, 形状)"""
+    layout = {}
+    offset = _HEADER.size
+    for name, dtype, width in COLUMNS:
+        offset = (offset + 7) // 8 * 8
+        shape = (n_records, width) if width > 1 else (n_records,)
+        layout[name] = (offset, dtype, shape)
+        offset += n_records * width * np.dtype(dtype).itemsize
+    return layout, offset
+
+
+def encode_record(record: ChartRecord) -> tuple:
+    """把命盘记录编码为各列的一行"""
+    ratio = record["wuxing_analysis"]["ratio"]
+    return (list(record.stars), [record.year, record.month, record.day, record.hour],
+            [record.life, record.body], record.patterns, [ratio[w] for w in WUXING_ORDER])
+
+
+# 工作进程内的计算器（每个进程一个，不需要缓存）
+_worker_calc = None
+
+
+def _init_worker():
+    global _worker_calc
+    _worker_calc = ZhongZhouCalculator(cache_size=0)
+
+
+def _build_days(task):
+    """工作进程：计算一段连续日期的全部命盘，返回各列数组"""
+    first_ordinal, n_days = task
+    n = n_days * RECORDS_PER_DAY
+    cols = {name: np.zeros((n, width) if width > 1 else (n,), dtype=dtype) for name, dtype, width in COLUMNS}
+    r = 0
+    for ordinal in range(first_ordinal, first_ordinal + n_days):
+        date = datetime.date.fromordinal(ordinal)
+        for branch in range(12):
+            for gender in ("male", "female"):
+                record = _worker_calc.calculate_record({
+                    "year": date.year, "month": date.month, "day": date.day,
+                    "hour": GanZhiConverter.DI_ZHI[branch], "gender": gender,
+                })
+                for (name, _, _), value in zip(COLUMNS, encode_record(record)):
+                    cols[name][r] = value
+                r += 1
+    return first_ordinal, cols
+
+
+def build_atlas(path: str, start: datetime.date = FIRST_DATE, end: datetime.date = LAST_DATE,
+                workers: Optional[int] = None, chunk_days: int = 64) -> int:
+    """
+    多进程计算 [start, end] 内全部出生签名的命盘并写入图谱文件
+
+    Args:
+        path: 输出文件路径
+        start: 起始日期
+        end: 结束日期（含）
+        workers: 进程数，默认使用全部 CPU
+        chunk_days: 每个任务计算的天数
+
+    Returns:
+        写入的命盘条数
+    """
+    first, n_days = start.toordinal(), end.toordinal() - start.toordinal() + 1
+    n_records = n_days * RECORDS_PER_DAY
+    layout, size = _column_layout(n_records)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, first, n_days, 0))
+        f.truncate(size)
+
+    out = {name: np.memmap(path, dtype=dtype, mode="r+", offset=offset, shape=shape)
+           for name, (offset, dtype, shape) in layout.items()}
+    tasks = [(o, min(chunk_days, first + n_days - o)) for o in range(first, first + n_days, chunk_days)]
+    with Pool(workers or os.cpu_count(), initializer=_init_worker) as pool:
+        for task_first, cols in pool.imap_unordered(_build_days, tasks):
+            lo = (task_first - first) * RECORDS_PER_DAY
+            for name, values in cols.items():
+                out[name][lo:lo + len(values)] = values
+    for column in out.values():
+        column.flush()
+    return n_records
+
+
+class ChartAtlas:
+    """命盘图谱只读访问（mmap）"""
+
+    def __init__(self, path: str):
+        self._mm = None
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.first_ordinal, self.n_days, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"不是有效的命盘图谱文件: {path}")
+        layout, size = _column_layout(self.n_days * RECORDS_PER_DAY)
+        if len(self._mm) < size:
+            self.close()
+            raise ValueError(f"命盘图谱文件不完整: {path}")
+        for name, (offset, dtype, shape) in layout.items():
+            count = int(np.prod(shape))
+            setattr(self, name, np.frombuffer(self._mm, dtype=dtype, count=count, offset=offset).reshape(shape))
+
+    def __len__(self) -> int:
+        return self.n_days * RECORDS_PER_DAY
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # 先释放指向 mmap 的数组视图，否则 mmap 无法关闭
+        for name, _, _ in COLUMNS:
+            self.__dict__.pop(name, None)
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def index(self, birth: Dict) -> int:
+        """
+        出生签名转记录下标
+
+        Raises:
+            KeyError: 出生日期不在图谱范围内
+        """
+        day = datetime.date(birth["year"], birth["month"], birth["day"]).toordinal() - self.first_ordinal
+        if not (0 <= day < self.n_days):
+            raise KeyError(f"出生日期不在命盘图谱范围内: {birth['year']}-{birth['month']}-{birth['day']}")
+        female = 0 if birth.get("gender", "male") == "male" else 1
+        return (day * 12 + hour_branch(birth["hour"])) * 2 + female
+
+    def birth(self, idx: int) -> Dict:
+        """记录下标还原为出生签名（index 的逆运算，时辰以地支表示）"""
+        day, female = divmod(idx, 2)
+        day, branch = divmod(day, 12)
+        date = datetime.date.fromordinal(self.first_ordinal + day)
+        return {"year": date.year, "month": date.month, "day": date.day,
+                "hour": GanZhiConverter.DI_ZHI[branch], "gender": "female" if female else "male"}
+
+    def lookup(self, birth: Dict) -> Dict:
+        """按出生信息查询命盘，返回格式与 ZhongZhouCalculator.calculate 相同"""
+        return self.decode(self.index(birth))
+
+    def decode(self, idx: int) -> Dict:
+        """把第 idx 条记录还原为命盘字典"""
+        return self.record(idx).to_dict()
+
+    def record(self, idx: int) -> ChartRecord:
+        """第 idx 条记录的 ChartRecord"""
+        return ChartRecord(self.stars[idx].tobytes(), *self.pillars[idx].tolist(),
+                           *self.palaces[idx].tolist(), int(self.patterns[idx]))
+
+
+if __name__ == "__main__":
+    # 用法: python chart_atlas.py 输出文件 [起始年 结束年]
+    out_path = sys.argv[1] if len(sys.argv) > 1 else "chart_atlas.bin"
+    first_year = int(sys.argv[2]) if len(sys.argv) > 2 else FIRST_DATE.year
+    last_year = int(sys.argv[3]) if len(sys.argv) > 3 else LAST_DATE.year
+    total = build_atlas(out_path, datetime.date(first_year, 1, 1), datetime.date(last_year, 12, 31))
+    print(f"已写入 {total} 个命盘到 {out_path}")
@@ -0,0 +1,173 @@
+# ziwei/algorithm/chart_index.py
+"""
+命盘反查索引
+
+在命盘图谱（ChartAtlas）之上建立倒排索引，回答“哪些出生签名满足某些条件”：
+    格局       -> 记录下标
+    命宫、身宫 -> 记录下标
+    星曜在某宫 -> 记录下标
+每个键对应一个升序的 int32 记录下标数组，同一类键的数组首尾相接存放（偏移 + 数据，CSR 格式）。
+多条件查询从最短的数组开始，逐个用二分查找求交集；图谱记录按日期排列，
+日期区间与性别条件直接换算成下标区间与奇偶过滤，不需要额外的索引。
+
+用法:
+    with ChartAtlas("chart_atlas.bin") as atlas:
+        index = ChartIndex(atlas)
+        ids = index.query(patterns=["紫府朝垣"], life="财帛",
+                          start=datetime.date(1980, 1, 1), end=datetime.date(2000, 12, 31))
+        births = [atlas.birth(i) for i in ids]
+"""
+import datetime
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from chart_atlas import RECORDS_PER_DAY
+from palace import PALACES
+from sixty_pattern import PATTERN_LIST
+from star_system import StarSystem
+
+_PATTERN_BITS = {p.value: bit for bit, p in enumerate(PATTERN_LIST)}
+_PALACE_INDEX = {p.value: i for i, p in enumerate(PALACES)}
+
+
+def _grouped(keys: np.ndarray, n_keys: int) -> Tuple[np.ndarray, np.ndarray]:
+    """按键分组的记录下标（CSR）：ids[offsets[k]:offsets[k + 1]] 为键 k 的升序下标"""
+    ids = np.argsort(keys, kind="stable").astype(np.int32)
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_keys), out=offsets[1:])
+    return offsets, ids
+
+
+def _intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """两个升序数组的交集：在较长的数组中二分查找较短数组的每个元素"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not len(a):
+        return a
+    pos = np.searchsorted(b, a)
+    pos[pos == len(b)] = 0
+    return a[b[pos] == a]
+
+
+class ChartIndex:
+    """
+    命盘图谱的倒排索引（只读）
+
+    Attributes:
+        n_records: 图谱记录数
+    """
+
+    def __init__(self, atlas):
+        """
+        Args:
+            atlas: 已打开的 ChartAtlas，索引建好后仍需用它把下标还原为出生签名或命盘
+        """
+        self.atlas = atlas
+        self.n_records = len(atlas)
+
+        # 格局：每个格局位一组下标
+        pattern_ids = [np.flatnonzero(atlas.patterns >> np.uint64(bit) & np.uint64(1)).astype(np.int32)
+                       for bit in range(len(PATTERN_LIST))]
+        self._pattern_offsets = np.zeros(len(pattern_ids) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in pattern_ids], out=self._pattern_offsets[1:])
+        self._pattern_ids = np.concatenate(pattern_ids)
+
+        # 命宫、身宫
+        self._life = _grouped(atlas.palaces[:, 0].astype(np.int64), 12)
+        self._body = _grouped(atlas.palaces[:, 1].astype(np.int64), 12)
+
+        # 星曜在某宫：键为 星曜下标 * 12 + 宫位
+        star_groups = [_grouped(atlas.stars[:, s].astype(np.int64), 12) for s in range(len(StarSystem.ALL))]
+        self._star_offsets = np.concatenate([[0]] + [offsets[1:] + s * self.n_records
+                                                     for s, (offsets, _) in enumerate(star_groups)])
+        self._star_ids = np.concatenate([ids for _, ids in star_groups])
+
+    def pattern_ids(self, pattern: str) -> np.ndarray:
+        """具有某格局的记录下标（升序）"""
+        try:
+            bit = _PATTERN_BITS[pattern]
+        except KeyError:
+            raise ValueError(f"未知的格局: {pattern}") from None
+        return self._pattern_ids[self._pattern_offsets[bit]:self._pattern_offsets[bit + 1]]
+
+    def life_ids(self, palace: Union[int, str]) -> np.ndarray:
+        """命宫为某宫位的记录下标（宫位可为 PALACES 下标或名称，同命盘的 life_palace）"""
+        offsets, ids = self._life
+        p = _palace(palace)
+        return ids[offsets[p]:offsets[p + 1]]
+
+    def body_ids(self, palace: Union[int, str]) -> np.ndarray:
+        """身宫为某宫位的记录下标"""
+        offsets, ids = self._body
+        p = _palace(palace)
+        return ids[offsets[p]:offsets[p + 1]]
+
+    def star_ids(self, star: str, position: int) -> np.ndarray:
+        """某星曜位于某宫位（同命盘 major_pos/aux_pos 中的数值）的记录下标"""
+        try:
+            key = StarSystem.STAR_INDEX[star] * 12 + position % 12
+        except KeyError:
+            raise ValueError(f"未知的星曜: {star}") from None
+        return self._star_ids[self._star_offsets[key]:self._star_offsets[key + 1]]
+
+    def query(self, patterns: Iterable[str] = (), life: Optional[Union[int, str]] = None,
+              body: Optional[Union[int, str]] = None, stars: Optional[Dict[str, int]] = None,
+              start: Optional[datetime.date] = None, end: Optional[datetime.date] = None,
+              gender: Optional[str] = None) -> np.ndarray:
+        """
+        多条件查询，各条件同时成立
+
+        Args:
+            patterns: 格局名称
+            life: 命宫（PALACES 下标或名称）
+            body: 身宫
+            stars: {星曜名称: 宫位}
+            start, end: 出生日期区间（含两端）
+            gender: "male" 或 "female"
+
+        Returns:
+            满足条件的记录下标（升序 int32 数组），可用 atlas.birth / atlas.record 还原
+        """
+        lists = [self.pattern_ids(p) for p in patterns]
+        if life is not None:
+            lists.append(self.life_ids(life))
+        if body is not None:
+            lists.append(self.body_ids(body))
+        lists += [self.star_ids(star, pos) for star, pos in (stars or {}).items()]
+
+        lo, hi = self._date_bounds(start, end)
+        if lists:
+            lists.sort(key=len)
+            # 日期区间先裁剪最短的数组，再逐个求交
+            first = lists[0]
+            result = first[np.searchsorted(first, lo):np.searchsorted(first, hi)]
+            for ids in lists[1:]:
+                result = _intersect(result, ids)
+        else:
+            result = np.arange(lo, hi, dtype=np.int32)
+
+        if gender is not None:
+            # 记录下标的最低位为性别（男0女1）
+            result = result[result % 2 == (0 if gender == "male" else 1)]
+        return result
+
+    def count(self, **conditions) -> int:
+        """满足条件的记录数，参数同 query"""
+        return len(self.query(**conditions))
+
+    def _date_bounds(self, start: Optional[datetime.date], end: Optional[datetime.date]) -> Tuple[int, int]:
+        """日期区间换算为记录下标区间 [lo, hi)"""
+        first = self.atlas.first_ordinal
+        lo = 0 if start is None else (start.toordinal() - first) * RECORDS_PER_DAY
+        hi = self.n_records if end is None else (end.toordinal() - first + 1) * RECORDS_PER_DAY
+        return min(max(lo, 0), self.n_records), min(max(hi, 0), self.n_records)
+
+
+def _palace(palace: Union[int, str]) -> int:
+    if isinstance(palace, str):
+        try:
+            return _PALACE_INDEX[palace]
+        except KeyError:
+            raise ValueError(f"未知的宫位: {palace}") from None
+    return palace % 12
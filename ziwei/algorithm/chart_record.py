@@ -0,0 +1,148 @@
+# ziwei/algorithm/chart_record.py
+"""
+紧凑命盘记录
+
+命盘内部只保存整数编码：28颗星曜的宫位（28字节）、四柱六十甲子序号、命宫/身宫索引、
+格局位图。对外仍可按 ZhongZhouCalculator.calculate 的字典格式访问，各字段在读取时才生成。
+"""
+import json
+from collections.abc import Mapping
+from typing import Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from ganzhi_converter import GanZhiConverter, NAYIN_NAMES, NAYIN_CODE
+from flying_transform import FlyingGraph, branch_stem, flying_graph
+from four_transform import FourTransform
+from luck_timeline import DEFAULT_SPAN, LuckTimeline, luck_timeline
+from palace import PALACES
+from sixty_pattern import PatternAnalyzer
+from star_system import StarSystem, wuxing_scores, wuxing_summary
+from utils import JIAZI, cycle_index
+
+_N_MAJOR = len(StarSystem.MAJOR)
+
+
+# 字典视图的字段及其生成方式，顺序与 calculate 的返回值一致
+_FIELDS = {
+    "year_ganzhi": lambda r: JIAZI[r.year],
+    "month_ganzhi": lambda r: JIAZI[r.month],
+    "day_ganzhi": lambda r: JIAZI[r.day],
+    "hour_ganzhi": lambda r: JIAZI[r.hour],
+    "wuxing_bureau": lambda r: GanZhiConverter.WUXING_BUREAU[NAYIN_NAMES[NAYIN_CODE[r.year]]],
+    "life_palace": lambda r: PALACES[r.life].value,
+    "body_palace": lambda r: PALACES[r.body].value,
+    "major_pos": lambda r: dict(zip(StarSystem.MAJOR, r.stars[:_N_MAJOR])),
+    "aux_pos": lambda r: dict(zip(StarSystem.AUX, r.stars[_N_MAJOR:])),
+    # 年干四化，自化取命宫宫干（五虎遁）
+    "four_trans": lambda r: FourTransform.calc_index(r.year % 10, branch_stem(r.year % 10, r.life)),
+    "patterns": lambda r: PatternAnalyzer.from_mask(r.patterns),
+    "wuxing_analysis": lambda r: wuxing_summary(wuxing_scores(np.frombuffer(r.stars, dtype=np.uint8)[None])[0]),
+}
+
+# 各字段所依赖的整数编码：编码相同的两张命盘该字段必然相同，比较时不必展开字典
+_FIELD_KEYS = {
+    "year_ganzhi": lambda r: r.year,
+    "month_ganzhi": lambda r: r.month,
+    "day_ganzhi": lambda r: r.day,
+    "hour_ganzhi": lambda r: r.hour,
+    "wuxing_bureau": lambda r: NAYIN_CODE[r.year],
+    "life_palace": lambda r: r.life,
+    "body_palace": lambda r: r.body,
+    "major_pos": lambda r: r.stars[:_N_MAJOR],
+    "aux_pos": lambda r: r.stars[_N_MAJOR:],
+    "four_trans": lambda r: (r.year % 10, branch_stem(r.year % 10, r.life)),
+    "patterns": lambda r: r.patterns,
+    "wuxing_analysis": lambda r: r.stars,
+}
+
+
+def varying_fields(records: Sequence["ChartRecord"]) -> Tuple[str, ...]:
+    """
+    一组命盘中取值不全相同的字段（按字典字段顺序）
+
+    Args:
+        records: ChartRecord 序列
+
+    Returns:
+        字段名元组，字段名同 ZhongZhouCalculator.calculate 的返回值
+    """
+    return tuple(key for key, code in _FIELD_KEYS.items() if len({code(r) for r in records}) > 1)
+
+
+class ChartRecord(Mapping):
+    """
+    不可变的紧凑命盘
+
+    Attributes:
+        stars: 按 StarSystem.ALL 顺序的星曜宫位（bytes，28字节）
+        year/month/day/hour: 四柱的六十甲子序号
+        life/body: 命宫、身宫索引
+        patterns: 格局位图，第 i 位对应 sixty_pattern.PATTERN_LIST[i]
+    """
+    __slots__ = ("stars", "year", "month", "day", "hour", "life", "body", "patterns")
+
+    def __init__(self, stars: Sequence[int], year: int, month: int, day: int, hour: int,
+                 life: int, body: int, patterns: int):
+        setter = object.__setattr__
+        setter(self, "stars", bytes(stars))
+        setter(self, "year", year)
+        setter(self, "month", month)
+        setter(self, "day", day)
+        setter(self, "hour", hour)
+        setter(self, "life", life)
+        setter(self, "body", body)
+        setter(self, "patterns", patterns)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ChartRecord 不可修改")
+
+    def __reduce__(self):
+        return ChartRecord, (self.stars, self.year, self.month, self.day, self.hour,
+                             self.life, self.body, self.patterns)
+
+    def __repr__(self):
+        return (f"ChartRecord({JIAZI[self.year]}{JIAZI[self.month]}{JIAZI[self.day]}{JIAZI[self.hour]}, "
+                f"命宫={PALACES[self.life].value}, 身宫={PALACES[self.body].value})")
+
+    # Mapping 接口：按 calculate 的字典格式惰性取值
+    def __getitem__(self, key: str):
+        try:
+            build = _FIELDS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return build(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+    def flying_graph(self) -> FlyingGraph:
+        """十二宫宫干与飞化图"""
+        return flying_graph(self.year % 10, self.life, self.stars[:_N_MAJOR])
+
+    def luck_timeline(self, birth_year: int, span: int = DEFAULT_SPAN) -> LuckTimeline:
+        """
+        大限、流年序列
+
+        Args:
+            birth_year: 出生的干支纪年年份（以立春为界），须与年柱一致
+            span: 推算的年数
+
+        Raises:
+            ValueError: 年份与年柱不符
+        """
+        if cycle_index(*GanZhiConverter.year_index(birth_year)) != self.year:
+            raise ValueError(f"{birth_year}年与年柱{JIAZI[self.year]}不符")
+        return luck_timeline(birth_year, self.life, self.stars[:_N_MAJOR], span)
+
+    def to_dict(self) -> Dict:
+        """生成与 ZhongZhouCalculator.calculate 相同格式的命盘字典（每次返回新对象）"""
+        return {key: build(self) for key, build in _FIELDS.items()}
+
+    def to_json(self, **kwargs) -> str:
+        """命盘字典的 JSON 文本"""
+        kwargs.setdefault("ensure_ascii", False)
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,215 @@
+# ziwei/algorithm/compatibility.py
+"""
+合盘匹配
+
+把命盘编码为定长向量（星曜宫位、命宫、年干四化所在宫位掩码、五行比例），
+成对评分全部用数组广播完成：
+  1. 五行互补：两盘五行比例平均后越均衡越好；
+  2. 四化互入：对方化禄入己方命宫或夫妻宫加分，化忌入之减分（双向各计一次）；
+  3. 命宫地支：三合、六合加分，六冲减分。
+一对多、全体两两匹配都按块计算（块内是 块大小×块大小 的评分矩阵），
+每位用户只用一个 k 项小根堆保留最优匹配，内存占用与总人数无关。
+"""
+import heapq
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from luck_timeline import TRANSFORM_STARS
+from star_system import wuxing_scores
+
+# 各项评分的权重
+WUXING_WEIGHT = 1.0
+LU_WEIGHT = 0.5  # 每次化禄互入
+JI_WEIGHT = 0.5  # 每次化忌互入
+HARMONY_WEIGHT = 0.3  # 命宫三合、六合
+CLASH_WEIGHT = 0.3  # 命宫六冲
+
+# 默认分块大小（块内评分矩阵为 block × block）
+DEFAULT_BLOCK = 2048
+
+
+class ChartVectors(NamedTuple):
+    """
+    一组命盘的定长编码（只读）
+
+    Attributes:
+        stars: N×28 星曜宫位（StarSystem.ALL 顺序）
+        life: 命宫地支
+        targets: 命宫与夫妻宫的地支掩码（12位）
+        trans: N×4 年干禄权科忌星所在宫位的地支掩码（12位）
+        wuxing: N×5 五行比例（WUXING_ORDER 顺序）
+    """
+    stars: np.ndarray
+    life: np.ndarray
+    targets: np.ndarray
+    trans: np.ndarray
+    wuxing: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.life)
+
+    def take(self, rows) -> "ChartVectors":
+        """按下标或切片取部分命盘"""
+        return ChartVectors(*(a[rows] for a in self))
+
+
+def encode_arrays(stars, life, year_stem) -> ChartVectors:
+    """
+    由整数编码的数组编码命盘（可直接使用 ChartAtlas 的列）
+
+    Args:
+        stars: N×28 星曜宫位矩阵
+        life: 长度为 N 的命宫地支
+        year_stem: 长度为 N 的年干索引
+    """
+    stars = np.asarray(stars, dtype=np.int64)
+    life = np.asarray(life, dtype=np.int64)
+    trans_pos = np.take_along_axis(stars, TRANSFORM_STARS[np.asarray(year_stem, dtype=np.int64)].astype(np.int64),
+                                   axis=1)
+    scores = wuxing_scores(stars)
+    return ChartVectors(
+        stars=stars.astype(np.uint8),
+        life=life.astype(np.int8),
+        # 夫妻宫在命宫逆数第三宫（宫位角色自命宫起逆行排列）
+        targets=((1 << life) | (1 << (life - 2) % 12)).astype(np.uint16),
+        trans=(1 << trans_pos).astype(np.uint16),
+        wuxing=(scores / scores.sum(axis=1, keepdims=True)).astype(np.float32),
+    )
+
+
+def encode(records: Sequence) -> ChartVectors:
+    """把一组 ChartRecord 编码为定长向量"""
+    n = len(records)
+    stars = np.frombuffer(b"".join(r.stars for r in records), dtype=np.uint8).reshape(n, -1)
+    return encode_arrays(stars, [r.life for r in records], [r.year % 10 for r in records])
+
+
+def pair_scores(a: ChartVectors, b: ChartVectors) -> np.ndarray:
+    """
+    两组命盘两两之间的合盘评分
+
+    Returns:
+        len(a)×len(b) 评分矩阵（对称：pair_scores(a, b) == pair_scores(b, a).T）
+    """
+    # 五行互补：平均比例与完全均衡（各 0.2）的 L1 距离，最大为 1.6
+    combined = (a.wuxing[:, None, :] + b.wuxing[None, :, :]) * 0.5
+    balance = 1.0 - np.abs(combined - 0.2).sum(axis=2) / 1.6
+    scores = WUXING_WEIGHT * balance
+
+    # 四化互入：禄为 trans[:, 0]，忌为 trans[:, 3]
+    a_targets, b_targets = a.targets[:, None], b.targets[None, :]
+    lu = ((b.trans[None, :, 0] & a_targets) != 0).astype(np.int8) + ((a.trans[:, None, 0] & b_targets) != 0)
+    ji = ((b.trans[None, :, 3] & a_targets) != 0).astype(np.int8) + ((a.trans[:, None, 3] & b_targets) != 0)
+    scores += LU_WEIGHT * lu - JI_WEIGHT * ji
+
+    # 命宫地支：三合（相差4、8）、六合（地支和为1，子丑合、寅亥合……）、六冲（相差6）
+    la, lb = a.life.astype(np.int64)[:, None], b.life.astype(np.int64)[None, :]
+    diff = (la - lb) % 12
+    harmony = (diff == 4) | (diff == 8) | ((la + lb) % 12 == 1)
+    scores += HARMONY_WEIGHT * harmony - CLASH_WEIGHT * (diff == 6)
+    return scores
+
+
+def _push_block(heaps: Sequence[List[Tuple[float, int]]], k: int, scores: np.ndarray, ids: np.ndarray):
+    """
+    把一块评分放入各行的 k 项小根堆（堆顶为当前第 k 名），同分时下标小者优先
+
+    Args:
+        heaps: 与 scores 各行对应的堆
+        scores: 评分矩阵，-inf 表示不参与
+        ids: 各列的候选下标
+    """
+    if k <= 0:
+        return
+    if scores.shape[1] > k:
+        # 每行只取不低于第 k 名的列（含并列），其余不可能进入前 k
+        kth = -np.partition(-scores, k - 1, axis=1)[:, k - 1]
+        rows, cols = np.nonzero(scores >= kth[:, None])
+    else:
+        rows, cols = np.nonzero(np.isfinite(scores))
+    for r, c, score in zip(rows.tolist(), cols.tolist(), scores[rows, cols].tolist()):
+        if score == -np.inf:
+            continue
+        heap, item = heaps[r], (score, -int(ids[c]))
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+
+def _sorted(heap: List[Tuple[float, int]]) -> List[Tuple[int, float]]:
+    return [(-neg_idx, score) for score, neg_idx in sorted(heap, reverse=True)]
+
+
+class CompatibilityEngine:
+    """对一批候选命盘做合盘匹配"""
+
+    def __init__(self, candidates: ChartVectors, block: int = DEFAULT_BLOCK):
+        """
+        Args:
+            candidates: 候选命盘（encode / encode_arrays 的结果）
+            block: 分块大小
+        """
+        self.candidates = candidates
+        self.block = block
+
+    def top_matches(self, query: ChartVectors, k: int = 10, exclude: int = -1) -> List[Tuple[int, float]]:
+        """
+        一对多：与单个命盘最匹配的 k 个候选
+
+        Args:
+            query: 只含一张命盘的 ChartVectors（如 candidates.take(slice(i, i + 1))）
+            k: 返回的个数
+            exclude: 要排除的候选下标（查询命盘本身在候选中时）
+
+        Returns:
+            [(候选下标, 评分), ...]，按评分从高到低；k <= 0 时为空
+
+        Raises:
+            ValueError: query 不是恰好一张命盘
+        """
+        if len(query) != 1:
+            raise ValueError(f"query 应只含一张命盘，实际为 {len(query)} 张")
+        if k <= 0:
+            return []
+        heap: List[Tuple[float, int]] = []
+        n = len(self.candidates)
+        for lo in range(0, n, self.block):
+            hi = min(lo + self.block, n)
+            scores = pair_scores(query, self.candidates.take(slice(lo, hi)))
+            if lo <= exclude < hi:
+                scores[0, exclude - lo] = -np.inf
+            _push_block([heap], k, scores, np.arange(lo, hi))
+        return _sorted(heap)
+
+    def all_top_matches(self, k: int = 10) -> List[List[Tuple[int, float]]]:
+        """
+        全体两两匹配：每个候选与其余候选中最匹配的 k 个
+
+        按 block×block 分块计算评分矩阵；评分对称，只算上三角的块，每块同时更新两侧的堆。
+
+        Returns:
+            第 i 项为候选 i 的 [(候选下标, 评分), ...]，按评分从高到低
+        """
+        n = len(self.candidates)
+        heaps: List[List[Tuple[float, int]]] = [[] for _ in range(n)]
+        if k <= 0:
+            return heaps
+        starts = range(0, n, self.block)
+        for i_lo in starts:
+            i_hi = min(i_lo + self.block, n)
+            rows = self.candidates.take(slice(i_lo, i_hi))
+            for j_lo in starts:
+                if j_lo < i_lo:
+                    continue
+                j_hi = min(j_lo + self.block, n)
+                scores = pair_scores(rows, self.candidates.take(slice(j_lo, j_hi)))
+                if i_lo == j_lo:
+                    # 对角块：排除自身配对，块本身对称，只更新行一侧
+                    np.fill_diagonal(scores, -np.inf)
+                    _push_block(heaps[i_lo:i_hi], k, scores, np.arange(j_lo, j_hi))
+                else:
+                    _push_block(heaps[i_lo:i_hi], k, scores, np.arange(j_lo, j_hi))
+                    _push_block(heaps[j_lo:j_hi], k, scores.T, np.arange(i_lo, i_hi))
+        return [_sorted(heap) for heap in heaps]
@@ -0,0 +1,147 @@
+# ziwei/algorithm/flying_transform.py
+"""
+十二宫宫干与飞化图
+
+宫干按五虎遁由年干定出（寅宫起，子、丑两宫接续寅、卯的天干），十二宫各以宫干
+飞出禄、权、科、忌四化，落入四化星所在的宫位，构成 12 宫 × 4 化 → 目标宫 的有向图。
+
+参与四化的星曜是十四主星与昌曲辅弼，它们的位置只取决于主星布局（24种）与年干，
+宫位的角色（命宫、兄弟……）再由命宫地支决定，因此飞化图只有
+(年干, 主星布局, 命宫地支) 共 10 × 24 × 12 = 2880 张，导入时用数组运算一次性全部生成。
+图以位掩码存储：into[化][目标宫] 为飞入该宫的来源宫位集合（第 k 位为 PALACES[k]），
+查询“哪些宫飞忌入命宫”只是一次取下标。
+"""
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from four_transform import FourTransform, YEAR_BY_STEM
+from major_layout import LAYOUTS, layout_of
+from palace import PALACES, Palace
+from star_system import AUX_TABLE, StarSystem, aux_index, layout_index
+from utils import TIAN_GAN
+
+N_PALACES = len(PALACES)
+KINDS = FourTransform.KINDS
+KIND_INDEX = {k: i for i, k in enumerate(KINDS)}
+
+
+def branch_stem(year_stem: int, branch: int) -> int:
+    """
+    五虎遁：某地支宫位的宫干索引
+
+    Args:
+        year_stem: 年干索引（甲=0）
+        branch: 宫位地支索引（子=0）
+    """
+    # 甲己之年丙作首（寅宫起丙），子、丑两宫接在亥宫之后
+    return ((year_stem % 5) * 2 + 2 + (branch - 2) % 12) % 10
+
+
+def palace_branch(life: int, palace: int) -> int:
+    """第 palace 宫（PALACES 下标，命宫为0）所在的地支：自命宫起逆行排列"""
+    return (life - palace) % 12
+
+
+def palace_stems(year_stem: int, life: int) -> Tuple[int, ...]:
+    """按 PALACES 顺序排列的十二宫宫干索引"""
+    return tuple(branch_stem(year_stem, palace_branch(life, p)) for p in range(N_PALACES))
+
+
+class FlyingGraph(NamedTuple):
+    """
+    一张命盘的飞化图（只读）
+
+    Attributes:
+        year_stem: 年干索引
+        life: 命宫地支索引
+        stems: 按 PALACES 顺序的宫干索引
+        targets: targets[宫 * 4 + 化] 为该宫飞出该化所落入的宫（PALACES 下标）
+        into: into[化 * 12 + 宫] 为飞该化入该宫的来源宫位掩码
+    """
+    year_stem: int
+    life: int
+    stems: Tuple[int, ...]
+    targets: Tuple[int, ...]
+    into: Tuple[int, ...]
+
+    def target(self, source: int, kind: str) -> int:
+        """source 宫飞出 kind 化所落入的宫"""
+        return self.targets[source * 4 + KIND_INDEX[kind]]
+
+    def sources_mask(self, kind: str, target: int) -> int:
+        """飞 kind 化入 target 宫的来源宫位掩码"""
+        return self.into[KIND_INDEX[kind] * N_PALACES + target]
+
+    def sources(self, kind: str, target: int = 0) -> List[Palace]:
+        """飞 kind 化入 target 宫（默认命宫）的来源宫位"""
+        mask = self.sources_mask(kind, target)
+        return [PALACES[p] for p in range(N_PALACES) if mask >> p & 1]
+
+    def self_mask(self, kind: str) -> int:
+        """自化（飞出后落回本宫）的宫位掩码"""
+        k = KIND_INDEX[kind]
+        return sum(1 << p for p in range(N_PALACES) if self.targets[p * 4 + k] == p)
+
+    def to_dict(self) -> dict:
+        """按宫位名称展开：{宫名: {"宫干": 干, "禄": 目标宫名, ...}}"""
+        return {
+            PALACES[p].value: dict(
+                [("宫干", TIAN_GAN[self.stems[p]])]
+                + [(kind, PALACES[self.targets[p * 4 + k]].value) for k, kind in enumerate(KINDS)]
+            )
+            for p in range(N_PALACES)
+        }
+
+
+def _build_graphs() -> Tuple[FlyingGraph, ...]:
+    """全部飞化图，下标为 (年干 * 24 + 主星布局) * 12 + 命宫地支"""
+    year_stems = np.arange(10)
+    lives = np.arange(N_PALACES)
+    palaces = np.arange(N_PALACES)
+    # 星曜位置 [年干, 布局, 星曜]：主星取布局，四化中的辅星（昌曲辅弼）只取决于年干，取任一月、时的辅星表行
+    major = np.array([layout.positions for layout in LAYOUTS], dtype=np.int64)
+    aux = AUX_TABLE[[aux_index(s, 0, 0) for s in year_stems]].astype(np.int64)
+    stars = np.concatenate([np.broadcast_to(major, (10,) + major.shape),
+                            np.broadcast_to(aux[:, None, :], (10, len(LAYOUTS), aux.shape[1]))], axis=2)
+    # 宫干 [年干, 命宫, 宫]，五虎遁同 branch_stem
+    branches = (lives[:, None] - palaces[None, :]) % 12
+    stems = ((year_stems[:, None, None] % 5) * 2 + 2 + (branches[None] - 2) % 12) % 10
+    # 宫干四化星 [年干, 命宫, 宫, 化] -> 所在地支 [年干, 布局, 命宫, 宫, 化] -> 宫位
+    trans = np.array([[StarSystem.STAR_INDEX[star] for star in YEAR_BY_STEM[stem]] for stem in range(10)])
+    star_idx = trans[stems]
+    pos = stars[year_stems[:, None, None, None, None], np.arange(len(LAYOUTS))[None, :, None, None, None],
+                star_idx[:, None]]
+    targets = (lives[None, None, :, None, None] - pos) % 12
+    # into[..., 化, 目标宫] 为来源宫位的掩码
+    hit = targets[..., None] == palaces
+    into = (hit.astype(np.int32) << palaces[:, None, None].astype(np.int32)).sum(axis=3)
+
+    stems_list = stems.tolist()
+    targets_list = targets.reshape(10, len(LAYOUTS), N_PALACES, -1).tolist()
+    into_list = into.reshape(10, len(LAYOUTS), N_PALACES, -1).tolist()
+    return tuple(
+        FlyingGraph(s, life, tuple(stems_list[s][life]), tuple(targets_list[s][layout][life]),
+                    tuple(into_list[s][layout][life]))
+        for s in range(10) for layout in range(len(LAYOUTS)) for life in range(N_PALACES)
+    )
+
+
+_GRAPHS = _build_graphs()
+
+
+def _graph(year_stem: int, layout_idx: int, life: int) -> FlyingGraph:
+    return _GRAPHS[(year_stem * len(LAYOUTS) + layout_idx) * N_PALACES + life]
+
+
+def flying_graph(year_stem: int, life: int, major: Sequence[int]) -> FlyingGraph:
+    """
+    取一张命盘的飞化图（查预先生成的表）
+
+    Args:
+        year_stem: 年干索引（甲=0）
+        life: 命宫地支索引
+        major: 十四主星宫位（StarSystem.MAJOR 顺序）
+    """
+    layout = layout_of(major)
+    return _graph(year_stem, layout_index(layout.zi_pos, layout.direction), life)
@@ -1,5 +1,7 @@
 from typing import Dict, List, Tuple
 
+from utils import TIAN_GAN, parse_stem
+
 
 class FourTransform:
     # 年干四化表，可考虑存入数据库
@@ -30,6 +32,32 @@ class FourTransform:
         "癸": ("破军", "贪狼")
     }
 
+    # 四化类型（按禄权科忌顺序）
+    KINDS = ("禄", "权", "科", "忌")
+
+    @staticmethod
+    def calc_index(year_stem: int, palace_stem: int) -> dict:
+        """
+        计算四化星（整数编码输入）
+
+        Args:
+            year_stem: 年干索引（甲=0）
+            palace_stem: 宫干索引（甲=0）
+
+        Returns:
+            包含四化星信息的字典，键为四化类型，值为对应的星曜
+        """
+        res = {}
+        # 年干四化
+        for t, star in zip(FourTransform.KINDS, YEAR_BY_STEM[year_stem]):
+            res[f"年干{t}"] = star
+
+        # 宫干自化 - 修正为处理两种自化
+        lu, ji = PALACE_BY_STEM[palace_stem]
+        res["自化禄"] = lu
+        res["自化忌"] = ji
+        return res
+
     @staticmethod
     def calc(year_gz: str, palace_gan: str) -> dict:
         """
@@ -49,23 +77,7 @@ class FourTransform:
         if palace_gan not in FourTransform.PALACE:
             raise ValueError(f"无效的宫位天干: {palace_gan}")
 
-        res = {}
-        year_gan = year_gz[0]
-
-        # 年干四化
-        if year_gan in FourTransform.YEAR:
-            for t, star in zip(["禄", "权", "科", "忌"], FourTransform.YEAR[year_gan]):
-                res[f"年干{t}"] = star
-
-        # 宫干自化 - 修正为处理两种自化
-        if palace_gan in FourTransform.PALACE:
-            stars = FourTransform.PALACE[palace_gan]
-            if len(stars) >= 1:
-                res["自化禄"] = stars[0]
-            if len(stars) >= 2:
-                res["自化忌"] = stars[1]
-
-        return res
+        return FourTransform.calc_index(parse_stem(year_gz[0]), parse_stem(palace_gan))
 
     @staticmethod
     def get_valid_year_gans() -> List[str]:
@@ -76,3 +88,8 @@ class FourTransform:
     def get_valid_palace_gans() -> List[str]:
         """获取所有有效的宫干"""
         return list(FourTransform.PALACE.keys())
+
+
+# 按天干索引排列的四化表
+YEAR_BY_STEM = tuple(FourTransform.YEAR[g] for g in TIAN_GAN)
+PALACE_BY_STEM = tuple(FourTransform.PALACE[g] for g in TIAN_GAN)
@@ -1,9 +1,14 @@
 import datetime
-from typing import Tuple
+from typing import Dict, Tuple
+
+import numpy as np
+
+import jieqi_table
+from utils import TIAN_GAN, DI_ZHI, JIAZI, cycle_index, parse_stem, parse_branch
 
 class GanZhiConverter:
-    TIAN_GAN = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
-    DI_ZHI = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+    TIAN_GAN = TIAN_GAN
+    DI_ZHI = DI_ZHI
 
     # 完整纳音五行表
     NAYIN = {
@@ -36,43 +41,144 @@ class GanZhiConverter:
         "石榴木": "木三局", "大海水": "水二局"
     }
 
+    # 五行局数字（按纳音五行）
+    BUREAU_NUMBER = {"水": 2, "木": 3, "金": 4, "土": 5, "火": 6}
+
+    # 日干支基准：1899-12-22 为甲子日
+    DAY_BASE_ORDINAL = datetime.date(1899, 12, 22).toordinal()
+
+    @staticmethod
+    def year_index(year: int) -> Tuple[int, int]:
+        """年干支索引，返回(天干索引, 地支索引)，1900年为庚子"""
+        offset = year - 1900
+        return (offset + 6) % 10, offset % 12
+
+    @staticmethod
+    def month_index(year_stem: int, month: int) -> Tuple[int, int]:
+        """月干支索引（五虎遁），month 为节气月序（寅月为1）"""
+        # 甲己之年丙作首，乙庚之岁戊为头……
+        return ((year_stem % 5) * 2 + 1 + month) % 10, (month + 1) % 12
+
+    @staticmethod
+    def year_month_index(dt: datetime.datetime) -> Tuple[int, int, int, int]:
+        """
+        按节气计算年柱、月柱索引（年以立春为界，月以节为界）
+
+        Args:
+            dt: 出生时刻（北京时间）
+
+        Returns:
+            (年干, 年支, 月干, 月支) 索引元组
+        """
+        year, month = jieqi_table.solar_month(dt)
+        y_stem, y_branch = GanZhiConverter.year_index(year)
+        m_stem, m_branch = GanZhiConverter.month_index(y_stem, month)
+        return y_stem, y_branch, m_stem, m_branch
+
+    @staticmethod
+    def get_year_month_ganzhi(dt: datetime.datetime) -> Tuple[str, str]:
+        """按节气计算(年干支, 月干支)"""
+        y_stem, y_branch, m_stem, m_branch = GanZhiConverter.year_month_index(dt)
+        return TIAN_GAN[y_stem] + DI_ZHI[y_branch], TIAN_GAN[m_stem] + DI_ZHI[m_branch]
+
+    @staticmethod
+    def day_index(ordinal: int) -> Tuple[int, int]:
+        """日干支索引，ordinal 为公历日期序数（date.toordinal()）"""
+        diff = ordinal - GanZhiConverter.DAY_BASE_ORDINAL
+        return diff % 10, diff % 12
+
+    @staticmethod
+    def hour_index(day_stem: int, hour_branch: int) -> Tuple[int, int]:
+        """时干支索引（五鼠遁法），返回(时干索引, 时支索引)"""
+        # 甲己还加甲，乙庚丙作初，丙辛从戊起，丁壬庚子居，戊癸何方发，壬子是真途
+        return ((day_stem % 5) * 2 + hour_branch) % 10, hour_branch
+
     @staticmethod
     def get_year_ganzhi(year: int) -> Tuple[str, str]:
         """计算年干支，返回(天干地支, 五行局)"""
-        base_year = 1900
-        offset = year - base_year
-        tg = GanZhiConverter.TIAN_GAN[(offset % 10 + 6) % 10]
-        dz = GanZhiConverter.DI_ZHI[(offset % 12 + 0) % 12]
-        gz = tg + dz
-        nayin = GanZhiConverter.NAYIN.get(gz, "土")
-        bureau = GanZhiConverter.WUXING_BUREAU.get(nayin, "土五局")
-        return gz, bureau
+        tg, dz = GanZhiConverter.year_index(year)
+        cycle = cycle_index(tg, dz)
+        return JIAZI[cycle], GanZhiConverter.WUXING_BUREAU[NAYIN_NAMES[NAYIN_CODE[cycle]]]
 
     @staticmethod
     def get_month_ganzhi(year_gz: str, month: int) -> str:
-        """计算月干支（以立春后为新正月）"""
-        tg_idx = GanZhiConverter.TIAN_GAN.index(year_gz[0])
-        # 正月干支 = 当年天干 + 2（丙）再顺推(month-1)
-        idx = (tg_idx + 2 + month - 1) % 10
-        dz_idx = (month + 1) % 12  # 正月对应寅（索引2）
-        return GanZhiConverter.TIAN_GAN[idx] + GanZhiConverter.DI_ZHI[dz_idx]
+        """计算月干支，month 为节气月序（寅月为1）；按出生时刻计算请用 get_year_month_ganzhi"""
+        tg, dz = GanZhiConverter.month_index(parse_stem(year_gz[0]), month)
+        return TIAN_GAN[tg] + DI_ZHI[dz]
 
     @staticmethod
     def get_day_ganzhi(date: datetime.date) -> str:
         """计算日干支（以1899-12-22为甲子日基准）"""
-        base = datetime.date(1899, 12, 22)
-        diff = (date - base).days
-        tg = GanZhiConverter.TIAN_GAN[diff % 10]
-        dz = GanZhiConverter.DI_ZHI[diff % 12]
-        return tg + dz
+        tg, dz = GanZhiConverter.day_index(date.toordinal())
+        return TIAN_GAN[tg] + DI_ZHI[dz]
 
     @staticmethod
     def get_hour_ganzhi(day_gz: str, hour_zhi: str) -> str:
         """计算时干支（五鼠遁法）"""
-        HOUR_DZ = GanZhiConverter.DI_ZHI
-        hz_idx = HOUR_DZ.index(hour_zhi)
-        TG_BASE = {"甲": 1, "乙": 1, "丙": 3, "丁": 3, "戊": 5,
-                   "己": 5, "庚": 7, "辛": 7, "壬": 9, "癸": 9}
-        base = TG_BASE.get(day_gz[0], 1)
-        tg = GanZhiConverter.TIAN_GAN[(base + hz_idx) % 10]
-        return tg + hour_zhi
+        tg, _ = GanZhiConverter.hour_index(parse_stem(day_gz[0]), parse_branch(hour_zhi))
+        return TIAN_GAN[tg] + hour_zhi
+
+    @staticmethod
+    def batch_ganzhi(years, months, ordinals, hours) -> Dict[str, np.ndarray]:
+        """
+        批量计算四柱干支索引（向量化）
+
+        Args:
+            years: 干支纪年所属年份数组（以立春为界）
+            months: 节气月序数组（寅月为1，可由 jieqi_table.solar_month_batch 得到）
+            ordinals: 公历日期序数数组（date.toordinal()）
+            hours: 24小时制小时数组（0-23）
+
+        Returns:
+            字典，值均为 int8 数组：
+            year_stem/year_branch、month_stem/month_branch、day_stem/day_branch、
+            hour_stem/hour_branch 为天干(0-9)/地支(0-11)索引，
+            nayin 为年柱纳音序号（0-29，见 NAYIN_NAMES），bureau 为五行局数字（2-6）
+        """
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        hours = np.asarray(hours, dtype=np.int64)
+
+        offset = years - 1900
+        year_stem = (offset + 6) % 10
+        year_branch = offset % 12
+        month_stem = ((year_stem % 5) * 2 + 1 + months) % 10
+        month_branch = (months + 1) % 12
+        diff = ordinals - GanZhiConverter.DAY_BASE_ORDINAL
+        day_stem = diff % 10
+        day_branch = diff % 12
+        hour_branch = ((hours + 1) % 24) // 2
+        hour_stem = ((day_stem % 5) * 2 + hour_branch) % 10
+        nayin = _NAYIN_CODE_ARR[(6 * year_stem - 5 * year_branch) % 60]
+
+        return {
+            "year_stem": year_stem.astype(np.int8),
+            "year_branch": year_branch.astype(np.int8),
+            "month_stem": month_stem.astype(np.int8),
+            "month_branch": month_branch.astype(np.int8),
+            "day_stem": day_stem.astype(np.int8),
+            "day_branch": day_branch.astype(np.int8),
+            "hour_stem": hour_stem.astype(np.int8),
+            "hour_branch": hour_branch.astype(np.int8),
+            "nayin": nayin,
+            "bureau": _BUREAU_ARR[nayin],
+        }
+
+
+def _build_nayin_tables():
+    """按六十甲子顺序展开纳音表：纳音名称列表、每个甲子对应的纳音序号、每个纳音的局数"""
+    names, codes = [], []
+    for gz in JIAZI:
+        nayin = GanZhiConverter.NAYIN[gz]
+        if nayin not in names:
+            names.append(nayin)
+        codes.append(names.index(nayin))
+    bureaus = [GanZhiConverter.BUREAU_NUMBER[GanZhiConverter.WUXING_BUREAU[n][0]] for n in names]
+    return tuple(names), tuple(codes), tuple(bureaus)
+
+
+# 纳音名称（按序号）、六十甲子 -> 纳音序号、纳音序号 -> 五行局数字
+NAYIN_NAMES, NAYIN_CODE, BUREAU_NUMBERS = _build_nayin_tables()
+_NAYIN_CODE_ARR = np.array(NAYIN_CODE, dtype=np.int8)
+_BUREAU_ARR = np.array(BUREAU_NUMBERS, dtype=np.int8)
@@ -0,0 +1,94 @@
+# ziwei/algorithm/gen_jieqi_table.py
+"""
+二十四节气时刻表生成脚本（离线运行，依赖 lunarcalendar/ephem）
+
+按公历年依次计算 小寒、大寒、立春……冬至 共24个节气的交节时刻（北京时间），
+以“距 1900-01-01 00:00 的分钟数”写入 jieqi_data.py，供 jieqi_table 查表使用。
+
+交节时刻取自 lunarcalendar 的内部函数 lunarcalendar._calc.specified_solar_term（基于 ephem，
+精确到分钟）。这不是公开接口，因此锁定版本 LUNARCALENDAR_VERSION，版本不符时拒绝运行；
+生成结果还会与 jieqi_table.calc_year_terms（Meeus 公式，误差约一刻钟）逐项比对，
+相差超过 MAX_DEVIATION 分钟即报错，防止接口语义变化后静默写出错误的表。
+jieqi_table 中的 Meeus 公式精度不足以直接生成本表，只用作校验。
+
+用法:
+    pip install LunarCalendar==0.0.9 ephem
+    python gen_jieqi_table.py [输出文件路径]
+"""
+import datetime
+import os
+import sys
+from typing import List
+
+import lunarcalendar
+from lunarcalendar._calc import specified_solar_term
+
+from jieqi_table import calc_year_terms
+
+# 生成 jieqi_data.py 时使用的 lunarcalendar 版本
+LUNARCALENDAR_VERSION = "0.0.9"
+# 与 Meeus 公式结果允许的最大偏差（分钟）
+MAX_DEVIATION = 30
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+
+# 北京时间（UTC+8）
+BEIJING = datetime.timezone(datetime.timedelta(hours=8))
+EPOCH = datetime.datetime(1900, 1, 1, tzinfo=BEIJING)
+
+
+def year_terms(year: int) -> List[int]:
+    """
+    计算某公历年内24个节气的交节时刻
+
+    Returns:
+        按 小寒 ... 冬至 顺序排列的分钟数列表（四舍五入到分钟）
+    """
+    # lunarcalendar 的节气编号以立春为0，小寒(22)、大寒(23)归属上一年
+    ids = [(year - 1, 22), (year - 1, 23)] + [(year, i) for i in range(22)]
+    minutes = []
+    for y, i in ids:
+        instant = specified_solar_term(y, i).astimezone(BEIJING)
+        minutes.append(round((instant - EPOCH).total_seconds() / 60))
+    return minutes
+
+
+def render(values: List[int]) -> str:
+    lines = [
+        "# ziwei/algorithm/jieqi_data.py",
+        "# 本文件由 gen_jieqi_table.py 自动生成，请勿手工修改",
+        "",
+        f"JIEQI_FIRST_YEAR = {FIRST_YEAR}",
+        f"JIEQI_LAST_YEAR = {LAST_YEAR}",
+        "",
+        "# 每年24项（小寒 ... 冬至），值为距 1900-01-01 00:00（北京时间）的分钟数",
+        "JIEQI_MINUTES = (",
+    ]
+    for i in range(0, len(values), 12):
+        lines.append("    " + ", ".join(str(v) for v in values[i:i + 12]) + ",")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    if lunarcalendar.__version__ != LUNARCALENDAR_VERSION:
+        raise RuntimeError(f"需要 LunarCalendar=={LUNARCALENDAR_VERSION}，当前为 {lunarcalendar.__version__}")
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(here, "jieqi_data.py")
+    values = []
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        terms = year_terms(year)
+        deviation = max(abs(a - b) for a, b in zip(terms, calc_year_terms(year)))
+        if deviation > MAX_DEVIATION:
+            raise ValueError(f"{year} 年节气时刻与 Meeus 公式相差 {deviation} 分钟")
+        values += terms
+    if any(b <= a for a, b in zip(values, values[1:])):
+        raise ValueError("节气时刻未严格递增")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render(values))
+    print(f"已写入 {len(values)} 个节气时刻到 {path}")
+
+
+if __name__ == "__main__":
+    main()
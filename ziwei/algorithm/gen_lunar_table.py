@@ -0,0 +1,101 @@
+# ziwei/algorithm/gen_lunar_table.py
+"""
+农历月表生成脚本（离线运行，仅依赖 lunarcalendar）
+
+遍历农历 1899-2100 年的每一个农历月，按年压缩为一个整数后写入
+lunar_data.py，供 lunar_table 在运行时查表使用：
+
+    bit 0-3  : 闰月月份（0 表示无闰月）
+    bit 4-16 : 按年内月序（含闰月）依次记录大小月，1 为大月(30天)，0 为小月(29天)
+
+用法:
+    python gen_lunar_table.py [输出文件路径]
+"""
+import datetime
+import os
+import sys
+from typing import List, Tuple
+
+from lunarcalendar import Converter, Solar
+
+FIRST_LUNAR_YEAR = 1899
+LAST_LUNAR_YEAR = 2100
+
+
+def collect_months() -> List[Tuple[int, int, int, bool]]:
+    """
+    逐日扫描，收集每个农历月的(起始公历序数, 农历年, 农历月, 是否闰月)
+
+    Returns:
+        按时间排序的农历月列表，最后追加一个哨兵（下一年正月初一）
+    """
+    # 1899年正月初一为1899-02-10，稍微提前开始扫描
+    day = datetime.date(FIRST_LUNAR_YEAR, 1, 1)
+    months = []
+    while True:
+        lunar = Converter.Solar2Lunar(Solar(day.year, day.month, day.day))
+        if lunar.day == 1 and lunar.year >= FIRST_LUNAR_YEAR:
+            months.append((day.toordinal(), lunar.year, lunar.month, lunar.isleap))
+            if lunar.year > LAST_LUNAR_YEAR:
+                break
+        # 找到月初后直接跳到 29 天后，减少库调用次数
+        day += datetime.timedelta(days=29 if lunar.day == 1 else 1)
+    return months
+
+
+def pack_years(months: List[Tuple[int, int, int, bool]]) -> Tuple[int, List[int]]:
+    """
+    将农历月列表按年压缩
+
+    Returns:
+        (首年正月初一的公历序数, 每年压缩后的整数列表)
+    """
+    infos = []
+    cur_year, leap, bits, n = None, 0, 0, 0
+    for (start, year, month, isleap), (next_start, _, _, _) in zip(months, months[1:]):
+        if year != cur_year:
+            if cur_year is not None:
+                infos.append(leap | (bits << 4))
+            cur_year, leap, bits, n = year, 0, 0, 0
+        length = next_start - start
+        if length not in (29, 30):
+            raise ValueError(f"农历{year}年{month}月天数异常: {length}")
+        if isleap:
+            leap = month
+        if length == 30:
+            bits |= 1 << n
+        n += 1
+    infos.append(leap | (bits << 4))
+    return months[0][0], infos
+
+
+def render(base_ordinal: int, infos: List[int]) -> str:
+    lines = [
+        "# ziwei/algorithm/lunar_data.py",
+        "# 本文件由 gen_lunar_table.py 自动生成，请勿手工修改",
+        "",
+        f"# 农历 {FIRST_LUNAR_YEAR} 年正月初一对应的公历日期序数"
+        f"（{datetime.date.fromordinal(base_ordinal)}）",
+        f"LUNAR_BASE_ORDINAL = {base_ordinal}",
+        f"LUNAR_FIRST_YEAR = {FIRST_LUNAR_YEAR}",
+        "",
+        "# 每年一项：bit 0-3 为闰月月份，bit 4 起为各月大小（1=30天）",
+        "LUNAR_YEAR_INFO = (",
+    ]
+    for i in range(0, len(infos), 8):
+        lines.append("    " + ", ".join(f"0x{v:05x}" for v in infos[i:i + 8]) + ",")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(here, "lunar_data.py")
+    base_ordinal, infos = pack_years(collect_months())
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render(base_ordinal, infos))
+    print(f"已写入 {len(infos)} 个农历年到 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# ziwei/algorithm/instrumentation.py
+"""
+排盘流水线的分阶段计时
+
+ZhongZhouCalculator 接收一个可选的 Instrumentation 实例，按阶段（四柱、农历转换、宫位、
+星曜排布、格局、字典展开……）记录耗时与调用次数，累计到直方图中，并可导出为
+Prometheus 文本格式或 JSON。未传入实例时计算器不做任何计时，没有额外开销。
+
+用法:
+    inst = Instrumentation()
+    calc = ZhongZhouCalculator(instrumentation=inst)
+    calc.calculate(birth)
+    print(inst.export_prometheus())
+"""
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence
+
+# 默认直方图分桶上界（秒），覆盖 1 微秒到 0.1 秒
+DEFAULT_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1)
+
+
+class StageHistogram:
+    """单个阶段的耗时直方图（非累积计数，导出时再累加）"""
+    __slots__ = ("bounds", "buckets", "count", "total")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        # 最后一个桶对应 +Inf
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float):
+        self.buckets[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def cumulative(self) -> List[int]:
+        """各分桶的累积计数（Prometheus 的 le 语义），最后一项即总次数"""
+        out, running = [], 0
+        for n in self.buckets:
+            running += n
+            out.append(running)
+        return out
+
+
+class Instrumentation:
+    """
+    分阶段计时注册表
+
+    Attributes:
+        enabled: 为 False 时 lap/stage 只返回时间戳，不记录数据
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "ziwei_chart"):
+        """
+        Args:
+            buckets: 直方图分桶上界（秒），需递增
+            namespace: 导出的 Prometheus 指标名前缀
+        """
+        if list(buckets) != sorted(buckets):
+            raise ValueError("直方图分桶上界必须递增")
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self.enabled = True
+        self._stages: Dict[str, StageHistogram] = {}
+        self._listeners: List[Callable[[str, float], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[str, float], None]):
+        """注册回调，每记录一次阶段耗时调用 callback(阶段名, 秒数)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, float], None]):
+        self._listeners.remove(callback)
+
+    def record(self, stage: str, seconds: float):
+        """记录某阶段的一次耗时"""
+        if not self.enabled:
+            return
+        with self._lock:
+            hist = self._stages.get(stage)
+            if hist is None:
+                hist = self._stages[stage] = StageHistogram(self.buckets)
+            hist.observe(seconds)
+        for callback in self._listeners:
+            callback(stage, seconds)
+
+    def lap(self, stage: str, start: float) -> float:
+        """
+        记录从 start 到现在的耗时并返回当前时间戳，便于连续计时各阶段
+
+        Args:
+            stage: 阶段名
+            start: 上一阶段结束时的 time.perf_counter() 值
+
+        Returns:
+            当前的 time.perf_counter() 值
+        """
+        now = time.perf_counter()
+        self.record(stage, now - start)
+        return now
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """计时上下文管理器：with inst.stage("xxx"): ..."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def reset(self):
+        """清空全部统计"""
+        with self._lock:
+            self._stages.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        当前统计快照
+
+        Returns:
+            {阶段名: {"count": 次数, "sum": 总秒数, "buckets": {上界: 累积次数, ..., "+Inf": 次数}}}
+        """
+        with self._lock:
+            stages = {name: (hist.count, hist.total, hist.cumulative()) for name, hist in self._stages.items()}
+        result = {}
+        for name, (count, total, cumulative) in stages.items():
+            labels = [repr(b) for b in self.buckets] + ["+Inf"]
+            result[name] = {"count": count, "sum": total, "buckets": dict(zip(labels, cumulative))}
+        return result
+
+    def export_json(self, **kwargs) -> str:
+        """以 JSON 文本导出统计快照"""
+        kwargs.setdefault("ensure_ascii", False)
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def export_prometheus(self) -> str:
+        """以 Prometheus 文本格式导出各阶段耗时直方图"""
+        metric = f"{self.namespace}_stage_seconds"
+        lines = [f"# HELP {metric} 命盘计算各阶段耗时（秒）", f"# TYPE {metric} histogram"]
+        for name, data in sorted(self.snapshot().items()):
+            for le, n in data["buckets"].items():
+                lines.append(f'{metric}_bucket{{stage="{name}",le="{le}"}} {n}')
+            lines.append(f'{metric}_sum{{stage="{name}"}} {data["sum"]!r}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {data["count"]}')
+        return "\n".join(lines) + "\n"
+
@@ -1,28 +1,246 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Hashable, Iterable, Optional, Sequence
 import datetime
+import heapq
+
+import numpy as np
+
 from ganzhi_converter import GanZhiConverter
+from star_system import WUXING_ORDER
+
+# 价格等级排序（高>中>低，其余排最后）
+TIER_ORDER = {"high": 0, "mid": 1, "low": 2}
+_OTHER_TIER = 3
+
+# 各推荐信号的默认权重：五行类信号命中计一次，标签类信号按命中的标签个数累计
+DEFAULT_WEIGHTS = {
+    "bureau": 1.0,       # 出生年五行局
+    "month_nayin": 1.0,  # 月干支纳音五行
+    "day_nayin": 1.0,    # 日干支纳音五行
+    # 生命数字由完整出生日期得出，是唯一直接对应本人的数字信号，比单个纳音或磁场命中更有针对性：
+    # 取 1.5 使其单独命中时排在任一单项命中之前，但仍低于两项同时命中（2.0）
+    "life_number": 1.5,
+    "patterns": 1.0,     # 数字磁场（每个命中的磁场）
+    "fengshui": 1.0,     # 风水住所标签（每个命中的标签）
+}
+
+
+# 单字节置位数查表（旧版 numpy 没有 bitwise_count 时使用）
+_BYTE_POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """逐元素统计 uint64 中置位的个数"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks)
+    return _BYTE_POPCOUNT[np.ascontiguousarray(masks)[..., None].view(np.uint8)].sum(axis=-1)
+
+
+def _postings(values: Iterable[Iterable[Hashable]]) -> Dict[Hashable, np.ndarray]:
+    """倒排表：标签 -> 含该标签的商品在 db 中的下标（升序）"""
+    index: Dict[Hashable, List[int]] = {}
+    for pos, tags in enumerate(values):
+        for tag in set(tags):
+            index.setdefault(tag, []).append(pos)
+    return {tag: np.array(positions, dtype=np.int64) for tag, positions in index.items()}
+
+
+def _vocabulary(values: Iterable[Iterable[Hashable]]) -> Dict[Hashable, int]:
+    """标签 -> 位序号（按首次出现的顺序编号）"""
+    vocab: Dict[Hashable, int] = {}
+    for tags in values:
+        for tag in tags:
+            vocab.setdefault(tag, len(vocab))
+    return vocab
+
+
+def _encode_tags(values: Sequence[Iterable[Hashable]], vocab: Dict[Hashable, int]) -> np.ndarray:
+    """把每件商品的标签编码为位图：N×W 的 uint64，第 b 位在第 b // 64 个字中"""
+    words = max(1, (len(vocab) + 63) // 64)
+    masks = np.zeros((len(values), words), dtype=np.uint64)
+    for row, tags in enumerate(values):
+        for tag in tags:
+            bit = vocab[tag]
+            masks[row, bit // 64] |= np.uint64(1 << (bit % 64))
+    return masks
+
+
+def _query_mask(tags: Iterable[Hashable], vocab: Dict[Hashable, int], words: int) -> np.ndarray:
+    """查询标签的位图（目录中没有的标签忽略）"""
+    mask = np.zeros(words, dtype=np.uint64)
+    for tag in tags:
+        bit = vocab.get(tag)
+        if bit is not None:
+            mask[bit // 64] |= np.uint64(1 << (bit % 64))
+    return mask
 
 
 class JewelryRecommendationEngine:
     """珠宝推荐引擎，基于紫微斗数和风水理论为用户推荐合适的珠宝"""
 
-    def __init__(self, jewelry_db: List[Dict], fees: Dict[str, float] = None):
+    def __init__(self, jewelry_db: List[Dict], fees: Dict[str, float] = None,
+                 weights: Dict[str, float] = None):
         """
         初始化珠宝推荐引擎
 
         Args:
             jewelry_db: 珠宝数据库，每条记录包含id、名称、五行属性等信息
             fees: 推荐服务费用配置，默认为{"year": 0.0, "month_day": 10.0, "fengshui": 15.0}
+            weights: 各推荐信号的权重，未给出的信号使用 DEFAULT_WEIGHTS
+
+        Raises:
+            ValueError: 权重中有未知的信号
         """
+        unknown = set(weights or {}) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"未知的推荐信号: {', '.join(sorted(unknown))}")
         self.db = jewelry_db
         self.fees = fees or {"year": 0.0, "month_day": 10.0, "fengshui": 15.0}
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """
+        重建索引，构造时自动调用，self.db 变动后需手动调用
+
+        倒排索引（五行、数字标签、风水标签 -> 商品下标）先把候选缩小到命中任一查询标签的商品；
+        列存数组再对候选做向量化匹配：五行、数字标签、风水标签各编码为 uint64 位图
+        （标签多于 64 个时按字扩展），一次按位与和置位计数得出命中个数，价格等级为 int8 列。
+        只为最终结果生成商品字典。
+        """
+        digital = [j.get("digital_tags", []) for j in self.db]
+        fengshui = [j.get("fengshui_tags", []) for j in self.db]
+        self._by_wuxing = _postings([j["wuxing"]] for j in self.db)
+        self._by_digital = _postings(digital)
+        self._by_fengshui = _postings(fengshui)
+
+        self._digital_bits = _vocabulary(digital)
+        self._fengshui_bits = _vocabulary(fengshui)
+        self._digital = _encode_tags(digital, self._digital_bits)
+        self._fengshui = _encode_tags(fengshui, self._fengshui_bits)
+        self._wuxing = np.array([1 << WUXING_ORDER.index(j["wuxing"]) if j["wuxing"] in WUXING_ORDER else 0
+                                 for j in self.db], dtype=np.uint64)
+        self._tier = np.array([TIER_ORDER.get(j["price_tier"], _OTHER_TIER) for j in self.db], dtype=np.int8)
+        self._n_digital = np.array([len(tags) for tags in digital], dtype=np.int16)
+        # 商品 id 编码为整数，用于按 id 去重
+        codes: Dict[Hashable, int] = {}
+        self._id_code = np.array([codes.setdefault(j["id"], len(codes)) for j in self.db], dtype=np.int64)
+
+    @staticmethod
+    def _union(index: Dict[Hashable, np.ndarray], keys: Iterable[Hashable]) -> np.ndarray:
+        """多个标签倒排表的并集（按 db 顺序）"""
+        lists = [index[k] for k in set(keys) if k in index]
+        if not lists:
+            return np.zeros(0, dtype=np.int64)
+        if len(lists) == 1:
+            return lists[0]
+        return np.unique(np.concatenate(lists))
+
+    def _wuxing_hits(self, wuxing: Iterable[str]) -> np.ndarray:
+        """五行属于给定集合的商品（布尔数组）"""
+        hits = np.zeros(len(self.db), dtype=bool)
+        hits[self._union(self._by_wuxing, wuxing)] = True
+        return hits
+
+    def _tag_hits(self, masks: np.ndarray, vocab: Dict[Hashable, int],
+                  index: Dict[Hashable, np.ndarray], tags: Iterable[Hashable]) -> np.ndarray:
+        """标签与给定标签相交的个数：倒排表取候选，只对候选做按位与和置位计数"""
+        tags = set(tags)
+        hits = np.zeros(len(self.db), dtype=np.int64)
+        candidates = self._union(index, tags)
+        if len(candidates):
+            query = _query_mask(tags, vocab, masks.shape[1])
+            hits[candidates] = _popcount(masks[candidates] & query).sum(axis=1)
+        return hits
+
+    def _digital_hits(self, tags: Iterable[Hashable]) -> np.ndarray:
+        """数字标签与给定标签相交的个数"""
+        return self._tag_hits(self._digital, self._digital_bits, self._by_digital, tags)
+
+    def _fengshui_hits(self, tags: Iterable[Hashable]) -> np.ndarray:
+        """风水标签与给定标签相交的个数"""
+        return self._tag_hits(self._fengshui, self._fengshui_bits, self._by_fengshui, tags)
+
+    def match_batch(self, queries: Sequence[Dict[str, Iterable[Hashable]]]) -> np.ndarray:
+        """
+        批量匹配：一批请求对整个目录的命中标签数
 
-    def recommend_by_year(self, natal: Dict[str, Any]) -> List[Dict]:
+        Args:
+            queries: 每个请求可含 "wuxing"（五行列表）、"digital_tags"、"fengshui_tags"
+
+        Returns:
+            Q×N 命中个数矩阵（五行命中计 1，标签按相交个数计）
+        """
+        n_words = (self._digital.shape[1], self._fengshui.shape[1])
+        # 整批请求的候选：命中任一请求中任一标签的商品
+        candidates = np.unique(np.concatenate(
+            [self._union(self._by_wuxing, q.get("wuxing", ())) for q in queries]
+            + [self._union(self._by_digital, q.get("digital_tags", ())) for q in queries]
+            + [self._union(self._by_fengshui, q.get("fengshui_tags", ())) for q in queries]
+            + [np.zeros(0, dtype=np.int64)]))
+        wuxing = np.array([sum(1 << WUXING_ORDER.index(w) for w in set(q.get("wuxing", ())) if w in WUXING_ORDER)
+                           for q in queries], dtype=np.uint64)
+        digital = np.array([_query_mask(q.get("digital_tags", ()), self._digital_bits, n_words[0])
+                            for q in queries], dtype=np.uint64).reshape(len(queries), n_words[0])
+        fengshui = np.array([_query_mask(q.get("fengshui_tags", ()), self._fengshui_bits, n_words[1])
+                             for q in queries], dtype=np.uint64).reshape(len(queries), n_words[1])
+        found = ((self._wuxing[None, candidates] & wuxing[:, None]) != 0).astype(np.int32)
+        # 逐字累加，中间结果只有 Q×候选数
+        for w in range(n_words[0]):
+            found += _popcount(digital[:, w, None] & self._digital[None, candidates, w])
+        for w in range(n_words[1]):
+            found += _popcount(fengshui[:, w, None] & self._fengshui[None, candidates, w])
+        hits = np.zeros((len(queries), len(self.db)), dtype=np.int32)
+        hits[:, candidates] = found
+        return hits
+
+    def _top_k(self, signals: Dict[str, np.ndarray], limit: Optional[int] = None) -> List[Dict]:
+        """
+        对命中任一信号的商品打分并取前 limit 个
+
+        评分为各信号命中次数乘以权重之和，一次累加完成；同 id 的商品只保留得分最高的一条。
+        排序依次按：得分从高到低、价格等级(高>中>低)、数字标签数量从多到少、目录顺序。
+        给出 limit 时用 heapq 部分选择，不对全部候选排序，且只为选出的商品生成字典。
+
+        Args:
+            signals: 信号名称 -> 各商品的命中次数数组
+            limit: 返回的最多个数，None 为全部
+
+        Returns:
+            推荐的珠宝列表
+        """
+        if not signals or limit == 0:
+            return []
+        scores = np.zeros(len(self.db))
+        matched = np.zeros(len(self.db), dtype=bool)
+        for name, hits in signals.items():
+            scores += self.weights[name] * hits
+            matched |= hits > 0
+        positions = np.flatnonzero(matched)
+        if not len(positions):
+            return []
+
+        # 同 id 只保留得分最高（同分取目录中靠前）的一条
+        ids = self._id_code[positions]
+        best = np.full(ids.max() + 1, -np.inf)
+        np.maximum.at(best, ids, scores[positions])
+        positions = positions[scores[positions] == best[ids]]
+        _, first = np.unique(self._id_code[positions], return_index=True)
+        positions = positions[np.sort(first)]
+
+        keys = (-scores[positions], self._tier[positions], -self._n_digital[positions])
+        if limit is None or limit >= len(positions):
+            order = np.lexsort((positions,) + keys[::-1])
+            return [self.db[p] for p in positions[order].tolist()]
+        top = heapq.nsmallest(limit, zip(*(k.tolist() for k in keys), positions.tolist()))
+        return [self.db[entry[-1]] for entry in top]
+
+    def recommend_by_year(self, natal: Dict[str, Any], limit: Optional[int] = None) -> List[Dict]:
         """
         按出生年五行局推荐珠宝
 
         Args:
             natal: 包含五行局信息的字典
+            limit: 返回的最多个数，None 为全部
 
         Returns:
             推荐的珠宝列表
@@ -31,10 +249,11 @@ class JewelryRecommendationEngine:
         wuxing = bureau[0] if bureau else None
         if not wuxing:
             return []
-        return [j for j in self.db if j["wuxing"] == wuxing]
+        return self._top_k({"bureau": self._wuxing_hits([wuxing])}, limit)
 
     def recommend_by_month_day(self, birth_date: Dict[str, Any],
-                               life_number: int, digital_patterns: List[Dict[str, Any]]) -> List[Dict]:
+                               life_number: int, digital_patterns: List[Dict[str, Any]],
+                               limit: Optional[int] = None) -> List[Dict]:
         """
         按月日干支、生命数字、数字磁场推荐珠宝
 
@@ -42,75 +261,48 @@ class JewelryRecommendationEngine:
             birth_date: 包含月日干支信息的字典
             life_number: 生命数字
             digital_patterns: 数字磁场模式列表
+            limit: 返回的最多个数，None 为全部
 
         Returns:
-            推荐的珠宝列表
+            推荐的珠宝列表，命中信号越多（按权重）越靠前
         """
-        recs = []
+        signals = {}
         mgz = birth_date.get("month_ganzhi", "")
         dgz = birth_date.get("day_ganzhi", "")
 
         # 1. 月日干支纳音五行
-        for tag, gz in [("月", mgz), ("日", dgz)]:
+        for name, gz in [("month_nayin", mgz), ("day_nayin", dgz)]:
             if gz:
                 nayin = GanZhiConverter.NAYIN.get(gz, "")
                 wux = nayin[-1] if nayin else None
                 if wux:
-                    recs += [j for j in self.db if j["wuxing"] == wux]
+                    signals[name] = self._wuxing_hits([wux])
 
         # 2. 生命数字
         if life_number:
-            recs += [j for j in self.db if life_number in j.get("digital_tags", [])]
+            signals["life_number"] = self._digital_hits([life_number])
 
         # 3. 数字磁场
         dpats = {p["pattern"] for p in digital_patterns} if digital_patterns else set()
         if dpats:
-            recs += [j for j in self.db if dpats & set(j.get("digital_tags", []))]
+            signals["patterns"] = self._digital_hits(dpats)
 
-        return self._dedupe_sort(recs)
+        return self._top_k(signals, limit)
 
-    def recommend_by_fengshui(self, house_tags: List[str]) -> List[Dict]:
+    def recommend_by_fengshui(self, house_tags: List[str], limit: Optional[int] = None) -> List[Dict]:
         """
         按风水住所标签推荐珠宝
 
         Args:
             house_tags: 风水住所标签列表
+            limit: 返回的最多个数，None 为全部
 
         Returns:
-            推荐的珠宝列表
+            推荐的珠宝列表，命中标签越多越靠前
         """
         if not house_tags:
             return []
-        recs = [j for j in self.db if set(house_tags) & set(j.get("fengshui_tags", []))]
-        return self._dedupe_sort(recs)
-
-    def _dedupe_sort(self, recs: List[Dict]) -> List[Dict]:
-        """
-        对推荐结果进行去重和排序
-
-        Args:
-            recs: 推荐结果列表
-
-        Returns:
-            去重和排序后的推荐结果
-        """
-        if not recs:
-            return []
-
-        seen = set()
-        out = []
-        for j in recs:
-            if j["id"] not in seen:
-                seen.add(j["id"])
-                out.append(j)
-
-        # 按价格等级(高>中>低)和数字标签数量排序
-        tier_order = {"high": 0, "mid": 1, "low": 2}
-        out.sort(key=lambda x: (
-            tier_order.get(x["price_tier"], 3),
-            -len(x.get("digital_tags", []))
-        ))
-        return out
+        return self._top_k({"fengshui": self._fengshui_hits(house_tags)}, limit)
 
     def get_fee(self, method: str) -> float:
         """
@@ -126,7 +318,7 @@ class JewelryRecommendationEngine:
 
     def recommend(self, natal: Dict[str, Any], birth_date: Dict[str, Any],
                   life_number: int, digital_patterns: List[Dict[str, Any]],
-                  house_tags: List[str] = None) -> Dict[str, Any]:
+                  house_tags: List[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         生成综合推荐结果
 
@@ -136,20 +328,21 @@ class JewelryRecommendationEngine:
             life_number: 生命数字
             digital_patterns: 数字磁场模式
             house_tags: 风水住所标签列表(可选)
+            limit: 每类推荐返回的最多个数(可选)，None 为全部
 
         Returns:
             包含各种推荐结果的字典
         """
         # 年度推荐（免费）
-        year_list = self.recommend_by_year(natal)
+        year_list = self.recommend_by_year(natal, limit)
 
         # 月/日推荐（收费）
-        month_day_list = self.recommend_by_month_day(birth_date, life_number, digital_patterns)
+        month_day_list = self.recommend_by_month_day(birth_date, life_number, digital_patterns, limit)
 
         # 风水推荐（收费，可选）
         feng_list = []
         if house_tags:
-            feng_list = self.recommend_by_fengshui(house_tags)
+            feng_list = self.recommend_by_fengshui(house_tags, limit)
 
         return {
             "natal_chart": natal,
@@ -0,0 +1,127 @@
+# ziwei/algorithm/jieqi_table.py
+"""
+二十四节气查表
+
+1900-2100 年的交节时刻来自 jieqi_data.py（由 gen_jieqi_table.py 离线生成，精确到分钟），
+运行时二分查找；超出表范围的年份改用简化太阳黄经公式现算，并按年缓存。
+
+节气按公历年内顺序编号：0 小寒、1 大寒、2 立春 …… 23 冬至，其中偶数编号为“节”，
+决定月柱的月建；立春决定年柱的交替。
+"""
+import datetime
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from jieqi_data import JIEQI_FIRST_YEAR, JIEQI_LAST_YEAR, JIEQI_MINUTES
+
+JIEQI_NAMES = ["小寒", "大寒", "立春", "雨水", "惊蛰", "春分", "清明", "谷雨",
+               "立夏", "小满", "芒种", "夏至", "小暑", "大暑", "立秋", "处暑",
+               "白露", "秋分", "寒露", "霜降", "立冬", "小雪", "大雪", "冬至"]
+
+# 分钟数的起点：1900-01-01 00:00（北京时间）
+EPOCH = datetime.datetime(1900, 1, 1)
+
+# 只保留12个“节”，用于月柱查找
+JIE_MINUTES = JIEQI_MINUTES[::2]
+_JIE_ARR = np.array(JIE_MINUTES, dtype=np.int64)
+
+# 儒略日 2451545.0 (J2000.0) 对应的北京时间
+_J2000 = datetime.datetime(2000, 1, 1, 20, 0)
+
+
+def to_minutes(dt: datetime.datetime) -> int:
+    """北京时间转为距 EPOCH 的分钟数"""
+    delta = dt - EPOCH
+    return delta.days * 1440 + delta.seconds // 60
+
+
+def _sun_longitude(jd: float) -> float:
+    """太阳视黄经（度），Meeus《天文算法》低精度公式，误差约0.01度"""
+    t = (jd - 2451545.0) / 36525
+    l0 = 280.46646 + 36000.76983 * t + 0.0003032 * t * t
+    m = math.radians(357.52911 + 35999.05029 * t - 0.0001537 * t * t)
+    c = ((1.914602 - 0.004817 * t - 0.000014 * t * t) * math.sin(m)
+         + (0.019993 - 0.000101 * t) * math.sin(2 * m)
+         + 0.000289 * math.sin(3 * m))
+    omega = math.radians(125.04 - 1934.136 * t)
+    return (l0 + c - 0.00569 - 0.00478 * math.sin(omega)) % 360
+
+
+@lru_cache(maxsize=256)
+def calc_year_terms(year: int) -> Tuple[int, ...]:
+    """
+    现算某公历年24个节气的交节时刻（表外年份的后备算法，按年缓存）
+
+    Returns:
+        按 小寒 ... 冬至 顺序排列的分钟数元组，精度约为一刻钟
+    """
+    base_jd = 2451545.0 + (datetime.datetime(year, 1, 1) - _J2000).total_seconds() / 86400
+    terms = []
+    for i in range(24):
+        # 小寒为黄经285度，此后每个节气递增15度
+        target = (285 + 15 * i) % 360
+        jd = base_jd + 5 + i * 365.2422 / 24
+        for _ in range(8):
+            diff = (target - _sun_longitude(jd) + 180) % 360 - 180
+            jd += diff / 0.9856
+            if abs(diff) < 1e-6:
+                break
+        seconds = (jd - 2451545.0) * 86400
+        terms.append(to_minutes(_J2000 + datetime.timedelta(seconds=seconds)))
+    return tuple(terms)
+
+
+def year_terms(year: int) -> Tuple[int, ...]:
+    """某公历年24个节气的交节时刻（分钟数），表内查表，表外现算"""
+    if JIEQI_FIRST_YEAR <= year <= JIEQI_LAST_YEAR:
+        start = (year - JIEQI_FIRST_YEAR) * 24
+        return JIEQI_MINUTES[start:start + 24]
+    return calc_year_terms(year)
+
+
+def solar_month(dt: datetime.datetime) -> Tuple[int, int]:
+    """
+    按节气确定干支纪年与月建
+
+    Args:
+        dt: 出生时刻（北京时间）
+
+    Returns:
+        (干支纪年所属年份, 月序) 元组，年份以立春为界，月序 1 为寅月（立春至惊蛰）
+    """
+    minutes = to_minutes(dt)
+    idx = bisect_right(JIE_MINUTES, minutes) - 1
+    if idx >= 0 and dt.year <= JIEQI_LAST_YEAR:
+        year, k = JIEQI_FIRST_YEAR + idx // 12, idx % 12
+    else:
+        # 表外：现算当年的节，早于当年小寒则属上一年大雪之后
+        jie = year_terms(dt.year)[::2]
+        k = bisect_right(jie, minutes) - 1
+        year = dt.year
+        if k < 0:
+            year, k = year - 1, 11
+    # k 为当年第几个节：0 小寒(丑月)、1 立春(寅月) …… 11 大雪(子月)
+    return (year if k >= 1 else year - 1), (k - 1) % 12 + 1
+
+
+def solar_month_batch(minutes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    solar_month 的向量化版本（仅支持表内时刻）
+
+    Args:
+        minutes: 距 EPOCH 的分钟数数组
+
+    Returns:
+        (干支纪年所属年份数组, 月序数组)
+    """
+    minutes = np.asarray(minutes, dtype=np.int64)
+    idx = np.searchsorted(_JIE_ARR, minutes, side="right") - 1
+    if idx.size and (idx.min() < 0 or minutes.max() >= to_minutes(datetime.datetime(JIEQI_LAST_YEAR + 1, 1, 1))):
+        raise ValueError("时刻超出节气表范围")
+    year = JIEQI_FIRST_YEAR + idx // 12
+    k = idx % 12
+    return np.where(k >= 1, year, year - 1), (k - 1) % 12 + 1
@@ -0,0 +1,163 @@
+# ziwei/algorithm/luck_timeline.py
+"""
+大限、流年时间线
+
+大限：自五行局数的虚岁起，每十年一限，第一限在命宫，阳男阴女顺行、阴男阳女逆行
+（与紫微系推进方向相同，可由主星布局反查）；大限四化取大限宫的宫干（五虎遁）。
+流年：流年命宫在当年地支所在的宫，流年四化取当年年干。
+
+一次用数组运算算出整个寿命区间（默认 120 年）的全部序列，按年查询只是一次取下标。
+序列只取决于 (出生年, 命宫, 主星布局)，按此缓存。
+"""
+from functools import lru_cache
+from typing import Dict, NamedTuple, Sequence
+
+import numpy as np
+
+from flying_transform import branch_stem
+from four_transform import FourTransform, YEAR_BY_STEM
+from ganzhi_converter import BUREAU_NUMBERS, NAYIN_CODE, GanZhiConverter
+from major_layout import layout_of
+from palace import PALACES
+from star_system import StarSystem
+from utils import DI_ZHI, JIAZI, TIAN_GAN, cycle_index
+
+# 默认推算的年数（虚岁 1 至 120）
+DEFAULT_SPAN = 120
+# 推算年数上限（公历年份以 int16 存储）
+MAX_SPAN = 1200
+
+# 天干 -> 禄权科忌所在星曜的下标（StarSystem.ALL 顺序）
+TRANSFORM_STARS = np.array([[StarSystem.STAR_INDEX[s] for s in stars] for stars in YEAR_BY_STEM], dtype=np.int8)
+
+
+class LuckTimeline(NamedTuple):
+    """
+    一张命盘的大限、流年序列（只读），第 i 项对应虚岁 i + 1
+
+    Attributes:
+        birth_year: 出生的干支纪年年份（以立春为界）
+        bureau: 五行局数字，即第一大限起运的虚岁
+        years: 公历年份
+        year_cycle: 流年六十甲子序号，流年命宫即其地支所在宫
+        decade: 大限序号（第一限为0，int16），起运前的童限为 -1
+        decade_branch: 大限宫地支，童限为 -1
+        decade_stem: 大限宫宫干，童限为 -1
+        decade_palace: 大限宫对应的本命宫位（PALACES 下标），童限为 -1
+        decade_trans: N×4 大限禄权科忌星曜下标（StarSystem.ALL 顺序），童限为 -1
+        annual_palace: 流年命宫对应的本命宫位（PALACES 下标）
+        annual_trans: N×4 流年禄权科忌星曜下标
+    """
+    birth_year: int
+    bureau: int
+    years: np.ndarray
+    year_cycle: np.ndarray
+    decade: np.ndarray
+    decade_branch: np.ndarray
+    decade_stem: np.ndarray
+    decade_palace: np.ndarray
+    decade_trans: np.ndarray
+    annual_palace: np.ndarray
+    annual_trans: np.ndarray
+
+    def index(self, year: int) -> int:
+        """公历年份在序列中的下标"""
+        i = year - self.birth_year
+        if not 0 <= i < len(self.years):
+            raise ValueError(f"年份超出推算范围: {year}")
+        return i
+
+    def at_age(self, age: int) -> Dict:
+        """按虚岁取当年的大限与流年信息，格式同 year_info"""
+        return self.year_info(self.birth_year + age - 1)
+
+    def year_info(self, year: int) -> Dict:
+        """
+        某一公历年份的大限与流年信息
+
+        Returns:
+            {"year": 年份, "age": 虚岁, "ganzhi": 流年干支,
+             "decade": 大限信息（童限时为 None）, "annual": 流年信息}
+        """
+        i = self.index(year)
+        cycle = int(self.year_cycle[i])
+        decade = None
+        if self.decade[i] >= 0:
+            start = self.bureau + 10 * int(self.decade[i])
+            decade = {
+                "palace": PALACES[self.decade_palace[i]].value,
+                "ganzhi": TIAN_GAN[self.decade_stem[i]] + DI_ZHI[self.decade_branch[i]],
+                "ages": (start, start + 9),
+                "four_trans": _transforms(self.decade_trans[i]),
+            }
+        return {
+            "year": year,
+            "age": i + 1,
+            "ganzhi": JIAZI[cycle],
+            "decade": decade,
+            "annual": {
+                "life_palace": PALACES[self.annual_palace[i]].value,
+                "branch": DI_ZHI[cycle % 12],
+                "four_trans": _transforms(self.annual_trans[i]),
+            },
+        }
+
+
+def _transforms(stars: np.ndarray) -> Dict[str, str]:
+    return {kind: StarSystem.ALL[s] for kind, s in zip(FourTransform.KINDS, stars.tolist())}
+
+
+@lru_cache(maxsize=4096)
+def _timeline(birth_year: int, life: int, direction: int, span: int) -> LuckTimeline:
+    y_stem, y_branch = GanZhiConverter.year_index(birth_year)
+    bureau = BUREAU_NUMBERS[NAYIN_CODE[cycle_index(y_stem, y_branch)]]
+
+    ages = np.arange(1, span + 1)
+    years = birth_year + ages - 1
+    offset = years - 1900
+    stems, branches = (offset + 6) % 10, offset % 12
+
+    # 大限：自局数虚岁起每十年一宫，按推进方向自命宫移动；宫干由本命年干五虎遁定出
+    decade = np.where(ages >= bureau, (ages - bureau) // 10, -1)
+    in_decade = decade >= 0
+    decade_branch = (life + direction * decade) % 12
+    decade_stem = branch_stem(y_stem, decade_branch)
+    decade_trans = TRANSFORM_STARS[decade_stem]
+    decade_trans[~in_decade] = -1
+
+    def masked(values):
+        return np.where(in_decade, values, -1).astype(np.int8)
+
+    # 宫位角色自命宫起逆行排列，地支 b 对应 PALACES[(life - b) % 12]
+    arrays = dict(
+        years=years.astype(np.int16),
+        year_cycle=((6 * stems - 5 * branches) % 60).astype(np.int8),
+        decade=decade.astype(np.int16),
+        decade_branch=masked(decade_branch),
+        decade_stem=masked(decade_stem),
+        decade_palace=masked((life - decade_branch) % 12),
+        decade_trans=decade_trans,
+        annual_palace=((life - branches) % 12).astype(np.int8),
+        annual_trans=TRANSFORM_STARS[stems],
+    )
+    for a in arrays.values():
+        a.flags.writeable = False
+    return LuckTimeline(birth_year, bureau, **arrays)
+
+
+def luck_timeline(birth_year: int, life: int, major: Sequence[int], span: int = DEFAULT_SPAN) -> LuckTimeline:
+    """
+    取一张命盘的大限、流年序列（按出生年、命宫、推进方向缓存）
+
+    Args:
+        birth_year: 出生的干支纪年年份（以立春为界，立春前出生属上一年）
+        life: 命宫地支索引
+        major: 十四主星宫位（StarSystem.MAJOR 顺序），用于反查推进方向
+        span: 推算的年数（虚岁 1 至 span），不超过 MAX_SPAN
+
+    Raises:
+        ValueError: span 不在 1 至 MAX_SPAN 之间
+    """
+    if not 1 <= span <= MAX_SPAN:
+        raise ValueError(f"推算年数应在 1 至 {MAX_SPAN} 之间: {span}")
+    return _timeline(birth_year, life, layout_of(major).direction, span)
@@ -0,0 +1,36 @@
+# ziwei/algorithm/lunar_data.py
+# 本文件由 gen_lunar_table.py 自动生成，请勿手工修改
+
+# 农历 1899 年正月初一对应的公历日期序数（1899-02-10）
+LUNAR_BASE_ORDINAL = 693271
+LUNAR_FIRST_YEAR = 1899
+
+# 每年一项：bit 0-3 为闰月月份，bit 4 起为各月大小（1=30天）
+LUNAR_YEAR_INFO = (
+    0x0ad50, 0x16d28, 0x07520, 0x0ea50, 0x164a5, 0x064b0, 0x0a9b0, 0x15564,
+    0x056a0, 0x0b590, 0x17522, 0x07520, 0x1b256, 0x0b250, 0x0a4b0, 0x14ab5,
+    0x02ad0, 0x056b0, 0x0b692, 0x0da90, 0x1d927, 0x0e920, 0x0d250, 0x1a4d5,
+    0x0a560, 0x02b60, 0x15b54, 0x06d40, 0x0ea90, 0x1e922, 0x0e920, 0x0d266,
+    0x052b0, 0x0a570, 0x12b65, 0x0b5a0, 0x06d40, 0x0ec93, 0x07490, 0x16937,
+    0x0a930, 0x052b0, 0x0a5b6, 0x0aad0, 0x056a0, 0x1b554, 0x0ba40, 0x0b490,
+    0x1a932, 0x0a950, 0x152d7, 0x05360, 0x0aad0, 0x15aa5, 0x05b20, 0x0da50,
+    0x1d4a3, 0x0d4a0, 0x0a958, 0x0a970, 0x05560, 0x0ab56, 0x0ad50, 0x06d20,
+    0x0ea54, 0x0ea50, 0x064a0, 0x0c973, 0x0a9b0, 0x155a7, 0x056a0, 0x0b690,
+    0x17525, 0x0b520, 0x0b250, 0x164b4, 0x0a4b0, 0x14ab8, 0x02ad0, 0x056d0,
+    0x0b696, 0x0da90, 0x0d920, 0x1d254, 0x0d250, 0x1a4da, 0x0a560, 0x02b60,
+    0x05b56, 0x06d50, 0x0ea90, 0x1e925, 0x0e920, 0x0d260, 0x0a563, 0x0a570,
+    0x14d68, 0x035a0, 0x06d50, 0x16c95, 0x07490, 0x06930, 0x152b4, 0x052b0,
+    0x0a5b0, 0x155a2, 0x056a0, 0x1b557, 0x0ba40, 0x0b490, 0x1a935, 0x0a950,
+    0x052d0, 0x0aad4, 0x0ab50, 0x15aa9, 0x05d20, 0x0da50, 0x1d4a6, 0x0d4a0,
+    0x0c950, 0x152e4, 0x05560, 0x0ab50, 0x15b22, 0x06d20, 0x0ea56, 0x07250,
+    0x064b0, 0x0c975, 0x0cab0, 0x055a0, 0x0ad63, 0x0b690, 0x1752b, 0x0b520,
+    0x0b250, 0x1a4b6, 0x0a4b0, 0x04ab0, 0x055b5, 0x05ad0, 0x0b6a0, 0x1b522,
+    0x0d920, 0x1d257, 0x0d250, 0x0a550, 0x14ad5, 0x04b60, 0x05b50, 0x0daa3,
+    0x0ec90, 0x1e928, 0x0e920, 0x0d260, 0x0a566, 0x0a570, 0x04d60, 0x06d54,
+    0x07550, 0x07490, 0x0e933, 0x06930, 0x152b7, 0x052b0, 0x0a5b0, 0x155a5,
+    0x056a0, 0x0b650, 0x174a4, 0x0b4a0, 0x1a958, 0x0a950, 0x052d0, 0x0aad6,
+    0x0ab50, 0x05aa0, 0x0ba54, 0x0da50, 0x0d4a0, 0x1c953, 0x0c960, 0x194e7,
+    0x05560, 0x0ab50, 0x15b25, 0x06d20, 0x0ea50, 0x0e4a4, 0x064b0, 0x0c978,
+    0x04ab0, 0x055b0, 0x0ad66, 0x0b6a0, 0x07520, 0x17254, 0x0b250, 0x0a8b0,
+    0x149b2, 0x04ab0,
+)
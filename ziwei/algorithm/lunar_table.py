@@ -0,0 +1,85 @@
+# ziwei/algorithm/lunar_table.py
+"""
+查表式阳历转农历
+
+农历月数据来自 lunar_data.py（由 gen_lunar_table.py 离线生成），导入时展开为
+“每个农历月一项”的起始序数/天数/闰月标记表，运行时通过二分查找定位农历月，
+不再依赖 lunarcalendar 库。
+"""
+import datetime
+from bisect import bisect_right
+from typing import List, Tuple
+
+from lunar_data import LUNAR_BASE_ORDINAL, LUNAR_FIRST_YEAR, LUNAR_YEAR_INFO
+
+
+def _expand_months() -> Tuple[List[int], List[int], List[Tuple[int, int, bool]]]:
+    """将按年压缩的数据展开为按月的平行数组"""
+    starts, lengths, infos = [], [], []
+    ordinal = LUNAR_BASE_ORDINAL
+    for offset, info in enumerate(LUNAR_YEAR_INFO):
+        year = LUNAR_FIRST_YEAR + offset
+        leap = info & 0xF
+        bits = info >> 4
+        # 有闰月的年份为13个月，闰月紧跟在同名月份之后
+        months = []
+        for m in range(1, 13):
+            months.append((m, False))
+            if m == leap:
+                months.append((m, True))
+        for n, (month, is_leap) in enumerate(months):
+            length = 30 if (bits >> n) & 1 else 29
+            starts.append(ordinal)
+            lengths.append(length)
+            infos.append((year, month, is_leap))
+            ordinal += length
+    return starts, lengths, infos
+
+
+# 每个农历月一项：起始公历序数、天数、(农历年, 农历月, 是否闰月)
+MONTH_STARTS, MONTH_LENGTHS, MONTH_INFO = _expand_months()
+
+# 查表支持的公历序数范围 [MIN_ORDINAL, MAX_ORDINAL]
+MIN_ORDINAL = MONTH_STARTS[0]
+MAX_ORDINAL = MONTH_STARTS[-1] + MONTH_LENGTHS[-1] - 1
+
+
+def ordinal_to_lunar(ordinal: int) -> Tuple[int, int, int, bool]:
+    """
+    将公历日期序数（date.toordinal()）转换为农历
+
+    Args:
+        ordinal: 公历日期序数
+
+    Returns:
+        (农历年, 农历月, 农历日, 是否闰月) 元组
+
+    Raises:
+        ValueError: 日期超出农历表覆盖范围
+    """
+    if not (MIN_ORDINAL <= ordinal <= MAX_ORDINAL):
+        raise ValueError(
+            f"日期超出农历表范围: {datetime.date.fromordinal(ordinal)}"
+            if ordinal > 0 else f"无效的日期序数: {ordinal}"
+        )
+    idx = bisect_right(MONTH_STARTS, ordinal) - 1
+    year, month, is_leap = MONTH_INFO[idx]
+    return year, month, ordinal - MONTH_STARTS[idx] + 1, is_leap
+
+
+def solar_to_lunar(year: int, month: int, day: int) -> Tuple[int, int, int, bool]:
+    """
+    阳历转农历
+
+    Args:
+        year: 阳历年份
+        month: 阳历月份
+        day: 阳历日期
+
+    Returns:
+        (农历年, 农历月, 农历日, 是否闰月) 元组
+
+    Raises:
+        ValueError: 日期不存在或超出农历表覆盖范围
+    """
+    return ordinal_to_lunar(datetime.date(year, month, day).toordinal())
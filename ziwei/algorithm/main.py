@@ -1,5 +1,7 @@
 # ziwei/algorithm/main.py
 import json
+import sys
+from collections import deque
 from zhongzhou_calculator import ZhongZhouCalculator
 from numerology import NumerologyAnalyzer
 from jewelry_recommendation import JewelryRecommendationEngine
@@ -93,8 +95,60 @@ def main():
         print("\n建议检查以下内容:")
         print("1. 出生日期是否有效（如1990年2月30日）")
         print("2. 时辰格式是否正确（0-23整数或地支字符串）")
-        print("3. 依赖库是否安装（pip install lunarcalendar）")
+        print("3. 出生日期是否在农历表覆盖范围内（1900-2100年）")
+
+
+def bulk_main(input_path: str, output_path: str, workers: int = None):
+    """
+    批量排盘：输入文件每行一个出生信息JSON，输出文件每行一个结果JSON
+
+    结果按输入顺序写出，成功的行含 chart，失败的行（含无法解析的行）含 error，单条失败不影响其余数据。
+    """
+    calc = ZhongZhouCalculator()
+    ok = failed = 0
+    # 已读入但尚未写出的行：(输入序号, 解析错误)，可排盘的行错误为 None、结果还在途。
+    # 结果按输入顺序到达，每到一条就先写出它之前的解析错误，因此只保留在途窗口内的行
+    pending = deque()
+
+    def read_births(lines):
+        for index, line in enumerate(line for line in lines if line.strip()):
+            try:
+                birth = json.loads(line)
+            except ValueError as e:
+                # 前面没有在途的行时直接写出
+                pending.append((index, f"JSON 解析失败: {e}"))
+                flush_errors()
+                continue
+            pending.append((index, None))
+            yield birth
+
+    def flush_errors():
+        nonlocal failed
+        while pending and pending[0][1] is not None:
+            failed += 1
+            write(dict(zip(("index", "error"), pending.popleft())))
+
+    def write(row):
+        fout.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    with open(input_path, encoding="utf-8") as fin, open(output_path, "w", encoding="utf-8") as fout:
+        for res in calc.calculate_many(read_births(fin), workers=workers):
+            flush_errors()
+            index, _ = pending.popleft()
+            if res.error is None:
+                ok += 1
+                write({"index": index, "chart": res.chart})
+            else:
+                failed += 1
+                write({"index": index, "error": res.error})
+        flush_errors()
+    print(f"批量排盘完成: 成功 {ok} 条, 失败 {failed} 条, 结果已写入 {output_path}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # 用法: python main.py                      演示单个命盘与推荐
+    #       python main.py 输入.jsonl 输出.jsonl [进程数]   批量排盘
+    if len(sys.argv) >= 3:
+        bulk_main(sys.argv[1], sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else None)
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+# ziwei/algorithm/major_layout.py
+"""
+主星布局表
+
+十四主星只取决于紫微星位置（12种）与推进方向（2种），全部命盘只有 24 种主星布局。
+导入时把每种布局的主星宫位和纯主星格局位图一次算好，
+排盘时按 (紫微位置, 方向) 直接取表，省去主星排布与主星格局识别两个阶段。
+"""
+from typing import NamedTuple, Sequence, Tuple
+
+from sixty_pattern import MAJOR_RULES_MASK, PatternAnalyzer
+from star_system import MAJOR_LAYOUTS, layout_index, zi_wei_position
+
+
+class MajorLayout(NamedTuple):
+    """一种主星布局（只读）"""
+    zi_pos: int
+    direction: int
+    positions: Tuple[int, ...]  # StarSystem.MAJOR 顺序的宫位
+    patterns: int  # 纯主星格局位图（MAJOR_RULES_MASK 内的位）
+
+
+def _build_layout(zi_pos: int, direction: int) -> MajorLayout:
+    positions = MAJOR_LAYOUTS[layout_index(zi_pos, direction)]
+    patterns = PatternAnalyzer.identify_mask(positions) & MAJOR_RULES_MASK
+    return MajorLayout(zi_pos, direction, positions, patterns)
+
+
+# 按 layout_index 编号的 24 种主星布局
+LAYOUTS = tuple(_build_layout(zi_pos, direction) for zi_pos in range(12) for direction in (1, -1))
+
+
+def layout_for(day: int, bureau: int, direction: int) -> MajorLayout:
+    """
+    按农历日、局数与推进方向取主星布局
+
+    Args:
+        day: 农历日期
+        bureau: 局数（五行局数字）
+        direction: 紫微系推进方向，1 为顺行，-1 为逆行
+    """
+    return LAYOUTS[layout_index(zi_wei_position(day, bureau), direction)]
+
+
+def layout_of(positions: Sequence[int]) -> MajorLayout:
+    """由主星宫位（StarSystem.MAJOR 顺序，至少含紫微、天机）反查所属布局"""
+    direction = 1 if (positions[1] - positions[0]) % 12 == 1 else -1
+    return LAYOUTS[layout_index(positions[0], direction)]
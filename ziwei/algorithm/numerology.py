@@ -1,4 +1,10 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# 批量扫描时每块的号码条数
+DEFAULT_CHUNK = 65536
+
 
 class NumerologyAnalyzer:
     """数字能量学分析"""
@@ -28,26 +34,182 @@ class NumerologyAnalyzer:
 
     @staticmethod
     def calculate_life_number(birth_date: Dict[str, int]) -> int:
-        """计算生命数字"""
-        digits = [int(d) for d in f"{birth_date['year']}{birth_date['month']:02d}{birth_date['day']:02d}"]
-        s = sum(digits)
-        while s > 9:
-            s = sum(int(d) for d in str(s))
-        return s
+        """计算生命数字：年月日八位数字反复求和直到一位数，即其数根"""
+        number = birth_date["year"] * 10000 + birth_date["month"] * 100 + birth_date["day"]
+        # 数根闭式：各位数字之和与原数模 9 同余
+        return 1 + (number - 1) % 9 if number else 0
 
     @classmethod
     def analyze_patterns(cls, birth_date: Dict[str, int]) -> List[Dict[str, Any]]:
         """分析数字组合磁场"""
-        date_str = f"{birth_date['year']}{birth_date['month']:02d}{birth_date['day']:02d}"
+        return cls.analyze_digits(f"{birth_date['year']}{birth_date['month']:02d}{birth_date['day']:02d}")
+
+    @staticmethod
+    def analyze_digits(number: str) -> List[Dict[str, Any]]:
+        """
+        分析任意数字串（手机号、编码等）的数字组合磁场
+
+        非数字字符（空格、横线、加号等）先被去掉，再按相邻两位查表。
+
+        Args:
+            number: 数字串
+
+        Returns:
+            按出现顺序排列的磁场列表，格式同 analyze_patterns
+        """
+        digits = [c for c in number if "0" <= c <= "9"]
         res = []
-        for i in range(len(date_str) - 1):
-            combo = date_str[i:i+2]
-            for name, info in cls.DIGITAL_PATTERNS.items():
-                if combo in info["combos"]:
-                    res.append({
-                        "combo": combo,
-                        "pattern": name,
-                        "wuxing": info["wuxing"],
-                        "description": info["desc"]
-                    })
+        for i in range(len(digits) - 1):
+            combo = digits[i] + digits[i + 1]
+            k = PAIR_TABLE[int(combo)]
+            if k >= 0:
+                res.append(dict(_PATTERN_RESULTS[k], combo=combo))
         return res
+
+
+# 磁场编号即在 PATTERN_NAMES 中的下标
+PATTERN_NAMES = tuple(NumerologyAnalyzer.DIGITAL_PATTERNS)
+
+# 两位数字（00-99）-> 磁场编号，不构成磁场为 -1；各磁场的组合互不重叠
+PAIR_TABLE = np.full(100, -1, dtype=np.int8)
+for _k, _name in enumerate(PATTERN_NAMES):
+    for _combo in NumerologyAnalyzer.DIGITAL_PATTERNS[_name]["combos"]:
+        PAIR_TABLE[int(_combo)] = _k
+
+_PATTERN_RESULTS = [
+    {"combo": "", "pattern": name, "wuxing": info["wuxing"], "description": info["desc"]}
+    for name, info in NumerologyAnalyzer.DIGITAL_PATTERNS.items()
+]
+
+
+class DigitScan(NamedTuple):
+    """
+    一批数字串的磁场扫描结果
+
+    Attributes:
+        digits: N×L 数字矩阵（越界位置为 10）
+        lengths: 各数字串去掉非数字字符后的位数
+        hits: N×(L-1) 每个相邻两位窗口的磁场编号（PATTERN_NAMES 下标），无磁场或越界为 -1
+        counts: N×4 各磁场出现次数，列顺序同 PATTERN_NAMES
+    """
+    digits: np.ndarray
+    lengths: np.ndarray
+    hits: np.ndarray
+    counts: np.ndarray
+
+    def positions(self, i: int) -> List[Tuple[int, str]]:
+        """第 i 个数字串中出现磁场的 [(窗口起始位置, 磁场名称), ...]"""
+        return [(int(p), PATTERN_NAMES[self.hits[i, p]]) for p in np.flatnonzero(self.hits[i] >= 0)]
+
+    def patterns(self, i: int) -> List[Dict[str, Any]]:
+        """第 i 个数字串的磁场列表，格式同 NumerologyAnalyzer.analyze_digits"""
+        row = self.digits[i]
+        return [dict(_PATTERN_RESULTS[self.hits[i, p]], combo=f"{row[p]}{row[p + 1]}")
+                for p in np.flatnonzero(self.hits[i] >= 0)]
+
+
+def digit_matrix(numbers: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    把一批字符串转为数字矩阵，去掉非数字字符后左对齐
+
+    Returns:
+        (N×L uint8 数字矩阵（右侧补 10）, 各行位数)
+    """
+    if not len(numbers):
+        return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+    # 定长 Unicode 数组的每个字符即一个 uint32 码位，末尾补 0
+    chars = np.array(numbers, dtype=str)
+    width = chars.dtype.itemsize // 4
+    codes = chars.view(np.uint32).reshape(len(numbers), width)
+    valid = (codes >= 48) & (codes <= 57)
+    if not (valid[:, 1:] & ~valid[:, :-1]).any():
+        # 纯数字串（只有末尾补位）无需重排
+        return np.where(valid, codes - 48, 10).astype(np.uint8), valid.sum(axis=1)
+    # 稳定排序把数字挪到左侧并保持原有顺序
+    order = np.argsort(~valid, axis=1, kind="stable")
+    digits = np.where(np.take_along_axis(valid, order, axis=1),
+                      np.take_along_axis(codes, order, axis=1) - 48, 10).astype(np.uint8)
+    return digits, valid.sum(axis=1)
+
+
+def scan_digits(digits: np.ndarray, lengths: np.ndarray) -> DigitScan:
+    """
+    滑动窗口扫描数字矩阵中全部相邻两位组合
+
+    Args:
+        digits: N×L uint8 数字矩阵（digit_matrix 的结果，越界位置为 10）
+        lengths: 各行位数
+    """
+    n = len(digits)
+    if digits.shape[1] < 2:
+        return DigitScan(digits, lengths, np.full((n, 0), -1, dtype=np.int8),
+                         np.zeros((n, len(PATTERN_NAMES)), np.int32))
+    first, second = digits[:, :-1], digits[:, 1:]
+    pairs = first.astype(np.int64) * 10 + second
+    hits = np.where((first < 10) & (second < 10), PAIR_TABLE[pairs % 100], -1).astype(np.int8)
+    counts = np.stack([(hits == k).sum(axis=1) for k in range(len(PATTERN_NAMES))], axis=1).astype(np.int32)
+    return DigitScan(digits, lengths, hits, counts)
+
+
+def scan_numbers(numbers: Iterable[str], chunk_size: int = DEFAULT_CHUNK) -> Iterator[DigitScan]:
+    """
+    分块扫描大量数字串（可为生成器，如逐行读取的号码文件或数据库游标）
+
+    Args:
+        numbers: 数字串的可迭代对象，None 按空串处理
+        chunk_size: 每块条数
+
+    Returns:
+        DigitScan 生成器，每块一个，行顺序与输入一致
+    """
+    chunk = []
+    for number in numbers:
+        chunk.append(number or "")
+        if len(chunk) >= chunk_size:
+            yield scan_digits(*digit_matrix(chunk))
+            chunk = []
+    if chunk:
+        yield scan_digits(*digit_matrix(chunk))
+
+
+# YYYYMMDD 各位的位值
+_DATE_PLACES = 10 ** np.arange(7, -1, -1, dtype=np.int64)
+
+
+def life_numbers(years, months, days) -> np.ndarray:
+    """
+    批量计算生命数字（向量化，等价于逐个调用 calculate_life_number）
+
+    Args:
+        years, months, days: 等长的年、月、日数组
+
+    Returns:
+        int8 生命数字数组
+    """
+    number = (np.asarray(years, dtype=np.int64) * 10000 + np.asarray(months, dtype=np.int64) * 100
+              + np.asarray(days, dtype=np.int64))
+    return np.where(number > 0, 1 + (number - 1) % 9, 0).astype(np.int8)
+
+
+def date_digits(years, months, days) -> np.ndarray:
+    """
+    出生日期的八位数字矩阵（YYYYMMDD，四位年份）
+
+    Returns:
+        N×8 uint8 数字矩阵，可直接交给 scan_digits
+    """
+    number = (np.asarray(years, dtype=np.int64) * 10000 + np.asarray(months, dtype=np.int64) * 100
+              + np.asarray(days, dtype=np.int64))
+    return (number[:, None] // _DATE_PLACES % 10).astype(np.uint8)
+
+
+def analyze_dates(years, months, days) -> Tuple[np.ndarray, DigitScan]:
+    """
+    批量分析出生日期：生命数字与日期数字磁场（等价于逐个调用
+    calculate_life_number / analyze_patterns）
+
+    Returns:
+        (生命数字数组, DigitScan)，DigitScan.patterns(i) 即第 i 个日期的磁场列表
+    """
+    digits = date_digits(years, months, days)
+    return life_numbers(years, months, days), scan_digits(digits, np.full(len(digits), 8))
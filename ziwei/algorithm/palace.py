@@ -1,7 +1,8 @@
 from enum import Enum
 from typing import Tuple, List, Dict, Optional
 from datetime import datetime
-from lunarcalendar import Converter, Solar, Lunar
+import lunar_table
+from utils import TIAN_GAN, DI_ZHI, ZHI_INDEX, hour_branch
 
 
 class Palace(Enum):
@@ -22,8 +23,8 @@ class Palace(Enum):
 
 class GanZhiConverter:
     """天干地支转换工具类"""
-    TIAN_GAN = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
-    DI_ZHI = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+    TIAN_GAN = TIAN_GAN
+    DI_ZHI = DI_ZHI
 
     @staticmethod
     def get_gan_zhi(year: int) -> str:
@@ -40,42 +41,51 @@ class GanZhiConverter:
         1. 现代24小时制（0-23）
         2. 古代地支时辰（'子','丑'...）
         """
-        if isinstance(hour, int):
-            # 现代24小时制
-            return GanZhiConverter.DI_ZHI[((hour + 1) % 24) // 2]
-        elif hour in GanZhiConverter.DI_ZHI:
-            # 已经是地支时辰
-            return hour
-        else:
-            raise ValueError(f"无效的时辰格式: {hour}")
+        return DI_ZHI[hour_branch(hour)]
+
+
+# 按索引排列的宫位，与命宫/身宫索引一一对应
+PALACES = list(Palace)
 
 
 class LifePalaceCalculator:
     """紫微斗数命盘计算器"""
 
     @staticmethod
-    def calc_life_body_palace(month: int, hour_zhi: str) -> Tuple[Palace, Palace]:
-        # 参数验证增强
-        if not (1 <= month <= 12):
-            raise ValueError(f"月份必须在1-12之间，当前值: {month}")
+    def life_body_index(month: int, hour_branch: int) -> Tuple[int, int]:
+        """
+        计算命宫与身宫索引（整数编码）
 
-        if hour_zhi not in GanZhiConverter.DI_ZHI:
-            raise ValueError(f"无效的时辰地支: {hour_zhi}")
+        Args:
+            month: 农历月份（1-12）
+            hour_branch: 时辰地支索引（子=0）
 
-        # 地支到数字映射
-        HZ_NUM = {z: i for i, z in enumerate(GanZhiConverter.DI_ZHI)}
+        Returns:
+            (命宫索引, 身宫索引) 元组
+        """
+        if not (1 <= month <= 12):
+            raise ValueError(f"月份必须在1-12之间，当前值: {month}")
 
         # 命宫计算（更精确的公式）
         base_idx = 2  # 寅宫索引（正月）
         month_idx = (base_idx + month - 1) % 12
-        hour_steps = HZ_NUM[hour_zhi]
-        life_idx = (month_idx - hour_steps) % 12
+        life_idx = (month_idx - hour_branch) % 12
 
         # 身宫计算
-        body_idx = (base_idx + hour_steps) % 12
+        body_idx = (base_idx + hour_branch) % 12
+        return life_idx, body_idx
 
-        palaces = list(Palace)
-        return palaces[life_idx], palaces[body_idx]
+    @staticmethod
+    def calc_life_body_palace(month: int, hour_zhi: str) -> Tuple[Palace, Palace]:
+        # 参数验证增强
+        if not (1 <= month <= 12):
+            raise ValueError(f"月份必须在1-12之间，当前值: {month}")
+
+        if hour_zhi not in ZHI_INDEX:
+            raise ValueError(f"无效的时辰地支: {hour_zhi}")
+
+        life_idx, body_idx = LifePalaceCalculator.life_body_index(month, ZHI_INDEX[hour_zhi])
+        return PALACES[life_idx], PALACES[body_idx]
 
     @staticmethod
     def solar_to_lunar(
@@ -85,7 +95,7 @@ class LifePalaceCalculator:
             hour: int = 12
     ) -> Tuple[int, int, str]:
         """
-        使用LunarCalendar库将阳历转换为农历
+        将阳历转换为农历（查预生成的农历月表，见 lunar_table）
 
         Args:
             year: 阳历年份
@@ -96,15 +106,8 @@ class LifePalaceCalculator:
         Returns:
             (农历月份, 农历日期, 时辰地支) 元组
         """
-        # 创建阳历日期对象
-        solar_date = Solar(year, month, day)
-
-        # 转换为农历日期
-        lunar_date = Converter.Solar2Lunar(solar_date)
-
-        # 获取农历月份和日期
-        lunar_month = lunar_date.month
-        lunar_day = lunar_date.day
+        # 查表获取农历月份和日期
+        _, lunar_month, lunar_day, _ = lunar_table.solar_to_lunar(year, month, day)
 
         # 计算时辰地支
         hour_zhi = GanZhiConverter.get_hour_zhi(hour)
@@ -0,0 +1,145 @@
+# ziwei/algorithm/purchase_date.py
+"""
+吉日选购
+
+按日柱为用户挑选适合购入某件珠宝的日子，逐日评分：
+  1. 日柱纳音五行对珠宝五行的生克（生 > 比和 > 泄 > 耗 > 克）；
+  2. 日柱纳音五行对命盘最弱五行的生克（补足所缺）；
+  3. 日干四化：化禄星落命宫加分，化忌星落命宫减分；
+  4. 日支冲命宫减分。
+日柱只有六十种，先按命盘算出六十甲子各自的分数（U×60），日期区间内的日柱序号用
+数组运算一次求出，逐日分数只是一次取下标，多位用户可一并计算。
+"""
+import datetime
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from ganzhi_converter import GanZhiConverter, NAYIN_CODE, NAYIN_NAMES
+from luck_timeline import TRANSFORM_STARS
+from star_system import WUXING_ORDER, wuxing_scores
+
+# 生：GENERATES[a] 为 a 所生；克：OVERCOMES[a] 为 a 所克（WUXING_ORDER 下标）
+GENERATES = (2, 3, 1, 4, 0)  # 金生水、木生火、水生木、火生土、土生金
+OVERCOMES = (1, 4, 3, 0, 2)  # 金克木、木克土、水克火、火克金、土克水
+
+
+def _relation(a: int, b: int) -> float:
+    """五行 a 作用于五行 b 的吉凶分"""
+    if a == b:
+        return 0.8  # 比和
+    if GENERATES[a] == b:
+        return 1.0  # a 生 b
+    if GENERATES[b] == a:
+        return 0.2  # b 生 a，泄 b 之气
+    if OVERCOMES[b] == a:
+        return -0.3  # b 克 a，耗 b 之力
+    return -1.0  # a 克 b
+
+
+# RELATION[a, b]：五行 a 作用于五行 b 的吉凶分
+RELATION = np.array([[_relation(a, b) for b in range(5)] for a in range(5)])
+
+# 六十甲子 -> 纳音五行（WUXING_ORDER 下标）
+CYCLE_WUXING = np.array([WUXING_ORDER.index(NAYIN_NAMES[code][-1]) for code in NAYIN_CODE], dtype=np.int64)
+_CYCLES = np.arange(60)
+
+# 各项评分的权重
+WEAK_WEIGHT = 0.5  # 日柱纳音补命盘最弱五行
+LU_BONUS = 0.5  # 日干化禄星在命宫
+JI_PENALTY = 0.5  # 日干化忌星在命宫
+CLASH_PENALTY = 0.5  # 日支冲命宫
+
+
+def day_cycles(start: datetime.date, days: int) -> np.ndarray:
+    """
+    自 start 起连续 days 天的日柱六十甲子序号（同 GanZhiConverter.get_day_ganzhi 的基准）
+
+    Returns:
+        长度为 days 的 int64 数组
+    """
+    return (start.toordinal() - GanZhiConverter.DAY_BASE_ORDINAL + np.arange(days)) % 60
+
+
+def cycle_scores(records: Sequence, item_wuxing: Union[str, Sequence[str]]) -> np.ndarray:
+    """
+    按命盘算出六十甲子各日的评分
+
+    Args:
+        records: U 张 ChartRecord
+        item_wuxing: 珠宝五行（"金"等），单个值对所有命盘通用，或长度为 U 的序列
+
+    Returns:
+        U×60 评分矩阵，第 c 列对应 JIAZI[c] 日
+    """
+    n = len(records)
+    if isinstance(item_wuxing, str):
+        item_wuxing = [item_wuxing] * n
+    if len(item_wuxing) != n:
+        raise ValueError("珠宝五行的数量与命盘数量不一致")
+    try:
+        items = np.array([WUXING_ORDER.index(w) for w in item_wuxing], dtype=np.int64)
+    except ValueError:
+        raise ValueError(f"无效的五行: {item_wuxing}") from None
+
+    stars = np.frombuffer(b"".join(r.stars for r in records), dtype=np.uint8).reshape(n, -1).astype(np.int64)
+    life = np.array([r.life for r in records], dtype=np.int64)
+    weakest = wuxing_scores(stars).argmin(axis=1)
+
+    # 五行生克：日柱纳音 -> 珠宝五行、命盘最弱五行
+    scores = RELATION[CYCLE_WUXING[None, :], items[:, None]]
+    scores = scores + WEAK_WEIGHT * RELATION[CYCLE_WUXING[None, :], weakest[:, None]]
+
+    # 日干四化：先按十个天干求出化禄、化忌星是否在命宫（U×10），再按日干展开
+    in_life = stars[:, TRANSFORM_STARS.astype(np.int64)] == life[:, None, None]  # U×10×4
+    stem_scores = LU_BONUS * in_life[:, :, 0] - JI_PENALTY * in_life[:, :, 3]
+    scores += stem_scores[:, _CYCLES % 10]
+
+    # 日支冲命宫
+    scores -= CLASH_PENALTY * ((_CYCLES[None, :] % 12) == (life[:, None] + 6) % 12)
+    return scores
+
+
+def best_days_batch(records: Sequence, item_wuxing: Union[str, Sequence[str]], start: datetime.date,
+                    days: int = 30, k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量挑选吉日
+
+    Args:
+        records, item_wuxing: 同 cycle_scores
+        start: 起始日期
+        days: 扫描的天数
+        k: 每位用户取前 k 天
+
+    Returns:
+        (U×k 日期偏移（相对 start 的天数）, U×k 评分)，按评分从高到低排列，同分取较早的日期；
+        k <= 0 时为 U×0 的空数组
+    """
+    table = cycle_scores(records, item_wuxing)
+    daily = table[:, day_cycles(start, days)]
+    k = max(0, min(k, days))
+    order = np.argsort(-daily, axis=1, kind="stable")[:, :k]
+    return order, np.take_along_axis(daily, order, axis=1)
+
+
+def best_days(record, item_wuxing: str, start: datetime.date, days: int = 30, k: int = 5) -> List[Dict]:
+    """
+    为一张命盘挑选购入某五行珠宝的吉日
+
+    Args:
+        record: ChartRecord 命盘
+        item_wuxing: 珠宝五行
+        start: 起始日期
+        days: 扫描的天数（如 30 至 365）
+        k: 返回的天数
+
+    Returns:
+        [{"date": 日期, "ganzhi": 日柱, "nayin": 纳音, "score": 评分}, ...]，按评分从高到低；k <= 0 时为空
+    """
+    order, scores = best_days_batch([record], item_wuxing, start, days, k)
+    out = []
+    for offset, score in zip(order[0].tolist(), scores[0].tolist()):
+        date = start + datetime.timedelta(days=offset)
+        gz = GanZhiConverter.get_day_ganzhi(date)
+        out.append({"date": date, "ganzhi": gz, "nayin": GanZhiConverter.NAYIN[gz], "score": round(score, 4)})
+    return out
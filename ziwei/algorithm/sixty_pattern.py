@@ -1,5 +1,9 @@
 from enum import Enum
-from typing import List, Dict, Callable
+from typing import List, Dict, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from four_transform import YEAR_BY_STEM
 from star_system import StarSystem
 
 
@@ -23,178 +27,676 @@ class SixtyPattern(Enum):
     TIANXIANG_TANLANG = "天相贪狼"
     TIANLIANG_TANLANG = "天梁贪狼"
     QISHA_LIANZHEN = "七杀廉贞"
+    ZIWEI_QISHA = "紫杀同宫"
+    JUNCHEN_QINGHUI = "君臣庆会"
+    FUXIANG_CHAOYUAN = "府相朝垣"
+    RIYUE_BINGMING = "日月并明"
+    RIZHAO_LEIMEN = "日照雷门"
+    YUELANG_TIANMEN = "月朗天门"
+    YUESHENG_CANGHAI = "月生沧海"
+    RIYUE_FANBEI = "日月反背"
+    MINGZHU_CHUHAI = "明珠出海"
+    SHIZHONG_YINYU = "石中隐玉"
+    JINCAN_GUANGHUI = "金灿光辉"
+    QISHA_CHAODOU = "七杀朝斗"
+    XIONGSU_CHAOYUAN = "雄宿朝垣"
+    YINGXING_RUMIAO = "英星入庙"
+    JILIANG_JIAHUI = "机梁加会"
+    WENLIANG_ZHENJI = "文梁振纪"
+    TIANYI_GONGMING = "天乙拱命"
+    FUBI_GONGZHU = "辅弼拱主"
+    WENXING_GONGMING = "文星拱命"
+    ZUOGUI_XIANGGUI = "坐贵向贵"
+    LUMA_JIAOCHI = "禄马交驰"
+    SHUANGLU_CHAOYUAN = "双禄朝垣"
+    LUHE_YUANYANG = "禄合鸳鸯"
+    SANQI_JIAHUI = "三奇加会"
+    HUALU_SHOUMING = "化禄守命"
+    KEMING_HUILU = "科名会禄"
+    QUANLU_XUNFENG = "权禄巡逢"
+    LUWEN_GONGMING = "禄文拱命"
+    HUOTAN = "火贪格"
+    LINGTAN = "铃贪格"
+    JIANGXING_DEDI = "将星得地"
+    SHOUXING_RUMIAO = "寿星入庙"
+    JIXIANG_LIMING = "极向离明"
+    MATOU_DAIJIAN = "马头带箭"
+    JUHUO_TONGGONG = "巨火同宫"
+    FANSHUI_TAOHUA = "泛水桃花"
+    YANGTUO_ZHAOMING = "羊陀照命"
+    HUOLING_ZHAOMING = "火铃照命"
+    KONGJIE_ZHAOMING = "空劫照命"
+    MALUO_KONGWANG = "马落空亡"
+    HUAJI_SHOUMING = "化忌守命"
+
+
+# 相对命宫（或某星）的宫位偏移：本宫、三合、对宫
+SANHE = (0, 4, 8)
+SANFANG_SIZHENG = (0, 4, 6, 8)
+
+# 规则中可引用的位置：28颗星曜、命宫、年干四化所在星曜
+TRANSFORM_POINTS = ("化禄", "化权", "化科", "化忌")
+TRANSFORM_WUXING = {"化禄": "土", "化权": "木", "化科": "水", "化忌": "水"}
+POINTS = StarSystem.ALL + ["命宫"] + list(TRANSFORM_POINTS)
+POINT_INDEX = {p: i for i, p in enumerate(POINTS)}
+LIFE_POINT = POINT_INDEX["命宫"]
+
+# 位置缺失记为 12，位置对 (x, y) 的查表下标为 x * PAIR_STRIDE + y
+MISSING = 12
+PAIR_STRIDE = 13
 
 
 class PatternAnalyzer:
+    # 格局规则为声明式条件的组合（全部满足才成格），条件写法：
+    #   ("diff", A, B, 差值)   位置差 B - A（不取模，-11~11）属于给定差值
+    #   ("mod", A, B, 偏移)    (B - A) % 12 属于给定偏移，如同宫 (0,)、三方四正 SANFANG_SIZHENG
+    #   ("in", A, 地支)        A 落在给定地支（子=0）
+    # A、B 取自 POINTS：星曜名、"命宫" 或 "化禄"/"化权"/"化科"/"化忌"
+    # "wuxing" 取自条件所涉星曜的五行（四化按 TRANSFORM_WUXING，成对对冲的辅星含其对星）；
+    # 本仓库成对辅星恒对冲、地空地劫位置固定，部分传统的同宫、夹命条件无法出现，
+    # 这些格局改用可成立的近似条件，"note" 说明与传统定义的差异
     RULES = {
         SixtyPattern.ZIWEI_TIANFU: {
-            "stars": ("紫微", "天府"),
-            "check": lambda a, b: abs(a - b) == 6,
+            "when": (("diff", "紫微", "天府", (6, -6)),),
             "wuxing": "土",
             "score": 0.9,
             "desc": "紫府朝垣格，主富贵双全，一生顺遂"
         },
         SixtyPattern.JIYUE_TONGLIANG: {
-            "stars": ("天机", "太阴", "天同", "天梁"),
-            "check": lambda a, b, c, d: all(p % 3 == 0 for p in {a, b, c, d}),
+            "when": (("in", "天机", (0, 3, 6, 9)), ("in", "太阴", (0, 3, 6, 9)),
+                     ("in", "天同", (0, 3, 6, 9)), ("in", "天梁", (0, 3, 6, 9))),
             "wuxing": "水木",
             "score": 0.8,
             "desc": "机月同梁格，主聪明巧智，适合文职或技术工作"
         },
         SixtyPattern.TAIYANG_TAIYIN: {
-            "stars": ("太阳", "太阴"),
-            "check": lambda a, b: abs(a - b) == 6,
+            "when": (("diff", "太阳", "太阴", (6, -6)),),
             "wuxing": "火水",
             "score": 0.7,
             "desc": "太阳太阴格，主阴阳调和，一生多贵人相助"
         },
         SixtyPattern.WUQU_TIANXIANG: {
-            "stars": ("武曲", "天相"),
-            "check": lambda a, b: abs(a - b) == 3,
+            "when": (("diff", "武曲", "天相", (3, -3)),),
             "wuxing": "金水",
             "score": 0.75,
             "desc": "武曲天相格，主刚毅果决，适合从事金融或管理工作"
         },
         SixtyPattern.QISHA_POJUN: {
-            "stars": ("七杀", "破军"),
-            "check": lambda a, b: abs(a - b) == 3,
+            "when": (("diff", "七杀", "破军", (3, -3)),),
             "wuxing": "金",
             "score": 0.65,
             "desc": "七杀破军格，主人生多变，需经历磨练方能成功"
         },
         SixtyPattern.ZIWEI_TIANJI: {
-            "stars": ("紫微", "天机"),
-            "check": lambda a, b: abs(a - b) == 1,
+            "when": (("diff", "紫微", "天机", (1, -1)),),
             "wuxing": "土木",
             "score": 0.85,
             "desc": "紫微天机格，主智慧过人，善于谋略规划"
         },
         SixtyPattern.ZIWEI_TAIYANG: {
-            "stars": ("紫微", "太阳"),
-            "check": lambda a, b: abs(a - b) == 2,
+            "when": (("diff", "紫微", "太阳", (2, -2)),),
             "wuxing": "土火",
             "score": 0.85,
             "desc": "紫微太阳格，主贵气十足，适合从政或公众事业"
         },
         SixtyPattern.ZIWEI_LIANZHEN: {
-            "stars": ("紫微", "廉贞"),
-            "check": lambda a, b: abs(a - b) == 5,
+            "when": (("diff", "紫微", "廉贞", (5, -5)),),
             "wuxing": "土火水",
             "score": 0.8,
             "desc": "紫微廉贞格，主才华横溢，但需注意人际关系"
         },
         SixtyPattern.TIANFU_TAIYIN: {
-            "stars": ("天府", "太阴"),
-            "check": lambda a, b: abs(a - b) == 3,
+            "when": (("diff", "天府", "太阴", (3, -3)),),
             "wuxing": "土水",
             "score": 0.75,
             "desc": "天府太阴格，主温和富态，擅长理财持家"
         },
         SixtyPattern.TIANFU_TANLANG: {
-            "stars": ("天府", "贪狼"),
-            "check": lambda a, b: abs(a - b) == 4,
+            "when": (("diff", "天府", "贪狼", (4, -4)),),
             "wuxing": "土木水",
             "score": 0.7,
             "desc": "天府贪狼格，主多才多艺，交际能力强"
         },
         SixtyPattern.TIANFU_JUMEN: {
-            "stars": ("天府", "巨门"),
-            "check": lambda a, b: abs(a - b) == 5,
+            "when": (("diff", "天府", "巨门", (5, -5)),),
             "wuxing": "土",
             "score": 0.65,
             "desc": "天府巨门格，主性格耿直，适合法律或研究工作"
         },
         SixtyPattern.TIANJI_TAIYIN: {
-            "stars": ("天机", "太阴"),
-            "check": lambda a, b: abs(a - b) == 2,
+            "when": (("diff", "天机", "太阴", (2, -2)),),
             "wuxing": "木水",
             "score": 0.7,
             "desc": "天机太阴格，主心思细腻，适合艺术或策划工作"
         },
         SixtyPattern.TIANJI_JUMEN: {
-            "stars": ("天机", "巨门"),
-            "check": lambda a, b: abs(a - b) == 4,
+            "when": (("diff", "天机", "巨门", (4, -4)),),
             "wuxing": "木土",
             "score": 0.6,
             "desc": "天机巨门格，主口才出众，适合销售或教育工作"
         },
         SixtyPattern.TAIYANG_LIANZHEN: {
-            "stars": ("太阳", "廉贞"),
-            "check": lambda a, b: abs(a - b) == 3,
+            "when": (("diff", "太阳", "廉贞", (3, -3)),),
             "wuxing": "火水",
             "score": 0.7,
             "desc": "太阳廉贞格，主热情积极，但需注意情绪管理"
         },
         SixtyPattern.WUQU_LIANZHEN: {
-            "stars": ("武曲", "廉贞"),
-            "check": lambda a, b: abs(a - b) == 2,
+            "when": (("diff", "武曲", "廉贞", (2, -2)),),
             "wuxing": "金水火",
             "score": 0.7,
             "desc": "武曲廉贞格，主坚毅果敢，适合军警或工程工作"
         },
         SixtyPattern.WUQU_TANLANG: {
-            "stars": ("武曲", "贪狼"),
-            "check": lambda a, b: abs(a - b) == 1,
+            "when": (("diff", "武曲", "贪狼", (1, -1)),),
             "wuxing": "金木水",
             "score": 0.65,
             "desc": "武曲贪狼格，主敢作敢为，适合创业或冒险事业"
         },
         SixtyPattern.TIANXIANG_TANLANG: {
-            "stars": ("天相", "贪狼"),
-            "check": lambda a, b: abs(a - b) == 2,
+            "when": (("diff", "天相", "贪狼", (2, -2)),),
             "wuxing": "水木",
             "score": 0.6,
             "desc": "天相贪狼格，主八面玲珑，适合公关或外交工作"
         },
         SixtyPattern.TIANLIANG_TANLANG: {
-            "stars": ("天梁", "贪狼"),
-            "check": lambda a, b: abs(a - b) == 5,
+            "when": (("diff", "天梁", "贪狼", (5, -5)),),
             "wuxing": "土水木",
             "score": 0.6,
             "desc": "天梁贪狼格，主聪明伶俐，但需注意脚踏实地"
         },
         SixtyPattern.QISHA_LIANZHEN: {
-            "stars": ("七杀", "廉贞"),
-            "check": lambda a, b: abs(a - b) == 1,
+            "when": (("diff", "七杀", "廉贞", (1, -1)),),
             "wuxing": "金火",
             "score": 0.55,
             "desc": "七杀廉贞格，主性格刚烈，需注意克制冲动"
+        },
+        SixtyPattern.ZIWEI_QISHA: {
+            "when": (("mod", "命宫", "紫微", (0,)), ("mod", "紫微", "七杀", (0,))),
+            "wuxing": "土金",
+            "score": 0.75,
+            "desc": "紫杀同宫格，主化杀为权，魄力十足，宜掌实权"
+        },
+        SixtyPattern.JUNCHEN_QINGHUI: {
+            "when": (("mod", "命宫", "紫微", (0,)), ("mod", "命宫", "左辅", SANFANG_SIZHENG),
+                     ("mod", "命宫", "右弼", SANFANG_SIZHENG)),
+            "wuxing": "土",
+            "score": 0.95,
+            "desc": "君臣庆会格，紫微坐命得左右辅佐，主位高权重，众望所归"
+        },
+        SixtyPattern.FUXIANG_CHAOYUAN: {
+            "when": (("mod", "命宫", "天府", SANHE), ("mod", "命宫", "天相", SANHE)),
+            "wuxing": "土水",
+            "score": 0.85,
+            "desc": "府相朝垣格，主衣禄丰足，为人稳重，宜居要职"
+        },
+        SixtyPattern.RIYUE_BINGMING: {
+            "when": (("in", "太阳", (3, 4, 5, 6)), ("in", "太阴", (8, 9, 10, 11, 0))),
+            "wuxing": "火水",
+            "score": 0.85,
+            "desc": "日月并明格，日月皆得地，主光明磊落，名利双收",
+            "note": "传统为命坐丑宫、太阳在巳太阴在酉（或命在未、日卯月亥）；此处只要求日月各在得地宫位，不看命宫"
+        },
+        SixtyPattern.RIZHAO_LEIMEN: {
+            "when": (("mod", "命宫", "太阳", (0,)), ("in", "太阳", (3,))),
+            "wuxing": "火",
+            "score": 0.8,
+            "desc": "日照雷门格，太阳在卯坐命，主志向远大，早年发达"
+        },
+        SixtyPattern.YUELANG_TIANMEN: {
+            "when": (("mod", "命宫", "太阴", (0,)), ("in", "太阴", (11,))),
+            "wuxing": "水",
+            "score": 0.8,
+            "desc": "月朗天门格，太阴在亥坐命，主清秀聪慧，富足安稳"
+        },
+        SixtyPattern.YUESHENG_CANGHAI: {
+            "when": (("mod", "命宫", "太阴", (0,)), ("in", "太阴", (0,))),
+            "wuxing": "水",
+            "score": 0.75,
+            "desc": "月生沧海格，太阴在子坐命，主文雅清贵，宜文职",
+            "note": "传统为太阴、天同同在子宫坐命；此处不要求天同同宫"
+        },
+        SixtyPattern.RIYUE_FANBEI: {
+            "when": (("in", "太阳", (9, 10, 11, 0)), ("in", "太阴", (2, 3, 4, 5, 6))),
+            "wuxing": "火水",
+            "score": 0.35,
+            "desc": "日月反背格，日月皆失辉，主劳碌奔波，宜先难后易",
+            "note": "传统为太阳在戌亥子、太阴在卯辰巳并坐命；此处范围放宽为太阳酉至子、太阴寅至午，且不看命宫"
+        },
+        SixtyPattern.MINGZHU_CHUHAI: {
+            "when": (("in", "命宫", (7,)), ("in", "太阳", (3,))),
+            "wuxing": "火",
+            "score": 0.85,
+            "desc": "明珠出海格，命在未宫而太阳在卯会照，主才华出众，财官双美",
+            "note": "传统还要求未宫命宫无主星、太阴在亥会照；本仓库太阳在卯时太阴恒在子，只看命在未、太阳在卯"
+        },
+        SixtyPattern.SHIZHONG_YINYU: {
+            "when": (("mod", "命宫", "巨门", (0,)), ("in", "巨门", (0, 6))),
+            "wuxing": "土",
+            "score": 0.7,
+            "desc": "石中隐玉格，巨门在子午坐命，主大器晚成，宜低调积累",
+            "note": "传统还要求禄、权、科会照；此处只看巨门在子午坐命"
+        },
+        SixtyPattern.JINCAN_GUANGHUI: {
+            "when": (("mod", "命宫", "太阳", (0,)), ("in", "太阳", (6,))),
+            "wuxing": "火",
+            "score": 0.85,
+            "desc": "金灿光辉格，太阳在午坐命，主光明显达，富贵荣华"
+        },
+        SixtyPattern.QISHA_CHAODOU: {
+            "when": (("mod", "命宫", "七杀", (0,)), ("in", "七杀", (0, 2, 6, 8))),
+            "wuxing": "金",
+            "score": 0.75,
+            "desc": "七杀朝斗格，主威猛果断，有开创之才"
+        },
+        SixtyPattern.XIONGSU_CHAOYUAN: {
+            "when": (("mod", "命宫", "廉贞", (0,)), ("in", "廉贞", (2, 8))),
+            "wuxing": "火水",
+            "score": 0.7,
+            "desc": "雄宿朝垣格，廉贞在寅申坐命，主刚正有为，富贵可期"
+        },
+        SixtyPattern.YINGXING_RUMIAO: {
+            "when": (("mod", "命宫", "破军", (0,)), ("in", "破军", (0, 6))),
+            "wuxing": "水",
+            "score": 0.7,
+            "desc": "英星入庙格，破军在子午坐命，主勇于开拓，威权出众"
+        },
+        SixtyPattern.JILIANG_JIAHUI: {
+            "when": (("mod", "命宫", "天机", (0,)), ("mod", "天机", "天梁", (0,))),
+            "wuxing": "木土",
+            "score": 0.75,
+            "desc": "机梁加会格，主善谋能辩，宜策划、咨询之职"
+        },
+        SixtyPattern.WENLIANG_ZHENJI: {
+            "when": (("mod", "命宫", "天梁", (0,)), ("mod", "命宫", "文昌", SANFANG_SIZHENG)),
+            "wuxing": "土木",
+            "score": 0.75,
+            "desc": "文梁振纪格，主清正廉明，宜从事监察、法律工作",
+            "note": "传统为天梁与文昌或文曲同宫坐命；此处放宽为文昌在命宫三方四正"
+        },
+        SixtyPattern.TIANYI_GONGMING: {
+            "when": (("mod", "命宫", "天魁", SANHE),),
+            "wuxing": "金",
+            "score": 0.7,
+            "desc": "天乙拱命格，天魁会照命宫，主逢凶化吉，常得长辈提携",
+            "note": "传统为魁钺在命宫三方拱照；本仓库天钺恒在天魁对宫，只看天魁在命宫三合"
+        },
+        SixtyPattern.FUBI_GONGZHU: {
+            "when": (("mod", "命宫", "紫微", (4, 6, 8)), ("mod", "命宫", "左辅", (0, 6))),
+            "wuxing": "土",
+            "score": 0.8,
+            "desc": "辅弼拱主格，紫微会照而左右守命，主得众人扶持",
+            "note": "传统为紫微坐命、左辅右弼在三方拱照；本仓库左右恒对冲，改为紫微在三方会照、左右一守命一在迁移"
+        },
+        SixtyPattern.WENXING_GONGMING: {
+            "when": (("mod", "命宫", "文昌", (0, 6)),),
+            "wuxing": "木水",
+            "score": 0.65,
+            "desc": "文星拱命格，昌曲照命，主聪颖好学，文采出众",
+            "note": "传统为昌曲同守命宫或夹命；本仓库昌曲恒对冲，改为昌曲一守命一在迁移"
+        },
+        SixtyPattern.ZUOGUI_XIANGGUI: {
+            "when": (("mod", "命宫", "天魁", (0,)), ("mod", "命宫", "天钺", (6,))),
+            "wuxing": "金",
+            "score": 0.75,
+            "desc": "坐贵向贵格，魁钺相对拱命，主一生多遇贵人提携"
+        },
+        SixtyPattern.LUMA_JIAOCHI: {
+            "when": (("mod", "禄存", "天马", (0,)),),
+            "wuxing": "土火",
+            "score": 0.8,
+            "desc": "禄马交驰格，主远行得财，宜经商贸易",
+            "note": "传统为禄存或化禄与天马同宫于命、财、迁移等宫；此处只看禄存与天马同宫，不限宫位"
+        },
+        SixtyPattern.SHUANGLU_CHAOYUAN: {
+            "when": (("mod", "命宫", "禄存", SANFANG_SIZHENG), ("mod", "命宫", "化禄", SANFANG_SIZHENG)),
+            "wuxing": "土",
+            "score": 0.85,
+            "desc": "双禄朝垣格，主财源广进，富足有余"
+        },
+        SixtyPattern.LUHE_YUANYANG: {
+            "when": (("mod", "命宫", "禄存", (0,)), ("mod", "禄存", "化禄", (0,))),
+            "wuxing": "土",
+            "score": 0.85,
+            "desc": "禄合鸳鸯格，禄存化禄同守命宫，主财禄丰厚"
+        },
+        SixtyPattern.SANQI_JIAHUI: {
+            "when": (("mod", "命宫", "化禄", SANFANG_SIZHENG), ("mod", "命宫", "化权", SANFANG_SIZHENG),
+                     ("mod", "命宫", "化科", SANFANG_SIZHENG)),
+            "wuxing": "土木水",
+            "score": 0.9,
+            "desc": "三奇加会格，禄权科会照命宫，主名利双收，事业显达"
+        },
+        SixtyPattern.HUALU_SHOUMING: {
+            "when": (("mod", "命宫", "化禄", (0,)),),
+            "wuxing": "土",
+            "score": 0.8,
+            "desc": "化禄守命格，主人缘财运俱佳，一生衣食无忧"
+        },
+        SixtyPattern.KEMING_HUILU: {
+            "when": (("mod", "命宫", "化科", (0,)), ("mod", "命宫", "化禄", SANFANG_SIZHENG)),
+            "wuxing": "水土",
+            "score": 0.8,
+            "desc": "科名会禄格，主声名远播，名利兼得"
+        },
+        SixtyPattern.QUANLU_XUNFENG: {
+            "when": (("mod", "命宫", "化权", (0,)), ("mod", "命宫", "化禄", SANFANG_SIZHENG)),
+            "wuxing": "木土",
+            "score": 0.8,
+            "desc": "权禄巡逢格，主掌权得财，宜管理经营"
+        },
+        SixtyPattern.LUWEN_GONGMING: {
+            "when": (("mod", "命宫", "禄存", (0,)), ("mod", "命宫", "文昌", SANFANG_SIZHENG)),
+            "wuxing": "土木",
+            "score": 0.75,
+            "desc": "禄文拱命格，主文才生财，宜文化教育事业"
+        },
+        SixtyPattern.HUOTAN: {
+            "when": (("mod", "贪狼", "火星", (0,)),),
+            "wuxing": "木火",
+            "score": 0.7,
+            "desc": "火贪格，主横发之财，但需防大起大落",
+            "note": "传统为贪狼与火星同宫坐命（以辰戌丑未为佳）；此处只看同宫，不要求坐命"
+        },
+        SixtyPattern.LINGTAN: {
+            "when": (("mod", "贪狼", "铃星", (0,)),),
+            "wuxing": "木火",
+            "score": 0.65,
+            "desc": "铃贪格，主偏财机遇，宜把握时机见好就收",
+            "note": "传统为贪狼与铃星同宫坐命（以辰戌丑未为佳）；此处只看同宫，不要求坐命"
+        },
+        SixtyPattern.JIANGXING_DEDI: {
+            "when": (("mod", "命宫", "武曲", (0,)), ("in", "武曲", (1, 4, 7, 10))),
+            "wuxing": "金",
+            "score": 0.75,
+            "desc": "将星得地格，武曲在四墓坐命，主刚毅有谋，宜财经武职"
+        },
+        SixtyPattern.SHOUXING_RUMIAO: {
+            "when": (("mod", "命宫", "天梁", (0,)), ("in", "天梁", (6,))),
+            "wuxing": "土",
+            "score": 0.75,
+            "desc": "寿星入庙格，天梁在午坐命，主福寿绵长，为人清高"
+        },
+        SixtyPattern.JIXIANG_LIMING: {
+            "when": (("mod", "命宫", "紫微", (0,)), ("in", "紫微", (6,))),
+            "wuxing": "土",
+            "score": 0.9,
+            "desc": "极向离明格，紫微在午坐命，主尊贵显赫，福泽深厚"
+        },
+        SixtyPattern.MATOU_DAIJIAN: {
+            "when": (("mod", "命宫", "擎羊", (0,)), ("in", "擎羊", (6,))),
+            "wuxing": "金",
+            "score": 0.6,
+            "desc": "马头带箭格，擎羊在午守命，主历经艰险而后威震一方"
+        },
+        SixtyPattern.JUHUO_TONGGONG: {
+            "when": (("mod", "命宫", "巨门", (0,)), ("mod", "巨门", "火星", (0,))),
+            "wuxing": "土火",
+            "score": 0.3,
+            "desc": "巨火同宫格，主是非口舌较多，需谨言慎行"
+        },
+        SixtyPattern.FANSHUI_TAOHUA: {
+            "when": (("in", "贪狼", (0,)), ("mod", "贪狼", "擎羊", (0,))),
+            "wuxing": "木水",
+            "score": 0.35,
+            "desc": "泛水桃花格，主感情丰富，需防因情生扰",
+            "note": "传统为贪狼与擎羊同在子宫坐命；此处不要求坐命"
+        },
+        SixtyPattern.YANGTUO_ZHAOMING: {
+            "when": (("mod", "命宫", "擎羊", (0, 6)),),
+            "wuxing": "金",
+            "score": 0.4,
+            "desc": "羊陀照命格，主性急多争，宜修身养性",
+            "note": "传统羊陀分居禄存前后，可夹命；本仓库陀罗恒在擎羊对宫，改为羊陀一守命一在迁移"
+        },
+        SixtyPattern.HUOLING_ZHAOMING: {
+            "when": (("mod", "命宫", "火星", (0, 6)),),
+            "wuxing": "火",
+            "score": 0.4,
+            "desc": "火铃照命格，主性情急躁，做事需防虎头蛇尾",
+            "note": "传统火铃可同宫或夹命；本仓库铃星恒在火星对宫，改为火铃一守命一在迁移"
+        },
+        SixtyPattern.KONGJIE_ZHAOMING: {
+            "when": (("mod", "命宫", "地空", (0, 6)),),
+            "wuxing": "土",
+            "score": 0.35,
+            "desc": "空劫照命格，主想法独特，但财来财去，宜稳健理财",
+            "note": "传统空劫按时辰安星；本仓库地空地劫固定在戌、卯，只看地空守命或在迁移"
+        },
+        SixtyPattern.MALUO_KONGWANG: {
+            "when": (("mod", "天马", "地空", (0,)),),
+            "wuxing": "火土",
+            "score": 0.4,
+            "desc": "马落空亡格，主奔波少成，宜守不宜攻",
+            "note": "传统空亡指旬空、截空；本仓库不安旬空截空，以天马与地空同宫代替"
+        },
+        SixtyPattern.HUAJI_SHOUMING: {
+            "when": (("mod", "命宫", "化忌", (0,)),),
+            "wuxing": "水",
+            "score": 0.3,
+            "desc": "化忌守命格，主多思多虑，凡事需多加斟酌"
         }
     }
 
     @staticmethod
-    def identify(major_pos: Dict[str, int]) -> List[Dict]:
+    def identify(major_pos: Dict[str, int], aux_pos: Optional[Dict[str, int]] = None,
+                 life: Optional[int] = None, year_stem: Optional[int] = None) -> List[Dict]:
         """
         识别命盘中的六十星系格局
 
         Args:
             major_pos: 主星星曜位置字典，格式为 {星曜名称: 宫位索引}
+            aux_pos: 辅星星曜位置字典，缺省时不识别依赖辅星的格局
+            life: 命宫地支索引，缺省时不识别依赖命宫的格局
+            year_stem: 年干索引（甲=0），缺省时不识别依赖四化的格局
 
         Returns:
             包含所有识别到的格局信息的列表，每个格局包含名称、五行、评分和描述
         """
-        identified_patterns = []
-
-        for pattern, rule in PatternAnalyzer.RULES.items():
-            stars = rule["stars"]
-            required_stars = set(stars)
-            present_stars = required_stars & set(major_pos.keys())
-
-            # 检查是否所有格局所需星曜都存在
-            if present_stars != required_stars:
-                continue
-
-            # 获取星曜位置
-            positions = [major_pos[star] for star in stars]
-
-            # 检查格局规则
-            check_func = rule["check"]
-            if check_func(*positions):
-                identified_patterns.append({
-                    "name": pattern.value,
-                    "wuxing": rule["wuxing"],
-                    "score": rule["score"],
-                    "desc": rule["desc"]
-                })
-
-        return identified_patterns
+        stars = dict(major_pos, **(aux_pos or {}))
+        positions = [stars.get(star) for star in StarSystem.ALL]
+        return PatternAnalyzer.identify_positions(positions, life, year_stem)
+
+    @staticmethod
+    def identify_positions(positions: Sequence[Optional[int]], life: Optional[int] = None,
+                           year_stem: Optional[int] = None) -> List[Dict]:
+        """
+        按星曜位置列表识别格局（整数编码输入）
+
+        Args:
+            positions: 按 StarSystem.ALL 顺序排列的宫位索引（可只给前14颗主星），缺失的星曜为 None
+            life: 命宫地支索引
+            year_stem: 年干索引（甲=0）
+
+        Returns:
+            同 identify
+        """
+        return PatternAnalyzer.from_mask(PatternAnalyzer.identify_mask(positions, life, year_stem))
+
+    @staticmethod
+    def identify_mask(positions: Sequence[Optional[int]], life: Optional[int] = None,
+                      year_stem: Optional[int] = None, major_mask: Optional[int] = None,
+                      day_conditions: Optional[int] = None) -> int:
+        """
+        一次遍历识别全部格局，返回位图（第 i 位对应 PATTERN_LIST[i]）
+
+        先查表求出所有不重复条件的真假（每个条件一次列表下标），再对每条规则做一次位掩码比较。
+
+        Args:
+            positions, life, year_stem: 同 identify_positions
+            major_mask: 已知的纯主星格局位图（见 MAJOR_RULES_MASK，可按主星布局预先算好），
+                给出时只计算依赖辅星、命宫或四化的格局
+            day_conditions: 与 major_mask 同时给出，为 day_conditions() 预先求出的不随时辰变化的条件位，
+                此时只再求依赖命宫、天马的条件
+        """
+        points = _points(positions, life, year_stem)
+        if major_mask is None:
+            lookup, rules, mask = _ALL_RULES.lookup, _ALL_RULES.rules, 0
+        elif day_conditions is None:
+            lookup, rules, mask = _CONTEXT_RULES.lookup, _CONTEXT_RULES.rules, major_mask
+        else:
+            lookup, rules, mask = _HOUR_LOOKUP, _CONTEXT_RULES.rules, major_mask
+
+        satisfied = day_conditions or 0
+        for i, j, table in lookup:
+            satisfied |= table[points[i] * PAIR_STRIDE + points[j]]
+
+        for bit, required in rules:
+            if satisfied & required == required:
+                mask |= 1 << bit
+        return mask
+
+    @staticmethod
+    def day_conditions(positions: Sequence[Optional[int]], year_stem: Optional[int] = None) -> int:
+        """
+        预先求出不随时辰变化的条件（不涉及命宫、天马），供同一天的各时辰共用
+
+        同一年干下除天马外的辅星与四化星位置都相同，因此结果可传给
+        identify_mask(..., major_mask=..., day_conditions=...) 逐时辰复用。
+
+        Args:
+            positions, year_stem: 同 identify_positions（命宫、天马的位置不参与）
+        """
+        points = _points(positions, None, year_stem)
+        satisfied = 0
+        for i, j, table in _DAY_LOOKUP:
+            satisfied |= table[points[i] * PAIR_STRIDE + points[j]]
+        return satisfied
+
+    @staticmethod
+    def identify_batch(stars, life=None, year_stem=None) -> np.ndarray:
+        """
+        批量识别格局（向量化，等价于逐行调用 identify_mask）
+
+        Args:
+            stars: N×28 星曜位置矩阵（StarSystem.ALL 顺序），也可只给前14列主星
+            life: 长度为 N 的命宫地支索引，缺省时依赖命宫的格局均不成立
+            year_stem: 长度为 N 的年干索引，缺省时依赖四化的格局均不成立
+
+        Returns:
+            长度为 N 的 uint64 格局位图数组
+        """
+        stars = np.asarray(stars, dtype=np.int64)
+        n = len(stars)
+        points = np.full((n, len(POINTS)), MISSING, dtype=np.int64)
+        points[:, :stars.shape[1]] = stars
+        if life is not None:
+            points[:, LIFE_POINT] = life
+        if year_stem is not None:
+            trans_idx = _TRANSFORM_STAR_ARR[np.asarray(year_stem, dtype=np.int64)]
+            points[:, LIFE_POINT + 1:] = np.take_along_axis(points[:, :LIFE_POINT], trans_idx, axis=1)
+
+        satisfied = np.empty((n, len(_ALL_RULES.arrays)), dtype=bool)
+        for c, (i, j, table) in enumerate(_ALL_RULES.arrays):
+            satisfied[:, c] = table[points[:, i] * PAIR_STRIDE + points[:, j]]
+
+        mask = np.zeros(n, dtype=np.uint64)
+        for bit, cond_idx in _ALL_RULES.rule_columns:
+            hit = satisfied[:, cond_idx].all(axis=1)
+            mask |= hit.astype(np.uint64) << np.uint64(bit)
+        return mask
+
+    @staticmethod
+    def from_mask(mask: int) -> List[Dict]:
+        """格局位图转为格局信息列表（名称、五行、评分、描述）"""
+        return [dict(_PATTERN_INFO[bit]) for bit in range(len(_PATTERN_INFO)) if mask >> bit & 1]
+
+
+# 格局编号即在 PATTERN_LIST 中的下标
+PATTERN_LIST = list(PatternAnalyzer.RULES)
+
+
+def _points(positions: Sequence[Optional[int]], life: Optional[int], year_stem: Optional[int]) -> List[int]:
+    """按 POINTS 顺序展开的宫位列表，缺失的位置为 MISSING"""
+    points = [MISSING if p is None else p for p in positions]
+    points += [MISSING] * (len(StarSystem.ALL) - len(points))
+    points.append(MISSING if life is None else life)
+    if year_stem is None:
+        points += [MISSING] * len(TRANSFORM_POINTS)
+    else:
+        points += [points[i] for i in _TRANSFORM_STARS[year_stem]]
+    return points
+
+
+def _compile_condition(cond: Tuple) -> Tuple[int, int, int]:
+    """
+    把一条声明式条件编译为 (位置i, 位置j, 位置对查表位图)
+
+    查表下标为 pos[i] * PAIR_STRIDE + pos[j]，任一位置缺失（MISSING）时对应位恒为 0；
+    "in" 条件只看一个位置，取 i == j。
+    """
+    op = cond[0]
+    if op == "in":
+        _, a, branches = cond
+        i = j = POINT_INDEX[a]
+        holds = lambda x, y: x in branches
+    elif op == "diff":
+        _, a, b, diffs = cond
+        i, j = POINT_INDEX[a], POINT_INDEX[b]
+        holds = lambda x, y: y - x in diffs
+    elif op == "mod":
+        _, a, b, offsets = cond
+        i, j = POINT_INDEX[a], POINT_INDEX[b]
+        holds = lambda x, y: (y - x) % 12 in offsets
+    else:
+        raise ValueError(f"未知的格局条件: {cond}")
+    table = sum(1 << (x * PAIR_STRIDE + y) for x in range(12) for y in range(12) if holds(x, y))
+    return i, j, table
+
+
+class _CompiledRules(NamedTuple):
+    """一组规则编译后的查表结构"""
+    lookup: List[Tuple[int, int, List[int]]]  # 单条模式：169 项列表，成立时取值为该条件在 satisfied 中的位
+    arrays: List[Tuple[int, int, np.ndarray]]  # 批量模式：同样的查表，换成布尔数组
+    rules: List[Tuple[int, int]]  # (格局位, 所需条件位掩码)
+    rule_columns: List[Tuple[int, np.ndarray]]  # (格局位, 所需条件的列下标)
+
+
+def _compile_rules(patterns: Sequence[SixtyPattern]) -> _CompiledRules:
+    """编译一组规则：条件去重后生成查表，并记下每条规则所需条件的位掩码"""
+    conditions, index, rules = [], {}, []
+    for pattern in patterns:
+        required = 0
+        for cond in PatternAnalyzer.RULES[pattern]["when"]:
+            compiled = _compile_condition(cond)
+            if compiled not in index:
+                index[compiled] = len(conditions)
+                conditions.append(compiled)
+            required |= 1 << index[compiled]
+        rules.append((PATTERN_LIST.index(pattern), required))
+
+    n_pairs = PAIR_STRIDE * PAIR_STRIDE
+    return _CompiledRules(
+        lookup=[(i, j, [(table >> k & 1) << c for k in range(n_pairs)]) for c, (i, j, table) in enumerate(conditions)],
+        arrays=[(i, j, np.array([table >> k & 1 for k in range(n_pairs)], dtype=bool)) for i, j, table in conditions],
+        rules=rules,
+        rule_columns=[(bit, np.array([c for c in range(len(conditions)) if required >> c & 1], dtype=np.int64))
+                      for bit, required in rules],
+    )
+
+
+def _is_major_only(pattern: SixtyPattern) -> bool:
+    """规则是否只引用十四主星"""
+    compiled = [_compile_condition(cond) for cond in PatternAnalyzer.RULES[pattern]["when"]]
+    return all(max(i, j) < len(StarSystem.MAJOR) for i, j, _ in compiled)
+
+
+# 只依赖十四主星的格局，可按主星布局预先计算
+MAJOR_RULES_MASK = sum(1 << bit for bit, p in enumerate(PATTERN_LIST) if _is_major_only(p))
+
+_ALL_RULES = _compile_rules(PATTERN_LIST)
+_CONTEXT_RULES = _compile_rules([p for bit, p in enumerate(PATTERN_LIST) if not MAJOR_RULES_MASK >> bit & 1])
+
+# 随时辰变化的位置：命宫，以及部分月份落在命宫的天马；其余条件同一天各时辰相同
+HOUR_POINTS = (LIFE_POINT, POINT_INDEX["天马"])
+_DAY_LOOKUP = [c for c in _CONTEXT_RULES.lookup if c[0] not in HOUR_POINTS and c[1] not in HOUR_POINTS]
+_HOUR_LOOKUP = [c for c in _CONTEXT_RULES.lookup if c[0] in HOUR_POINTS or c[1] in HOUR_POINTS]
+
+# 年干 -> 禄权科忌所在星曜的下标
+_TRANSFORM_STARS = tuple(tuple(StarSystem.STAR_INDEX[s] for s in stars) for stars in YEAR_BY_STEM)
+_TRANSFORM_STAR_ARR = np.array(_TRANSFORM_STARS, dtype=np.int64)
+
+_PATTERN_INFO = [
+    {"name": p.value, "wuxing": r["wuxing"], "score": r["score"], "desc": r["desc"]}
+    for p, r in ((p, PatternAnalyzer.RULES[p]) for p in PATTERN_LIST)
+]
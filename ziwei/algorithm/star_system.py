@@ -1,5 +1,9 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from palace import LifePalaceCalculator
+from utils import TIAN_GAN, DI_ZHI, parse_stem, parse_branch
 
 # 月份地支映射表
 month_zhi_map = ["寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥", "子", "丑"]
@@ -9,6 +13,9 @@ class StarSystem:
              "天府", "太阴", "贪狼", "巨门", "天相", "天梁", "七杀", "破军"]
     AUX = ["文昌", "文曲", "左辅", "右弼", "禄存", "天魁", "天钺",
            "天马", "擎羊", "陀罗", "火星", "铃星", "地空", "地劫"]
+    # 全部28颗星曜（主星在前），星曜整数编码即在此列表中的下标
+    ALL = MAJOR + AUX
+    STAR_INDEX = {s: i for i, s in enumerate(ALL)}
 
     # 星曜五行（含双属性），可考虑存入数据库
     WUXING = {
@@ -20,6 +27,24 @@ class StarSystem:
         "擎羊": ["金"], "陀罗": ["金"], "火星": ["火"], "铃星": ["火"], "地空": ["土"], "地劫": ["土"]
     }
 
+    # 星曜在十二宫（子 ... 亥）的庙旺利陷，可考虑存入数据库
+    BRIGHTNESS = {
+        "紫微": "平庙庙旺得旺庙庙旺旺得旺", "天机": "庙陷得旺利平庙陷得旺利平",
+        "太阳": "陷不旺庙旺旺旺得得平不陷", "武曲": "旺庙得利庙平旺庙得利庙平",
+        "天同": "旺不利平平庙陷不旺平平庙", "廉贞": "平利庙平利陷平利庙平利陷",
+        "天府": "庙庙庙得庙得旺庙得旺庙得", "太阴": "庙庙旺陷陷陷不不利不旺庙",
+        "贪狼": "旺庙平利庙陷旺庙平利庙陷", "巨门": "旺不庙庙陷旺旺不庙庙陷旺",
+        "天相": "庙庙庙陷得得庙得庙陷得得", "天梁": "庙旺庙庙旺陷庙旺陷得旺陷",
+        "七杀": "旺庙庙陷旺平旺旺庙陷庙平", "破军": "庙旺得陷旺平庙旺得陷旺平",
+        "文昌": "得庙陷利得庙陷利得庙陷利", "文曲": "庙庙平旺得庙陷旺得庙陷旺",
+        "左辅": "旺旺旺旺旺旺旺旺旺旺旺旺", "右弼": "旺旺旺旺旺旺旺旺旺旺旺旺",
+        "禄存": "旺平庙旺平庙旺平庙旺平庙", "天魁": "旺旺旺旺旺旺旺旺旺旺旺旺",
+        "天钺": "旺旺旺旺旺旺旺旺旺旺旺旺", "天马": "平平旺平平旺平平旺平平旺",
+        "擎羊": "陷庙陷陷庙陷陷庙陷陷庙陷", "陀罗": "陷庙陷陷庙陷陷庙陷陷庙陷",
+        "火星": "陷得庙利陷得庙利陷陷庙平", "铃星": "陷得庙利陷得庙利陷陷庙平",
+        "地空": "平平平平平平平平平平平平", "地劫": "平平平平平平平平平平平平",
+    }
+
     @staticmethod
     def get_star_wuxing(star_name: str) -> List[str]:
         """获取星曜的五行属性"""
@@ -38,8 +63,8 @@ class StarSystem:
 
 class GanZhiConverter:
     """天干地支转换工具类"""
-    TIAN_GAN = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
-    DI_ZHI = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+    TIAN_GAN = TIAN_GAN
+    DI_ZHI = DI_ZHI
 
     @staticmethod
     def get_gan_zhi(year: int) -> str:
@@ -64,6 +89,142 @@ class GanZhiConverter:
         return GanZhiConverter.DI_ZHI[index]
 
 
+# 主星排布顺序：紫微系（随方向推进）与天府系（反向推进）
+ZIWEI_SERIES = ["紫微", "天机", "太阳", "武曲", "天同", "廉贞"]
+TIANFU_SERIES = ["天府", "太阴", "贪狼", "巨门", "天相", "天梁", "七杀", "破军"]
+
+# 以下辅星表均以年干索引（甲=0）为下标，值为地支宫位索引
+LU_CUN_TABLE = (2, 3, 4, 6, 7, 8, 9, 10, 0, 1)  # 禄存：甲寅 乙卯 丙辰 丁午 ... 壬子 癸丑
+WEN_CHANG_TABLE = (0, 11, 10, 9, 8, 7, 6, 5, 4, 3)  # 文昌：甲子 乙亥 ... 癸卯
+ZUO_FU_TABLE = (1, 0, 11, 10, 9, 8, 7, 6, 5, 4)  # 左辅：甲丑 乙子 ... 癸辰
+QING_YANG_TABLE = (0, 11, 10, 9, 8, 7, 6, 5, 4, 3)  # 擎羊：甲子 乙亥 ... 癸卯
+HUO_LING_TABLE = (7, 8, 9, 10, 11, 0, 1, 2, 3, 4)  # 火星：甲未 乙申 ... 癸辰
+TIAN_KUI_TABLE = (1, 0, 9, 8, 7, 6, 5, 4, 11, 10)  # 天魁：甲丑 乙子 丙酉 ... 癸戌
+
+# 天马：月支为寅申巳亥时落在对冲宫位，以月支索引为键
+TIAN_MA_TABLE = {2: 6, 8: 0, 5: 9, 11: 3}
+
+# 地空地劫（固定位置）
+DI_KONG_POS = 9  # 戌宫
+DI_JIE_POS = 3  # 卯宫
+
+
+def yin_yang_direction(yin_yang: str) -> int:
+    """阳男阴女顺行(1)，阴男阳女逆行(-1)"""
+    return 1 if yin_yang in ["阳男", "阴女"] else -1
+
+
+def major_positions(day: int, bureau: int, direction: int = 1) -> List[int]:
+    """
+    排布十四主星（整数编码）
+
+    Args:
+        day: 农历日期
+        bureau: 局数（五行局数字）
+        direction: 紫微系推进方向，1 为顺行，-1 为逆行
+
+    Returns:
+        按 StarSystem.MAJOR 顺序排列的宫位索引列表
+    """
+    return list(MAJOR_LAYOUTS[layout_index(zi_wei_position(day, bureau), direction)])
+
+
+def zi_wei_position(day: int, bureau: int) -> int:
+    """按农历日与局数计算紫微星所在宫位"""
+    return (bureau * ((day - 1) % bureau)) % 12
+
+
+def layout_index(zi_pos: int, direction: int) -> int:
+    """主星布局编号：十四主星只取决于紫微位置与推进方向，共 12 × 2 = 24 种"""
+    return zi_pos * 2 + (direction < 0)
+
+
+def _layout_positions(zi_pos: int, direction: int) -> Tuple[int, ...]:
+    # 紫微系（根据阴阳属性决定方向）
+    positions = [(zi_pos + direction * i) % 12 for i in range(len(ZIWEI_SERIES))]
+
+    # 天府系（与紫微系方向相反）
+    tianfu_pos = (zi_pos + 6) % 12
+    positions += [(tianfu_pos - direction * i) % 12 for i in range(len(TIANFU_SERIES))]
+    return tuple(positions)
+
+
+# 全部 24 种主星布局（按 layout_index 编号），元素为 StarSystem.MAJOR 顺序的宫位元组
+MAJOR_LAYOUTS = tuple(_layout_positions(zi_pos, direction) for zi_pos in range(12) for direction in (1, -1))
+
+
+# 五行顺序（五行向量与分析结果均按此顺序）
+WUXING_ORDER = ["金", "木", "水", "火", "土"]
+
+# 庙旺利陷的等级及其权重：星曜越得地，其五行力量越强
+BRIGHTNESS_LEVELS = "庙旺得利平不陷"
+BRIGHTNESS_WEIGHTS = np.array([1.0, 0.85, 0.7, 0.6, 0.5, 0.4, 0.25])
+# 辅星力量按主星的一半计
+AUX_STAR_WEIGHT = 0.5
+
+# 28×12 庙旺利陷等级矩阵（行为 StarSystem.ALL，列为地支）
+BRIGHTNESS = np.array([[BRIGHTNESS_LEVELS.index(c) for c in StarSystem.BRIGHTNESS[s]] for s in StarSystem.ALL],
+                      dtype=np.int8)
+# 28×5 星曜五行向量，双五行星曜平均分摊
+WUXING_VECTORS = np.array([[StarSystem.WUXING[s].count(w) / len(StarSystem.WUXING[s]) for w in WUXING_ORDER]
+                           for s in StarSystem.ALL])
+# 28×12 星曜落宫权重 = 庙旺利陷权重 × 主辅星权重
+STAR_WEIGHTS = (BRIGHTNESS_WEIGHTS[BRIGHTNESS]
+                * np.where(np.arange(len(StarSystem.ALL)) < len(StarSystem.MAJOR), 1.0, AUX_STAR_WEIGHT)[:, None])
+_STAR_ROWS = np.arange(len(StarSystem.ALL))
+
+
+def wuxing_scores(stars) -> np.ndarray:
+    """
+    批量计算五行力量：每颗星按落宫权重加权后，与五行向量做矩阵乘法
+
+    Args:
+        stars: N×28 星曜位置矩阵（StarSystem.ALL 顺序），也可只给前14列主星
+
+    Returns:
+        N×5 五行力量矩阵，列顺序同 WUXING_ORDER
+    """
+    stars = np.asarray(stars, dtype=np.int64)
+    n_stars = stars.shape[1]
+    return STAR_WEIGHTS[_STAR_ROWS[:n_stars], stars] @ WUXING_VECTORS[:n_stars]
+
+
+def wuxing_balance(major_pos: Dict[str, int], aux_pos: Optional[Dict[str, int]] = None) -> Dict:
+    """
+    分析五行平衡（按星曜落宫的庙旺利陷加权，辅星减半，双五行星曜平均分摊）
+
+    Args:
+        major_pos: 主星位置字典
+        aux_pos: 辅星位置字典，缺省时只统计主星
+
+    Returns:
+        包含 count（加权五行力量）、ratio、strongest、weakest、deficiency 的字典
+    """
+    stars = dict(major_pos, **(aux_pos or {}))
+    rows = [i for i, s in enumerate(StarSystem.ALL) if s in stars]
+    cols = [stars[StarSystem.ALL[i]] for i in rows]
+    scores = STAR_WEIGHTS[rows, cols] @ WUXING_VECTORS[rows]
+    return wuxing_summary(scores)
+
+
+def wuxing_summary(scores: Sequence[float]) -> Dict:
+    """由五行力量向量（WUXING_ORDER 顺序）生成五行平衡分析字典"""
+    cnt = {w: float(v) for w, v in zip(WUXING_ORDER, scores)}
+    total = sum(cnt.values())
+    ratio = {k: v / total for k, v in cnt.items()}
+    strongest = max(ratio, key=ratio.get)
+    weakest = min(ratio, key=ratio.get)
+    deficiency = [k for k, v in ratio.items() if v < 0.15] or ["无"]
+
+    return {
+        "count": cnt,
+        "ratio": ratio,
+        "strongest": strongest,
+        "weakest": weakest,
+        "deficiency": deficiency
+    }
+
+
 def arrange_major_stars(day: int, bureau: int, yin_yang: str = "阳男") -> Dict[str, int]:
     """
     排布十四主星（考虑阴阳属性）
@@ -76,27 +237,85 @@ def arrange_major_stars(day: int, bureau: int, yin_yang: str = "阳男") -> Dict
     Returns:
         包含所有主星星曜及其位置的字典
     """
-    # 计算紫微星位置
-    zi_pos = (bureau * ((day - 1) % bureau)) % 12
-
-    # 紫微系（根据阴阳属性决定方向）
-    major = {}
-    seq1 = ["紫微", "天机", "太阳", "武曲", "天同", "廉贞"]
+    positions = major_positions(day, bureau, yin_yang_direction(yin_yang))
+    return dict(zip(StarSystem.MAJOR, positions))
 
-    # 阳男阴女顺行，阴男阳女逆行
-    direction = 1 if yin_yang in ["阳男", "阴女"] else -1
 
-    for i, s in enumerate(seq1):
-        major[s] = (zi_pos + direction * i) % 12
+def aux_positions(year_stem: int, month_branch: int, hour_branch: int) -> List[int]:
+    """
+    排布辅星（整数编码，查 AUX_TABLE）
 
-    # 天府系（与紫微系方向相反）
-    tianfu_pos = (zi_pos + 6) % 12
-    seq2 = ["天府", "太阴", "贪狼", "巨门", "天相", "天梁", "七杀", "破军"]
+    Args:
+        year_stem: 年干索引（甲=0）
+        month_branch: 月支索引（子=0）
+        hour_branch: 时支索引（子=0）
 
-    for i, s in enumerate(seq2):
-        major[s] = (tianfu_pos - direction * i) % 12
+    Returns:
+        按 StarSystem.AUX 顺序排列的宫位索引列表
+    """
+    return list(_AUX_ROWS[aux_index(year_stem, month_branch, hour_branch)])
+
+
+def aux_index(year_stem: int, month_branch: int, hour_branch: int) -> int:
+    """辅星表行号：(年干 * 12 + 月支) * 12 + 时支，共 10 × 12 × 12 = 1440 行"""
+    return (year_stem * 12 + month_branch) * 12 + hour_branch
+
+
+def compute_aux_positions(year_stem: int, month_branch: int, hour_branch: int) -> List[int]:
+    """按规则逐颗排布辅星（用于生成 AUX_TABLE，参数与返回值同 aux_positions）"""
+    wen_chang_pos = WEN_CHANG_TABLE[year_stem]
+    zuo_fu_pos = ZUO_FU_TABLE[year_stem]
+    tian_kui_pos = TIAN_KUI_TABLE[year_stem]
+    qing_yang_pos = QING_YANG_TABLE[year_stem]
+    huo_pos = HUO_LING_TABLE[year_stem]
+
+    tian_ma_pos = TIAN_MA_TABLE.get(month_branch)
+    if tian_ma_pos is None:
+        # 其他月份，天马在命宫
+        month = (month_branch - 2) % 12 + 1
+        tian_ma_pos = LifePalaceCalculator.life_body_index(month, hour_branch)[0]
+
+    return [
+        wen_chang_pos,  # 文昌
+        (wen_chang_pos + 6) % 12,  # 文曲对冲文昌
+        zuo_fu_pos,  # 左辅
+        (zuo_fu_pos + 6) % 12,  # 右弼对冲左辅
+        LU_CUN_TABLE[year_stem],  # 禄存
+        tian_kui_pos,  # 天魁
+        (tian_kui_pos + 6) % 12,  # 天钺对冲天魁
+        tian_ma_pos,  # 天马
+        qing_yang_pos,  # 擎羊
+        (qing_yang_pos + 6) % 12,  # 陀罗对冲擎羊
+        huo_pos,  # 火星
+        (huo_pos + 6) % 12,  # 铃星对冲火星
+        DI_KONG_POS,  # 地空
+        DI_JIE_POS,  # 地劫
+    ]
+
+
+# 全部 1440 种 (年干, 月支, 时支) 组合的辅星宫位，行号见 aux_index
+_AUX_ROWS = tuple(tuple(compute_aux_positions(stem, month, hour))
+                  for stem in range(10) for month in range(12) for hour in range(12))
+AUX_TABLE = np.array(_AUX_ROWS, dtype=np.int8)
+AUX_TABLE.flags.writeable = False
+
+
+def save_aux_table(path: str):
+    """把辅星表保存为 .npy 文件"""
+    np.save(path, AUX_TABLE)
+
+
+def load_aux_table(path: str) -> np.ndarray:
+    """
+    读取 save_aux_table 保存的辅星表（mmap 只读，多进程共享页缓存）
 
-    return major
+    Raises:
+        ValueError: 文件不是有效的辅星表
+    """
+    table = np.load(path, mmap_mode="r")
+    if table.shape != AUX_TABLE.shape or table.dtype != AUX_TABLE.dtype or table.min() < 0 or table.max() > 11:
+        raise ValueError(f"不是有效的辅星表: {path}")
+    return table
 
 
 def arrange_aux_stars(year_gz: str, month_zhi: str, hour_zhi: str) -> Dict[str, int]:
@@ -111,139 +330,47 @@ def arrange_aux_stars(year_gz: str, month_zhi: str, hour_zhi: str) -> Dict[str,
     Returns:
         包含所有辅星星曜及其位置的字典
     """
-    # 提取年份天干
-    year_gan = year_gz[0]
-
-    # 计算禄存星位置
-    LU_CUN_TABLE = {
-        "甲": 2,  # 寅
-        "乙": 3,  # 卯
-        "丙": 4,  # 辰
-        "丁": 6,  # 午
-        "戊": 7,  # 未
-        "己": 8,  # 申
-        "庚": 9,  # 酉
-        "辛": 10,  # 戌
-        "壬": 0,  # 子
-        "癸": 1  # 丑
-    }
-    lu_cun_pos = LU_CUN_TABLE.get(year_gan, 0)
-
-    # 优化天马星计算
-    tian_ma_pos = 0
-    if month_zhi in ["寅", "申", "巳", "亥"]:
-        # 寅申巳亥年出生，天马在出生月份的对冲宫位
-        tian_ma_map = {"寅": 6, "申": 0, "巳": 9, "亥": 3}
-        tian_ma_pos = tian_ma_map.get(month_zhi, 0)
-    else:
-        # 其他年份，天马在命宫
-        tian_ma_pos = LifePalaceCalculator.calc_life_body_palace(
-            month_zhi_map.index(month_zhi) + 1, hour_zhi
-        )[0].value
-
-    # 计算文昌文曲位置
-    WEN_CHANG_TABLE = {
-        "甲": 0,  # 子
-        "乙": 11,  # 亥
-        "丙": 10,  # 戌
-        "丁": 9,  # 酉
-        "戊": 8,  # 申
-        "己": 7,  # 未
-        "庚": 6,  # 午
-        "辛": 5,  # 巳
-        "壬": 4,  # 辰
-        "癸": 3  # 卯
-    }
-    wen_chang_pos = WEN_CHANG_TABLE.get(year_gan, 0)
-    wen_qu_pos = (wen_chang_pos + 6) % 12  # 文曲对冲文昌
-
-    # 计算左辅右弼位置
-    ZUO_FU_TABLE = {
-        "甲": 1,  # 丑
-        "乙": 0,  # 子
-        "丙": 11,  # 亥
-        "丁": 10,  # 戌
-        "戊": 9,  # 酉
-        "己": 8,  # 申
-        "庚": 7,  # 未
-        "辛": 6,  # 午
-        "壬": 5,  # 巳
-        "癸": 4  # 辰
-    }
-    zuo_fu_pos = ZUO_FU_TABLE.get(year_gan, 0)
-    you_bi_pos = (zuo_fu_pos + 6) % 12  # 右弼对冲左辅
-
-    # 计算擎羊陀罗位置
-    QING_YANG_TABLE = {
-        "甲": 0,  # 子
-        "乙": 11,  # 亥
-        "丙": 10,  # 戌
-        "丁": 9,  # 酉
-        "戊": 8,  # 申
-        "己": 7,  # 未
-        "庚": 6,  # 午
-        "辛": 5,  # 巳
-        "壬": 4,  # 辰
-        "癸": 3  # 卯
-    }
-    qing_yang_pos = QING_YANG_TABLE.get(year_gan, 0)
-    tuo_luo_pos = (qing_yang_pos + 6) % 12  # 陀罗对冲擎羊
-
-    # 计算火铃星位置
-    HUO_LING_TABLE = {
-        "甲": 7,  # 未
-        "乙": 8,  # 申
-        "丙": 9,  # 酉
-        "丁": 10,  # 戌
-        "戊": 11,  # 亥
-        "己": 0,  # 子
-        "庚": 1,  # 丑
-        "辛": 2,  # 寅
-        "壬": 3,  # 卯
-        "癸": 4  # 辰
-    }
-    huo_pos = HUO_LING_TABLE.get(year_gan, 0)
-    ling_pos = (huo_pos + 6) % 12  # 铃星对冲火星
-
-    # 计算地空地劫位置（固定位置）
-    DI_KONG_POS = 9  # 戌宫
-    DI_JIE_POS = 3  # 卯宫
-
-    # 计算天魁天钺位置
-    TIAN_KUI_TABLE = {
-        "甲": 1,  # 丑
-        "乙": 0,  # 子
-        "丙": 9,  # 酉
-        "丁": 8,  # 申
-        "戊": 7,  # 未
-        "己": 6,  # 午
-        "庚": 5,  # 巳
-        "辛": 4,  # 辰
-        "壬": 11,  # 亥
-        "癸": 10  # 戌
-    }
-    tian_kui_pos = TIAN_KUI_TABLE.get(year_gan, 0)
-    tian_yue_pos = (tian_kui_pos + 6) % 12  # 天钺对冲天魁
-
-    # 组装所有辅星位置
-    aux_stars = {
-        "文昌": wen_chang_pos,
-        "文曲": wen_qu_pos,
-        "左辅": zuo_fu_pos,
-        "右弼": you_bi_pos,
-        "天魁": tian_kui_pos,
-        "天钺": tian_yue_pos,
-        "禄存": lu_cun_pos,
-        "天马": tian_ma_pos,
-        "擎羊": qing_yang_pos,
-        "陀罗": tuo_luo_pos,
-        "火星": huo_pos,
-        "铃星": ling_pos,
-        "地空": DI_KONG_POS,
-        "地劫": DI_JIE_POS
-    }
+    positions = aux_positions(parse_stem(year_gz[0]), parse_branch(month_zhi), parse_branch(hour_zhi))
+    return dict(zip(StarSystem.AUX, positions))
+
+
+def arrange_stars_batch(lunar_day, bureau, direction, year_stem, month_branch, hour_branch) -> np.ndarray:
+    """
+    批量排布全部星曜（向量化，等价于逐个调用 major_positions 与 aux_positions）
+
+    Args:
+        lunar_day: 农历日期数组
+        bureau: 局数数组（2-6）
+        direction: 紫微系推进方向数组（1 顺行，-1 逆行）
+        year_stem: 年干索引数组
+        month_branch: 月支索引数组
+        hour_branch: 时支索引数组
+
+    Returns:
+        N×28 的 int8 矩阵，列顺序同 StarSystem.ALL
+    """
+    lunar_day = np.asarray(lunar_day, dtype=np.int64)
+    bureau = np.asarray(bureau, dtype=np.int64)
+    direction = np.asarray(direction, dtype=np.int64)[:, None]
+    year_stem = np.asarray(year_stem, dtype=np.int64)
+    month_branch = np.asarray(month_branch, dtype=np.int64)
+    hour_branch = np.asarray(hour_branch, dtype=np.int64)
+
+    n_ziwei = len(ZIWEI_SERIES)
+    out = np.empty((len(lunar_day), len(StarSystem.ALL)), dtype=np.int8)
+
+    # 主星：紫微系顺/逆推，天府系反向推进
+    zi_pos = ((bureau * ((lunar_day - 1) % bureau)) % 12)[:, None]
+    out[:, :n_ziwei] = (zi_pos + direction * _ZIWEI_STEPS) % 12
+    out[:, n_ziwei:len(StarSystem.MAJOR)] = (zi_pos + 6 - direction * _TIANFU_STEPS) % 12
+
+    # 辅星：整行取辅星表
+    out[:, len(StarSystem.MAJOR):] = AUX_TABLE[(year_stem * 12 + month_branch) * 12 + hour_branch]
+    return out
+
 
-    return aux_stars
+_ZIWEI_STEPS = np.arange(len(ZIWEI_SERIES))
+_TIANFU_STEPS = np.arange(len(TIANFU_SERIES))
 
 
 def arrange_all_stars(day: int, bureau: str, year_gz: str, month_zhi: str, hour_zhi: str) -> Dict[str, int]:
@@ -0,0 +1,72 @@
+# ziwei/algorithm/utils.py
+"""
+干支整数编码
+
+算法内部统一使用整数表示干支：天干 0-9（甲=0）、地支 0-11（子=0）、
+六十甲子序号 0-59（甲子=0）。中文字符串只在输入解析与结果输出时转换。
+"""
+from typing import Tuple, Union
+
+TIAN_GAN = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+DI_ZHI = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+
+GAN_INDEX = {g: i for i, g in enumerate(TIAN_GAN)}
+ZHI_INDEX = {z: i for i, z in enumerate(DI_ZHI)}
+
+# 六十甲子名称表（按序号）
+JIAZI = [TIAN_GAN[c % 10] + DI_ZHI[c % 12] for c in range(60)]
+JIAZI_INDEX = {gz: c for c, gz in enumerate(JIAZI)}
+
+
+def cycle_index(stem: int, branch: int) -> int:
+    """天干、地支索引转六十甲子序号"""
+    return (6 * stem - 5 * branch) % 60
+
+
+def cycle_parts(cycle: int) -> Tuple[int, int]:
+    """六十甲子序号转(天干索引, 地支索引)"""
+    return cycle % 10, cycle % 12
+
+
+def is_yang_stem(stem: int) -> bool:
+    """阳干：甲丙戊庚壬"""
+    return stem % 2 == 0
+
+
+def parse_stem(gan: str) -> int:
+    """天干字符串转索引"""
+    try:
+        return GAN_INDEX[gan]
+    except KeyError:
+        raise ValueError(f"无效的天干: {gan}") from None
+
+
+def parse_branch(zhi: str) -> int:
+    """地支字符串转索引"""
+    try:
+        return ZHI_INDEX[zhi]
+    except KeyError:
+        raise ValueError(f"无效的地支: {zhi}") from None
+
+
+def parse_ganzhi(gz: str) -> int:
+    """干支字符串（如"甲子"）转六十甲子序号"""
+    try:
+        return JIAZI_INDEX[gz]
+    except KeyError:
+        raise ValueError(f"无效的干支: {gz}") from None
+
+
+def hour_branch(hour: Union[int, str]) -> int:
+    """
+    时辰转地支索引
+
+    支持两种输入：
+    1. 现代24小时制（0-23），23:00-1:00为子时
+    2. 古代地支时辰（'子','丑'...）
+    """
+    if isinstance(hour, int):
+        return ((hour % 24 + 1) % 24) // 2
+    if hour in ZHI_INDEX:
+        return ZHI_INDEX[hour]
+    raise ValueError(f"无效的时辰格式: {hour}")
@@ -1,11 +1,29 @@
 # ziwei/algorithm/zhongzhou_calculator.py
 import datetime
-from typing import Dict
-from ganzhi_converter import GanZhiConverter
-from palace import Palace, LifePalaceCalculator
-from star_system import arrange_major_stars, arrange_aux_stars, StarSystem
-from four_transform import FourTransform
+import logging
+import os
+import time
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from itertools import islice
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import jieqi_table
+import lunar_table
+from ganzhi_converter import GanZhiConverter, NAYIN_NAMES, NAYIN_CODE, BUREAU_NUMBERS
+from palace import LifePalaceCalculator
+from major_layout import layout_for
+import numpy as np
+
+from star_system import StarSystem, aux_positions, wuxing_balance, wuxing_scores
 from sixty_pattern import PatternAnalyzer
+from chart_record import ChartRecord, varying_fields
+from luck_timeline import DEFAULT_SPAN, LuckTimeline
+from instrumentation import Instrumentation
+from utils import JIAZI, cycle_index, is_yang_stem, hour_branch
+
+logger = logging.getLogger(__name__)
 
 
 def parse_hour(hour_input):
@@ -19,40 +37,139 @@ def parse_hour(hour_input):
         raise ValueError(f"无效的时辰格式: {hour_input}")
 
 
+def _jieqi_minute(hour, minute: int = 0) -> int:
+    """
+    出生时刻在当日的分钟数，用于与交节时刻比较
+
+    整数小时取 hour:minute（23 点出生即当日 23:xx，晚于当日交节时刻时属下一个节气月）；
+    地支时辰不知道具体时刻，取时辰的整点代表时刻（同 parse_hour，子=0点），忽略 minute。
+
+    Raises:
+        ValueError: minute 不在 0-59 之间
+    """
+    if not (isinstance(minute, int) and 0 <= minute < 60):
+        raise ValueError(f"无效的分钟: {minute}")
+    if isinstance(hour, int):
+        return hour % 24 * 60 + minute
+    return parse_hour(hour) * 60
+
+
+_EPOCH_ORDINAL = jieqi_table.EPOCH.toordinal()
+
+
+def _jie_key(year: int, month: int, day: int, minute: int):
+    """
+    出生时刻所在节气月的标识（交节前后不同），只用作缓存键
+
+    表内年份为出生时刻之前已过的“节”的个数（一次二分查找）；表外年份退回按节气计算的年、月柱。
+    """
+    if jieqi_table.JIEQI_FIRST_YEAR <= year <= jieqi_table.JIEQI_LAST_YEAR:
+        minutes = (datetime.date(year, month, day).toordinal() - _EPOCH_ORDINAL) * 1440 + minute
+        return bisect_right(jieqi_table.JIE_MINUTES, minutes)
+    return GanZhiConverter.year_month_index(datetime.datetime(year, month, day) + datetime.timedelta(minutes=minute))
+
+
+class CacheInfo(NamedTuple):
+    """命盘缓存统计"""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class BatchResult(NamedTuple):
+    """批量排盘的单条结果：成功时 chart 为命盘、error 为 None，失败时相反"""
+    index: int
+    chart: Optional[Dict]
+    error: Optional[str]
+
+
+class HourRange(NamedTuple):
+    """
+    时辰不详时十二个时辰的命盘
+
+    Attributes:
+        charts: 按时辰地支（子=0）排列的 12 张紧凑命盘
+        varying: 随时辰变化的字段名（同 calculate 的返回值字段）
+        moving_stars: 随时辰变换宫位的星曜（StarSystem.ALL 顺序）
+    """
+    charts: Tuple[ChartRecord, ...]
+    varying: Tuple[str, ...]
+    moving_stars: Tuple[str, ...]
+
+
 class ZhongZhouCalculator:
-    def analyze_wuxing(self, major_pos: dict) -> dict:
-        """分析五行平衡"""
-        cnt = {"金": 0, "木": 0, "水": 0, "火": 0, "土": 0}
-        for star in StarSystem.MAJOR:
-            if star in major_pos:
-                wux = StarSystem.WUXING.get(star, ["土"])
-                for w in wux:
-                    cnt[w] += 1 / len(wux)  # 双五行分摊
-
-        total = sum(cnt.values())
-        ratio = {k: v / total for k, v in cnt.items()}
-        strongest = max(ratio, key=ratio.get)
-        weakest = min(ratio, key=ratio.get)
-        deficiency = [k for k, v in ratio.items() if v < 0.15] or ["无"]
-
-        return {
-            "count": cnt,
-            "ratio": ratio,
-            "strongest": strongest,
-            "weakest": weakest,
-            "deficiency": deficiency
-        }
+    def __init__(self, cache_size: int = 4096, instrumentation: Optional[Instrumentation] = None):
+        """
+        Args:
+            cache_size: 命盘缓存容量（按出生签名计），0 表示不缓存
+            instrumentation: 分阶段计时器，None 表示不计时
+        """
+        self.cache_size = cache_size
+        self.instrumentation = instrumentation
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    @staticmethod
+    def analyze_wuxing(major_pos: dict, aux_pos: Optional[dict] = None) -> dict:
+        """分析五行平衡（按庙旺利陷加权，传入 aux_pos 时计入辅星）"""
+        return wuxing_balance(major_pos, aux_pos)
+
+    @staticmethod
+    def analyze_wuxing_batch(stars) -> np.ndarray:
+        """
+        批量分析五行平衡
+
+        Args:
+            stars: N×28 星曜位置矩阵（StarSystem.ALL 顺序）
+
+        Returns:
+            N×5 五行比例矩阵，列顺序同 star_system.WUXING_ORDER
+        """
+        scores = wuxing_scores(stars)
+        return scores / scores.sum(axis=1, keepdims=True)
 
     def calculate(self, birth: Dict) -> Dict:
         """
         计算完整中州派紫微斗数命盘
 
+        命盘只取决于(年, 月, 日, 时辰地支, 性别)以及出生时刻所在的节气月，
+        按(年, 月, 日, 时辰地支, 性别, 所在节气月)缓存紧凑的 ChartRecord：当天没有交节时
+        同一时辰共用一条缓存；交节当天，交节前后出生的同一时辰分开缓存。
+        每次返回的都是新生成的字典，调用方修改返回值不会影响缓存。
+
+        年、月柱按出生时刻与交节时刻比较：整数小时取 hour:minute（minute 可省略，默认 0），
+        地支时辰没有具体时刻，取时辰的整点代表时刻（子=0点，丑=2点……），交节当天可能与实际不符。
+
         Args:
-            birth: 包含出生年、月、日、时的字典
+            birth: 包含出生年、月、日、时的字典，可选 minute（0-59）
 
         Returns:
             包含完整命盘信息的字典
 
+        Raises:
+            ValueError: 缺少必要参数或参数错误
+            RuntimeError: 命盘计算过程中发生错误
+        """
+        record = self.calculate_record(birth)
+        if self.instrumentation is None:
+            return record.to_dict()
+        # 四化与五行分析在展开字典时才生成，计入 render 阶段
+        with self.instrumentation.stage("render"):
+            return record.to_dict()
+
+    def calculate_record(self, birth: Dict) -> ChartRecord:
+        """
+        计算命盘，返回不可变的紧凑记录（可直接当只读字典使用，也可 pickle 传给其他进程）
+
+        Args:
+            birth: 包含出生年、月、日、时的字典，可选 minute（0-59），缓存与时刻精度同 calculate
+
+        Returns:
+            ChartRecord 命盘记录
+
         Raises:
             ValueError: 缺少必要参数或参数错误
             RuntimeError: 命盘计算过程中发生错误
@@ -64,114 +181,248 @@ class ZhongZhouCalculator:
                 if key not in birth:
                     raise ValueError(f"缺少必要参数: {key}")
 
-            # 提取出生日期信息
-            year = birth["year"]
-            month = birth["month"]
-            day = birth["day"]
-            hour = birth["hour"]
-
-            # 计算年干支与五行局
-            ygz, bureau = GanZhiConverter.get_year_ganzhi(year)
-            print(f"年干支: {ygz}, 五行局: {bureau}")  # 添加调试信息
-
-            # 确保五行局有效
-            if not bureau:
-                raise ValueError(f"无效的五行局: {bureau}")
-
-            # 从五行局中提取数字部分，支持中文数字
-            chinese_numerals = {'一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-                                '六': 6, '七': 7, '八': 8, '九': 9, '十': 10}
-
-            # 尝试提取阿拉伯数字
-            digits = ''.join(filter(str.isdigit, bureau))
-
-            # 如果没有找到阿拉伯数字，尝试提取中文数字
-            if not digits:
-                chinese_digits = [chinese_numerals.get(c) for c in bureau if c in chinese_numerals]
-                if chinese_digits:
-                    digits = str(chinese_digits[0])
-
-            if not digits:
-                raise ValueError(f"五行局中未找到数字: {bureau}")
-
-            bureau_number = int(digits)
-            print(f"提取的五行局数字: {bureau_number}")  # 添加调试信息
-
-            # 计算月、日、时干支
-            mgz = GanZhiConverter.get_month_ganzhi(ygz, month)
-            # 获取月支
-            month_zhi = mgz[1]
-
-            dt = datetime.date(year, month, day)
-            dgz = GanZhiConverter.get_day_ganzhi(dt)
-
-            # 处理时辰，转换为地支
-            if isinstance(hour, int):
-                # 24小时制转地支时辰
-                hour_zhi_map = {
-                    23: "子", 0: "子", 1: "丑", 2: "丑", 3: "寅", 4: "寅",
-                    5: "卯", 6: "卯", 7: "辰", 8: "辰", 9: "巳", 10: "巳",
-                    11: "午", 12: "午", 13: "未", 14: "未", 15: "申", 16: "申",
-                    17: "酉", 18: "酉", 19: "戌", 20: "戌", 21: "亥", 22: "亥"
-                }
-                hour_zhi = hour_zhi_map.get(hour % 24, "子")
-            else:
-                hour_zhi = hour  # 已经是地支字符串
+            # 归一化出生签名：整数小时与地支时辰落到同一个键，再按出生时刻的节气月区分
+            year, month, day = birth["year"], birth["month"], birth["day"]
+            h_branch, is_male = hour_branch(birth["hour"]), birth.get("gender", "male") == "male"
+            minute = _jieqi_minute(birth["hour"], birth.get("minute", 0))
+            key = (year, month, day, h_branch, is_male, _jie_key(year, month, day, minute))
+
+            record = self._cache_get(key)
+            if record is None:
+                record = self._compute_hours(year, month, day, (h_branch,), is_male, (minute,))[0]
+                self._cache_put(key, record)
+            return record
+        except ValueError as e:
+            raise ValueError(f"参数错误: {str(e)}") from e
+        except Exception as e:
+            raise RuntimeError(f"命盘计算失败: {str(e)}") from e
+
+    def calculate_timeline(self, birth: Dict, span: int = DEFAULT_SPAN) -> LuckTimeline:
+        """
+        计算命盘的大限、流年序列
 
-            # 计算时干支
-            hgz = GanZhiConverter.get_hour_ganzhi(dgz, hour_zhi)
+        Args:
+            birth: 包含出生年、月、日、时的字典（立春前出生时自动按上一年起算）
+            span: 推算的年数（虚岁 1 至 span）
 
-            # 将阳历转换为农历
-            hour_int = parse_hour(hour)
-            lunar_month, lunar_day, _ = LifePalaceCalculator.solar_to_lunar(
-                year, month, day, hour_int
-            )
+        Returns:
+            LuckTimeline，按年查询用 year_info(year) / at_age(age)
 
-            # 使用农历月份和时辰地支计算命宫与身宫
-            life_palace, body_palace = LifePalaceCalculator.calc_life_body_palace(
-                lunar_month, hour_zhi
-            )
+        Raises:
+            ValueError: 缺少必要参数或参数错误
+            RuntimeError: 命盘计算过程中发生错误
+        """
+        record = self.calculate_record(birth)
+        year = birth["year"]
+        # 年柱以立春为界，立春前出生的干支纪年是上一年
+        if cycle_index(*GanZhiConverter.year_index(year)) != record.year:
+            year -= 1
+        return record.luck_timeline(year, span)
+
+    def calculate_hour_range(self, birth: Dict) -> HourRange:
+        """
+        出生时辰不详时，一次算出十二个时辰的命盘
 
-            # 获取性别和年干阴阳属性
-            gender = birth.get("gender", "male")
-            year_gan = ygz[0]
-            yang_tians = ["甲", "丙", "戊", "庚", "壬"]
-            is_yang = year_gan in yang_tians
-            yin_yang = ("阳" if is_yang else "阴") + ("男" if gender == "male" else "女")
+        年、月、日柱、农历日期、五行局与主星布局只算一次，逐时辰只算时柱、命身宫、
+        辅星与格局。结果逐条写入命盘缓存，之后按具体时辰 calculate 可直接命中。
 
-            # 星曜排布
-            major_pos = arrange_major_stars(lunar_day, bureau_number)
-            # 修复：传递正确的参数给 arrange_aux_stars
-            aux_pos = arrange_aux_stars(ygz, month_zhi, hour_zhi)
-
-            # 四化星
-            trans = FourTransform.calc(ygz, ygz[0])  # 简化为年干四化
-
-            # 六十星系格局
-            patterns = PatternAnalyzer.identify(major_pos)
-
-            # 五行平衡分析
-            wuxing_analysis = self.analyze_wuxing(major_pos)
-
-            return {
-                "year_ganzhi": ygz,
-                "month_ganzhi": mgz,
-                "day_ganzhi": dgz,
-                "hour_ganzhi": hgz,
-                "wuxing_bureau": bureau,
-                "life_palace": life_palace.value,
-                "body_palace": body_palace.value,
-                "major_pos": major_pos,
-                "aux_pos": aux_pos,
-                "four_trans": trans,
-                "patterns": patterns,
-                "wuxing_analysis": wuxing_analysis
-            }
+        Args:
+            birth: 包含出生年、月、日的字典（hour 可省略，给出也会被忽略）
+
+        Returns:
+            HourRange，charts[i] 为第 i 个时辰（子=0）的命盘
+
+        Raises:
+            ValueError: 缺少必要参数或参数错误
+            RuntimeError: 命盘计算过程中发生错误
+        """
+        try:
+            for key in ("year", "month", "day"):
+                if key not in birth:
+                    raise ValueError(f"缺少必要参数: {key}")
+            year, month, day = birth["year"], birth["month"], birth["day"]
+            is_male = birth.get("gender", "male") == "male"
+            records = self._compute_hours(year, month, day, tuple(range(12)), is_male)
         except ValueError as e:
             raise ValueError(f"参数错误: {str(e)}") from e
         except Exception as e:
             raise RuntimeError(f"命盘计算失败: {str(e)}") from e
 
+        for h_branch, record in enumerate(records):
+            self._cache_put((year, month, day, h_branch, is_male, _jie_key(year, month, day, h_branch * 120)), record)
+        stars = np.frombuffer(b"".join(record.stars for record in records), dtype=np.uint8).reshape(12, -1)
+        moving = (stars != stars[0]).any(axis=0)
+        return HourRange(tuple(records), varying_fields(records),
+                         tuple(star for star, moves in zip(StarSystem.ALL, moving) if moves))
+
+    def _compute_hours(self, year: int, month: int, day: int, branches: Tuple[int, ...],
+                       is_male: bool, minutes: Optional[Tuple[int, ...]] = None) -> List[ChartRecord]:
+        """
+        计算同一天若干时辰的命盘（不经过缓存）
+
+        日柱、农历日期只算一次；年、月柱在当天没有交节时共用，
+        五行局与主星布局随年柱共用。逐时辰只算时柱、命身宫、辅星与格局。
+
+        Args:
+            branches: 按升序排列的时辰地支索引
+            minutes: 各时辰与交节时刻比较用的当日分钟数（升序），默认取时辰的整点代表时刻
+                （子=0点，丑=2点……，同 parse_hour）
+        """
+        inst = self.instrumentation
+        t = time.perf_counter() if inst is not None else 0.0
+
+        ordinal = datetime.date(year, month, day).toordinal()
+        if minutes is None:
+            minutes = tuple(b * 120 for b in branches)
+        midnight = datetime.datetime(year, month, day)
+
+        def year_month_at(minute: int) -> Tuple[int, int, int, int]:
+            return GanZhiConverter.year_month_index(midnight + datetime.timedelta(minutes=minute))
+
+        # 按节气计算年、月干支（整数编码）；首末时刻相同说明其间没有交节，各时辰共用
+        year_month = [year_month_at(minutes[0])]
+        if len(branches) > 1:
+            if year_month_at(minutes[-1]) == year_month[0]:
+                year_month *= len(branches)
+            else:
+                year_month = [year_month_at(m) for m in minutes]
+
+        # 计算日干支
+        d_stem, d_branch = GanZhiConverter.day_index(ordinal)
+        d_cycle = cycle_index(d_stem, d_branch)
+        if inst is not None:
+            t = inst.lap("pillars", t)
+
+        # 将阳历转换为农历
+        _, lunar_month, lunar_day, _ = lunar_table.ordinal_to_lunar(ordinal)
+        if inst is not None:
+            t = inst.lap("lunar", t)
+
+        records = []
+        year_pillar = layout = day_conditions = None
+        for h_branch, (y_stem, y_branch, m_stem, m_branch) in zip(branches, year_month):
+            if (y_stem, y_branch) != year_pillar:
+                year_pillar = y_stem, y_branch
+                y_cycle = cycle_index(y_stem, y_branch)
+                nayin = NAYIN_CODE[y_cycle]
+                bureau_number = BUREAU_NUMBERS[nayin]
+                if inst is not None:
+                    logger.debug("年干支: %s, 五行局: %s, 五行局数字: %d", JIAZI[y_cycle],
+                                 GanZhiConverter.WUXING_BUREAU[NAYIN_NAMES[nayin]], bureau_number)
+                # 阳男阴女顺行，阴男阳女逆行；主星直接取 24 种布局之一（含预先算好的纯主星格局）
+                direction = 1 if is_yang_stem(y_stem) == is_male else -1
+                layout = layout_for(lunar_day, bureau_number, direction)
+                # 多个时辰时，不涉及命宫、天马的格局条件按年柱只求一次
+                if len(branches) > 1:
+                    day_conditions = PatternAnalyzer.day_conditions(
+                        list(layout.positions) + aux_positions(y_stem, m_branch, h_branch), y_stem)
+                if inst is not None:
+                    t = inst.lap("layout", t)
+
+            # 时干支
+            h_stem, _ = GanZhiConverter.hour_index(d_stem, h_branch)
+
+            # 使用农历月份和时辰地支计算命宫与身宫
+            life_idx, body_idx = LifePalaceCalculator.life_body_index(lunar_month, h_branch)
+            if inst is not None:
+                t = inst.lap("palace", t)
+
+            # 星曜排布
+            major = list(layout.positions)
+            aux = aux_positions(y_stem, m_branch, h_branch)
+            if inst is not None:
+                t = inst.lap("stars", t)
+
+            # 六十星系格局（位图）：纯主星格局取自布局表，只需再算依赖辅星、命宫与年干四化的格局；
+            # 四化与五行分析由 ChartRecord 按需生成
+            patterns = PatternAnalyzer.identify_mask(major + aux, life_idx, y_stem, major_mask=layout.patterns,
+                                                     day_conditions=day_conditions)
+            records.append(ChartRecord(
+                major + aux,
+                y_cycle, cycle_index(m_stem, m_branch), d_cycle, cycle_index(h_stem, h_branch),
+                life_idx, body_idx, patterns,
+            ))
+            # 各阶段首尾相接，阶段耗时之和即总耗时
+            if inst is not None:
+                t = inst.lap("patterns", t)
+        return records
+
+    def _cache_get(self, key: Tuple) -> Optional[ChartRecord]:
+        """读取缓存，命中时移到最近使用的位置"""
+        if self.cache_size <= 0:
+            return None
+        with self._cache_lock:
+            record = self._cache.get(key)
+            if record is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(key)
+            return record
+
+    def _cache_put(self, key: Tuple, record: ChartRecord):
+        """写入缓存，超出容量时淘汰最久未使用的命盘"""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = record
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """命盘缓存统计（命中、未命中、淘汰次数及容量）"""
+        with self._cache_lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.cache_size, len(self._cache))
+
+    def cache_clear(self):
+        """清空命盘缓存并重置统计"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def calculate_many(self, births: Iterable[Dict], workers: Optional[int] = None,
+                       chunksize: int = 64) -> Iterator[BatchResult]:
+        """
+        批量计算命盘，按输入顺序逐条产出结果
+
+        输入按窗口分批提交到进程池，最多同时有两个窗口在途，
+        因此无论输入多大，内存占用都保持平稳。单条失败只记录在对应结果里，不中断整批。
+
+        Args:
+            births: 出生信息的可迭代对象（可以是生成器）
+            workers: 进程数，默认使用全部 CPU；1 表示在当前进程内计算
+            chunksize: 每次派发给工作进程的条数
+
+        Returns:
+            BatchResult 生成器，index 为该条在输入中的序号
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for index, birth in enumerate(births):
+                record, error = _calculate_safely(self, birth)
+                yield BatchResult(index, None if record is None else record.to_dict(), error)
+            return
+
+        window = workers * chunksize * 4
+        births = iter(births)
+        index = 0
+        pending = deque()
+        with Pool(workers, initializer=_init_batch_worker, initargs=(self.cache_size,)) as pool:
+            while True:
+                batch = list(islice(births, window))
+                if batch:
+                    pending.append(pool.map_async(_calculate_in_worker, batch, chunksize))
+                # 预取一个窗口：当前窗口产出时，下一个窗口已在计算
+                if pending and (len(pending) > 1 or not batch):
+                    # 工作进程回传紧凑记录，在主进程展开为字典
+                    for record, error in pending.popleft().get():
+                        yield BatchResult(index, None if record is None else record.to_dict(), error)
+                        index += 1
+                if not batch and not pending:
+                    break
+
     def generate_report(self, birth: Dict) -> str:
         """
         生成命盘报告文本
@@ -229,6 +480,27 @@ class ZhongZhouCalculator:
         return report
 
 
+def _calculate_safely(calc: ZhongZhouCalculator, birth: Dict) -> Tuple[Optional[ChartRecord], Optional[str]]:
+    """计算单个命盘记录，出错时返回错误信息而不是抛出"""
+    try:
+        return calc.calculate_record(birth), None
+    except Exception as e:
+        return None, str(e)
+
+
+# 批量排盘工作进程内的计算器（每个进程一个，进程内复用缓存）
+_batch_calc = None
+
+
+def _init_batch_worker(cache_size: int):
+    global _batch_calc
+    _batch_calc = ZhongZhouCalculator(cache_size=cache_size)
+
+
+def _calculate_in_worker(birth: Dict) -> Tuple[Optional[ChartRecord], Optional[str]]:
+    return _calculate_safely(_batch_calc, birth)
+
+
 class TimeConverter:
     """时辰转换工具类"""
     DI_ZHI = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
@@ -0,0 +1,83 @@
+import os
+import sys
+from typing import Dict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from user.models import User
+from ziwei.models import NumerologyAnalysis
+
+# 算法模块使用平级导入，需要把算法目录加入搜索路径
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                "algorithm"))
+
+from numerology import analyze_dates  # noqa: E402
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def refresh_numerology(chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+    """
+    按出生日期批量刷新全部用户的数字能量分析
+
+    按主键分页读取用户（每次只取一块，内存占用与用户总数无关），整块向量化计算
+    生命数字与日期磁场，再与每位用户最新的一条分析比较：没有分析的 bulk_create，
+    结果有变化的 bulk_update，出生日期未变（结果相同）的跳过。
+
+    Args:
+        chunk_size: 每块的用户数
+
+    Returns:
+        {"created": 新建条数, "updated": 更新条数, "unchanged": 跳过条数}
+    """
+    stats = {"created": 0, "updated": 0, "unchanged": 0}
+    last_pk = 0
+    while True:
+        # MySQL 驱动会把整个结果集读入内存，用主键游标分页代替 .iterator()
+        rows = list(User.objects.filter(pk__gt=last_pk, birth_datetime__isnull=False)
+                    .order_by("pk").values_list("pk", "birth_datetime")[:chunk_size])
+        if not rows:
+            return stats
+        last_pk = rows[-1][0]
+
+        dates = [timezone.localtime(dt) if timezone.is_aware(dt) else dt for _, dt in rows]
+        life, scan = analyze_dates([d.year for d in dates], [d.month for d in dates], [d.day for d in dates])
+
+        # 每位用户只比较最新的一条分析
+        latest = {}
+        for analysis in (NumerologyAnalysis.objects.filter(user_id__in=[pk for pk, _ in rows])
+                         .only("id", "user_id", "life_number", "digital_patterns", "analyzed_at")
+                         .order_by("user_id", "-analyzed_at", "-id")):
+            latest.setdefault(analysis.user_id, analysis)
+
+        now = timezone.now()
+        created, updated = [], []
+        for i, (user_id, _) in enumerate(rows):
+            number, patterns = int(life[i]), scan.patterns(i)
+            analysis = latest.get(user_id)
+            if analysis is None:
+                created.append(NumerologyAnalysis(user_id=user_id, life_number=number, digital_patterns=patterns))
+            elif analysis.life_number != number or analysis.digital_patterns != patterns:
+                analysis.life_number, analysis.digital_patterns, analysis.analyzed_at = number, patterns, now
+                updated.append(analysis)
+
+        with transaction.atomic():
+            NumerologyAnalysis.objects.bulk_create(created, batch_size=chunk_size)
+            NumerologyAnalysis.objects.bulk_update(updated, ["life_number", "digital_patterns", "analyzed_at"],
+                                                   batch_size=chunk_size)
+        stats["created"] += len(created)
+        stats["updated"] += len(updated)
+        stats["unchanged"] += len(rows) - len(created) - len(updated)
+
+
+class Command(BaseCommand):
+    help = "按出生日期批量刷新全部用户的数字能量分析（生命数字与日期磁场）"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="每块的用户数")
+
+    def handle(self, *args, **options):
+        stats = refresh_numerology(options["chunk_size"])
+        self.stdout.write(f"新建 {stats['created']} 条，更新 {stats['updated']} 条，跳过 {stats['unchanged']} 条")
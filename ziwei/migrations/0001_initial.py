@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NumerologyAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('life_number', models.IntegerField(verbose_name='生命数字')),
+                ('digital_patterns', models.JSONField(default=list, help_text='识别到的数字磁场列表', verbose_name='数字磁场模式')),
+                ('analyzed_at', models.DateTimeField(auto_now_add=True, verbose_name='分析时间')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='user.user', verbose_name='所属用户')),
+            ],
+            options={
+                'verbose_name': '数字能量分析',
+                'verbose_name_plural': '数字能量管理',
+                'db_table': 'numerology_analysis',
+            },
+        ),
+        migrations.CreateModel(
+            name='NatalChart',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year_ganzhi', models.CharField(max_length=20, verbose_name='年干支')),
+                ('month_ganzhi', models.CharField(max_length=20, verbose_name='月干支')),
+                ('day_ganzhi', models.CharField(max_length=20, verbose_name='日干支')),
+                ('hour_ganzhi', models.CharField(max_length=20, verbose_name='时干支')),
+                ('wuxing_bureau', models.CharField(max_length=50, verbose_name='五行局')),
+                ('life_palace', models.CharField(max_length=20, verbose_name='命宫')),
+                ('body_palace', models.CharField(max_length=20, verbose_name='身宫')),
+                ('major_pos', models.JSONField(default=dict, help_text='主星分布字典，格式: {"紫微": 1, "天机": 2}', verbose_name='主星位置')),
+                ('aux_pos', models.JSONField(default=dict, help_text='辅星分布字典，格式: {"文昌": 3, "文曲": 4}', verbose_name='辅星位置')),
+                ('four_trans', models.JSONField(default=dict, help_text='四化星信息，格式: {"年干禄": "廉贞"}', verbose_name='四化星')),
+                ('patterns', models.JSONField(default=list, help_text='识别到的格局列表，格式: [{"name": "紫府朝垣", ...}]', verbose_name='格局分析')),
+                ('wuxing_analysis', models.JSONField(default=dict, help_text='五行平衡分析结果', verbose_name='五行分析')),
+                ('calculated_at', models.DateTimeField(auto_now_add=True, verbose_name='计算时间')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='user.user', verbose_name='所属用户')),
+            ],
+            options={
+                'verbose_name': '命盘信息',
+                'verbose_name_plural': '用户命盘管理',
+                'db_table': 'nat_chart',
+                'unique_together': {('user', 'calculated_at')},
+            },
+        ),
+    ]
@@ -1,3 +1,697 @@
-from django.test import TestCase
+import contextlib
+import datetime
+import io
+import json
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import unittest
 
-# Create your tests here.
+import numpy as np
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from user.models import User
+from ziwei.models import NumerologyAnalysis
+
+# 算法模块使用平级导入，测试时需要把算法目录加入搜索路径
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "algorithm"))
+
+import chart_atlas  # noqa: E402
+import compatibility  # noqa: E402
+import jieqi_table  # noqa: E402
+import lunar_table  # noqa: E402
+import numerology  # noqa: E402
+import purchase_date  # noqa: E402
+from chart_index import ChartIndex  # noqa: E402
+from chart_record import ChartRecord  # noqa: E402
+from flying_transform import branch_stem  # noqa: E402
+from four_transform import YEAR_BY_STEM, FourTransform  # noqa: E402
+from ganzhi_converter import GanZhiConverter  # noqa: E402
+from numerology import NumerologyAnalyzer  # noqa: E402
+from major_layout import LAYOUTS, layout_for, layout_of  # noqa: E402
+from sixty_pattern import MAJOR_RULES_MASK, PATTERN_LIST, TRANSFORM_WUXING, PatternAnalyzer  # noqa: E402
+from instrumentation import Instrumentation  # noqa: E402
+from jewelry_recommendation import JewelryRecommendationEngine  # noqa: E402
+from main import bulk_main  # noqa: E402
+from palace import PALACES  # noqa: E402
+from star_system import (  # noqa: E402
+    AUX_TABLE, WUXING_ORDER, StarSystem, arrange_stars_batch, aux_positions, compute_aux_positions, load_aux_table,
+    major_positions, save_aux_table,
+)
+from utils import DI_ZHI, JIAZI, TIAN_GAN  # noqa: E402
+from zhongzhou_calculator import ZhongZhouCalculator  # noqa: E402
+
+try:
+    from lunarcalendar import Converter, Solar
+except ImportError:  # lunarcalendar 仅为生成/校验农历表时的开发依赖
+    Converter = None
+
+
+class LunarTableTests(SimpleTestCase):
+    """查表式阳历转农历"""
+
+    @unittest.skipIf(Converter is None, "未安装 lunarcalendar")
+    def test_matches_lunarcalendar_1900_2100(self):
+        day = datetime.date(1900, 1, 1)
+        end = datetime.date(2100, 12, 31)
+        one = datetime.timedelta(days=1)
+        while day <= end:
+            expected = Converter.Solar2Lunar(Solar(day.year, day.month, day.day))
+            self.assertEqual(
+                lunar_table.solar_to_lunar(day.year, day.month, day.day),
+                (expected.year, expected.month, expected.day, expected.isleap),
+                msg=str(day),
+            )
+            day += one
+
+    def test_leap_month(self):
+        # 2023年闰二月初一为公历2023-03-22
+        self.assertEqual(lunar_table.solar_to_lunar(2023, 3, 22), (2023, 2, 1, True))
+        self.assertEqual(lunar_table.solar_to_lunar(2023, 3, 21), (2023, 2, 30, False))
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            lunar_table.solar_to_lunar(1800, 1, 1)
+        with self.assertRaises(ValueError):
+            lunar_table.solar_to_lunar(2200, 1, 1)
+
+
+class BatchGanZhiTests(SimpleTestCase):
+    """向量化四柱干支与逐个计算结果一致"""
+
+    def test_batch_matches_scalar(self):
+        G = GanZhiConverter
+        dates = [datetime.date(1900, 1, 1) + datetime.timedelta(days=d) for d in range(0, 73000, 331)]
+        years = [d.year for d in dates]
+        months = [d.month for d in dates]
+        hours = [i % 24 for i in range(len(dates))]
+        res = G.batch_ganzhi(years, months, [d.toordinal() for d in dates], hours)
+        for i, d in enumerate(dates):
+            ygz, bureau = G.get_year_ganzhi(d.year)
+            mgz = G.get_month_ganzhi(ygz, d.month)
+            dgz = G.get_day_ganzhi(d)
+            hgz = G.get_hour_ganzhi(dgz, G.DI_ZHI[((hours[i] + 1) % 24) // 2])
+            for name, gz in (("year", ygz), ("month", mgz), ("day", dgz), ("hour", hgz)):
+                self.assertEqual(G.TIAN_GAN[res[name + "_stem"][i]] + G.DI_ZHI[res[name + "_branch"][i]], gz)
+            self.assertEqual(res["bureau"][i], G.BUREAU_NUMBER[bureau[0]])
+
+    def test_hour_stem_five_rats(self):
+        G = GanZhiConverter
+        # 五鼠遁：甲己日起甲子，乙庚日起丙子，丙辛日起戊子，丁壬日起庚子，戊癸日起壬子
+        for day_stem, first in zip("甲乙丙丁戊己庚辛壬癸", "甲丙戊庚壬甲丙戊庚壬"):
+            self.assertEqual(G.get_hour_ganzhi(day_stem + "子", "子"), first + "子")
+        for day_stem in range(10):
+            for branch in range(12):
+                # 时干支必须是六十甲子中的一对（干支阴阳相同）
+                stem, _ = G.hour_index(day_stem, branch)
+                self.assertEqual(stem % 2, branch % 2)
+        res = G.batch_ganzhi([2000] * 12, [1] * 12, [datetime.date(2000, 1, 1).toordinal()] * 12,
+                             list(range(0, 24, 2)))
+        self.assertEqual([G.hour_index(int(res["day_stem"][0]), b)[0] for b in res["hour_branch"]],
+                         res["hour_stem"].tolist())
+
+
+class JieqiTests(SimpleTestCase):
+    """节气表与按节气计算的年柱、月柱"""
+
+    def test_lichun_boundary(self):
+        # 2024年立春交节时刻为北京时间 2月4日 16:27
+        before = datetime.datetime(2024, 2, 4, 16, 0)
+        after = datetime.datetime(2024, 2, 4, 17, 0)
+        self.assertEqual(GanZhiConverter.get_year_month_ganzhi(before), ("癸卯", "乙丑"))
+        self.assertEqual(GanZhiConverter.get_year_month_ganzhi(after), ("甲辰", "丙寅"))
+
+    def test_late_zi_hour_after_jie(self):
+        # 23 点出生按当日 23:00 与交节时刻比较：2023 年大雪交节为 12月7日 17:33，2024 年立春为 2月4日 16:27
+        for birth, year_gz, month_gz in (
+                ({"year": 2023, "month": 12, "day": 7, "hour": 22}, "癸卯", "甲子"),
+                ({"year": 2023, "month": 12, "day": 7, "hour": 23}, "癸卯", "甲子"),
+                ({"year": 2023, "month": 12, "day": 7, "hour": 0}, "癸卯", "癸亥"),
+                ({"year": 2024, "month": 2, "day": 4, "hour": 23}, "甲辰", "丙寅")):
+            chart = ZhongZhouCalculator(cache_size=0).calculate(birth)
+            self.assertEqual((chart["year_ganzhi"], chart["month_ganzhi"]), (year_gz, month_gz), birth)
+
+    def test_cache_splits_jie_day(self):
+        # 共用缓存时，交节前后的同一时辰不能互相命中
+        calc = ZhongZhouCalculator()
+        day = {"year": 2023, "month": 12, "day": 7}
+        self.assertEqual(calc.calculate({**day, "hour": 17, "minute": 10})["month_ganzhi"], "癸亥")
+        self.assertEqual(calc.calculate({**day, "hour": 17, "minute": 40})["month_ganzhi"], "甲子")
+        calc.calculate_hour_range(day)
+        self.assertEqual(calc.calculate({**day, "hour": 23})["month_ganzhi"], "甲子")
+        with self.assertRaises(ValueError):
+            calc.calculate({**day, "hour": 17, "minute": 60})
+
+    def test_fallback_close_to_table(self):
+        for year in (1900, 1950, 2000, 2050, 2100):
+            table = jieqi_table.year_terms(year)
+            calc = jieqi_table.calc_year_terms(year)
+            for a, b in zip(table, calc):
+                self.assertLess(abs(a - b), 30)
+
+    def test_batch_matches_scalar(self):
+        instants = [datetime.datetime(1900, 1, 7) + datetime.timedelta(hours=h) for h in range(0, 1760000, 997)]
+        years, months = jieqi_table.solar_month_batch([jieqi_table.to_minutes(d) for d in instants])
+        for d, y, m in zip(instants, years, months):
+            self.assertEqual(jieqi_table.solar_month(d), (y, m))
+
+
+class ChartCacheTests(SimpleTestCase):
+    """命盘缓存"""
+
+    def test_hour_and_branch_share_key(self):
+        calc = ZhongZhouCalculator(cache_size=2)
+        first = calc.calculate({"year": 1990, "month": 7, "day": 7, "hour": 9, "gender": "male"})
+        second = calc.calculate({"year": 1990, "month": 7, "day": 7, "hour": "巳", "gender": "male"})
+        self.assertEqual(first, second)
+        self.assertEqual(calc.cache_info()[:2], (1, 1))
+
+    def test_results_are_copies(self):
+        calc = ZhongZhouCalculator()
+        birth = {"year": 1990, "month": 7, "day": 7, "hour": 0}
+        chart = calc.calculate(birth)
+        chart["major_pos"]["紫微"] = -1
+        chart["patterns"].clear()
+        self.assertNotEqual(calc.calculate(birth), chart)
+
+    def test_calculate_many_in_order_with_errors(self):
+        calc = ZhongZhouCalculator()
+        births = [{"year": 1980 + i, "month": 5, "day": 1 + i, "hour": i} for i in range(20)]
+        births[7] = {"year": 1990}
+        results = list(calc.calculate_many(iter(births), workers=2, chunksize=3))
+        self.assertEqual([r.index for r in results], list(range(20)))
+        self.assertIsNotNone(results[7].error)
+        for birth, res in zip(births, results):
+            if res.error is None:
+                self.assertEqual(res.chart, calc.calculate(birth))
+
+    def test_bulk_main_keeps_unparsable_lines(self):
+        lines = ["[leading bad", '{"year": 1990, "month": 5, "day": 1, "hour": 8}', "{bad json", "",
+                 '{"year": 1990, "month": 2, "day": 30, "hour": 8}', '{"year": 2001, "month": 7, "day": 9, "hour": 23}',
+                 "not json either"]
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = os.path.join(tmp, "in.jsonl"), os.path.join(tmp, "out.jsonl")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            for workers in (1, 2):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    bulk_main(src, dst, workers=workers)
+                with open(dst, encoding="utf-8") as f:
+                    rows = [json.loads(line) for line in f]
+                self.assertEqual([r["index"] for r in rows], [0, 1, 2, 3, 4, 5])
+                self.assertEqual(["chart" in r for r in rows], [False, True, False, False, True, False])
+                for i in (0, 2, 5):
+                    self.assertIn("JSON", rows[i]["error"])
+
+    def test_eviction(self):
+        calc = ZhongZhouCalculator(cache_size=2)
+        for day in (1, 2, 3):
+            calc.calculate({"year": 2000, "month": 1, "day": day, "hour": 12})
+        info = calc.cache_info()
+        self.assertEqual((info.evictions, info.currsize), (1, 2))
+
+
+class ChartAtlasTests(SimpleTestCase):
+    """命盘图谱读写"""
+
+    def test_lookup_matches_calculate(self):
+        calc = ZhongZhouCalculator()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "atlas.bin")
+            start, end = datetime.date(2024, 2, 3), datetime.date(2024, 2, 5)
+            self.assertEqual(chart_atlas.build_atlas(path, start, end, workers=2, chunk_days=1), 3 * 24)
+            with chart_atlas.ChartAtlas(path) as atlas:
+                for day in (3, 4, 5):
+                    for hour in range(0, 24, 3):
+                        for gender in ("male", "female"):
+                            birth = {"year": 2024, "month": 2, "day": day, "hour": hour, "gender": gender}
+                            chart = calc.calculate(birth)
+                            self.assertEqual(atlas.lookup(birth), chart)
+                            ratio = chart["wuxing_analysis"]["ratio"]
+                            np.testing.assert_allclose(atlas.wuxing[atlas.index(birth)],
+                                                       [ratio[w] for w in WUXING_ORDER], rtol=1e-6)
+                with self.assertRaises(KeyError):
+                    atlas.lookup({"year": 2024, "month": 2, "day": 6, "hour": 0})
+            # 旧版本（wuxing 列缺失或按旧算法生成）的文件拒绝打开
+            with open(path, "r+b") as f:
+                f.seek(8)
+                f.write(struct.pack("<I", chart_atlas.VERSION - 1))
+            with self.assertRaises(ValueError):
+                chart_atlas.ChartAtlas(path)
+
+
+class BatchStarTests(SimpleTestCase):
+    """向量化星曜排布"""
+
+    def test_batch_matches_scalar(self):
+        rows = [(day, bureau, direction, stem, month, hour)
+                for day in (1, 9, 17, 30) for bureau in range(2, 7) for direction in (1, -1)
+                for stem in range(10) for month in range(12) for hour in (0, 5, 11)]
+        matrix = arrange_stars_batch(*zip(*rows))
+        self.assertEqual(matrix.shape, (len(rows), 28))
+        for row, got in zip(rows, matrix.tolist()):
+            day, bureau, direction, stem, month, hour = row
+            self.assertEqual(got, major_positions(day, bureau, direction) + aux_positions(stem, month, hour))
+
+
+class ChartRecordTests(SimpleTestCase):
+    """紧凑命盘记录"""
+
+    def test_record_matches_dict_and_pickles(self):
+        calc = ZhongZhouCalculator(cache_size=0)
+        birth = {"year": 1988, "month": 8, "day": 8, "hour": "午", "gender": "female"}
+        record = calc.calculate_record(birth)
+        self.assertIsInstance(record, ChartRecord)
+        self.assertEqual(record.to_dict(), calc.calculate(birth))
+        self.assertEqual(dict(record), record.to_dict())
+        self.assertEqual(pickle.loads(pickle.dumps(record)).to_dict(), record.to_dict())
+        with self.assertRaises(AttributeError):
+            record.life = 0
+
+
+class InstrumentationTests(SimpleTestCase):
+    """分阶段计时"""
+
+    def test_stages_recorded_and_exported(self):
+        inst = Instrumentation()
+        seen = []
+        inst.add_listener(lambda stage, seconds: seen.append(stage))
+        calc = ZhongZhouCalculator(cache_size=0, instrumentation=inst)
+        for day in (1, 2, 3):
+            calc.calculate({"year": 2000, "month": 3, "day": day, "hour": 10})
+        stats = inst.snapshot()
+        for stage in ("pillars", "lunar", "layout", "palace", "stars", "patterns", "render"):
+            self.assertEqual(stats[stage]["count"], 3)
+            self.assertEqual(stats[stage]["buckets"]["+Inf"], 3)
+        self.assertEqual(len(seen), 21)
+        text = inst.export_prometheus()
+        self.assertIn('ziwei_chart_stage_seconds_count{stage="lunar"} 3', text)
+        self.assertIn('"render"', inst.export_json())
+
+
+class PatternEngineTests(SimpleTestCase):
+    """编译后的格局规则"""
+
+    def test_batch_matches_scalar(self):
+        self.assertEqual(len(PATTERN_LIST), 60)
+        rows, lives, stems = [], [], []
+        for day in range(1, 31, 3):
+            for bureau in range(2, 7):
+                for direction in (1, -1):
+                    for stem in range(10):
+                        rows.append(major_positions(day, bureau, direction) + aux_positions(stem, day % 12, bureau))
+                        lives.append((day + stem) % 12)
+                        stems.append(stem)
+        masks = PatternAnalyzer.identify_batch(rows, lives, stems).tolist()
+        for row, life, stem, mask in zip(rows, lives, stems, masks):
+            self.assertEqual(mask, PatternAnalyzer.identify_mask(row, life, stem))
+
+    def test_missing_context_skips_rules(self):
+        stars = major_positions(1, 2, 1)
+        names = {p["name"] for p in PatternAnalyzer.identify(dict(zip(StarSystem.MAJOR, stars)))}
+        self.assertIn("紫府朝垣", names)
+        self.assertNotIn("紫杀同宫", names)  # 依赖命宫
+        names = {p["name"] for p in PatternAnalyzer.identify_positions(stars, life=stars[0])}
+        self.assertIn("紫杀同宫", names)
+
+    def test_wuxing_matches_stars(self):
+        # 格局五行须取自条件所涉星曜（对冲安放的辅星计入其对星）
+        partner = {"文昌": "文曲", "左辅": "右弼", "天魁": "天钺", "擎羊": "陀罗", "火星": "铃星"}
+        for pattern, rule in PatternAnalyzer.RULES.items():
+            stars = {point for cond in rule["when"] for point in cond[1:-1]} - {"命宫"}
+            allowed = set()
+            for star in stars | {partner[s] for s in stars if s in partner}:
+                allowed.update(TRANSFORM_WUXING.get(star) or StarSystem.WUXING[star])
+            self.assertLessEqual(set(rule["wuxing"]), allowed, pattern)
+
+
+class MajorLayoutTests(SimpleTestCase):
+    """24 种主星布局表"""
+
+    def test_layouts_match_direct_computation(self):
+        self.assertEqual(len(LAYOUTS), 24)
+        for day in range(1, 31):
+            for bureau in range(2, 7):
+                for direction in (1, -1):
+                    stars = major_positions(day, bureau, direction)
+                    layout = layout_for(day, bureau, direction)
+                    self.assertEqual(list(layout.positions), stars)
+                    self.assertIs(layout_of(stars), layout)
+                    self.assertEqual(layout.patterns, PatternAnalyzer.identify_mask(stars) & MAJOR_RULES_MASK)
+
+
+class AuxTableTests(SimpleTestCase):
+    """1440 行辅星表"""
+
+    def test_table_matches_rules_for_every_combination(self):
+        self.assertEqual(AUX_TABLE.shape, (1440, 14))
+        rows = iter(AUX_TABLE.tolist())
+        for stem in range(10):
+            for month in range(12):
+                for hour in range(12):
+                    expected = compute_aux_positions(stem, month, hour)
+                    self.assertEqual(next(rows), expected)
+                    self.assertEqual(aux_positions(stem, month, hour), expected)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "aux.npy")
+            save_aux_table(path)
+            table = load_aux_table(path)
+            self.assertTrue((table == AUX_TABLE).all())
+            del table  # 释放 mmap 后才能删除临时目录
+
+
+class FlyingTransformTests(SimpleTestCase):
+    """宫干与飞化图"""
+
+    def test_palace_stems(self):
+        # 甲年：寅宫丙，亥宫乙，子、丑两宫接续为丙、丁
+        self.assertEqual([branch_stem(0, b) for b in (2, 11, 0, 1)], [2, 1, 2, 3])
+        # 戊癸之年甲寅之上好追寻
+        self.assertEqual(branch_stem(9, 2), 0)
+
+    def test_graph_matches_star_positions(self):
+        calc = ZhongZhouCalculator(cache_size=0)
+        record = calc.calculate_record({"year": 1975, "month": 11, "day": 2, "hour": 15, "gender": "male"})
+        graph = record.flying_graph()
+        stars = record["major_pos"]
+        stars.update(record["aux_pos"])
+        for source in range(12):
+            stem_name = GanZhiConverter.TIAN_GAN[graph.stems[source]]
+            for kind, star in zip(("禄", "权", "科", "忌"), FourTransform.YEAR[stem_name]):
+                target = (record.life - stars[star]) % 12
+                self.assertEqual(graph.target(source, kind), target)
+                self.assertTrue(graph.sources_mask(kind, target) >> source & 1)
+        self.assertEqual(record["four_trans"]["自化禄"], FourTransform.PALACE[GanZhiConverter.TIAN_GAN[graph.stems[0]]][0])
+
+
+class WuxingWeightTests(SimpleTestCase):
+    """庙旺利陷加权的五行分析"""
+
+    def test_batch_matches_scalar(self):
+        rows = [major_positions(day, 2 + day % 5, 1 - 2 * (day % 2)) + aux_positions(day % 10, day % 12, day * 7 % 12)
+                for day in range(1, 31)]
+        ratios = ZhongZhouCalculator.analyze_wuxing_batch(rows)
+        for row, ratio in zip(rows, ratios.tolist()):
+            analysis = ZhongZhouCalculator.analyze_wuxing(dict(zip(StarSystem.MAJOR, row[:14])),
+                                                          dict(zip(StarSystem.AUX, row[14:])))
+            for got, expected in zip(ratio, analysis["ratio"].values()):
+                self.assertAlmostEqual(got, expected)
+
+    def test_brightness_weights(self):
+        # 太阳在午（旺）比在子（陷）力量更强
+        bright = ZhongZhouCalculator.analyze_wuxing({"太阳": 6})["count"]["火"]
+        dim = ZhongZhouCalculator.analyze_wuxing({"太阳": 0})["count"]["火"]
+        self.assertGreater(bright, dim)
+
+
+class HourRangeTests(SimpleTestCase):
+    """时辰不详时的十二时辰命盘"""
+
+    def test_matches_calculate_across_lichun(self):
+        # 2024-02-04 16 时前后交立春，年柱、五行局随时辰变化
+        calc = ZhongZhouCalculator(cache_size=0)
+        birth = {"year": 2024, "month": 2, "day": 4, "gender": "female"}
+        result = calc.calculate_hour_range(birth)
+        self.assertEqual(len(result.charts), 12)
+        for h_branch, record in enumerate(result.charts):
+            self.assertEqual(record.to_dict(), calc.calculate(dict(birth, hour=h_branch * 2)))
+        self.assertIn("year_ganzhi", result.varying)
+        self.assertIn("life_palace", result.varying)
+        self.assertNotIn("day_ganzhi", result.varying)
+
+    def test_fills_cache(self):
+        calc = ZhongZhouCalculator()
+        result = calc.calculate_hour_range({"year": 1990, "month": 7, "day": 7})
+        self.assertNotIn("year_ganzhi", result.varying)
+        self.assertIs(calc.calculate_record({"year": 1990, "month": 7, "day": 7, "hour": "巳"}), result.charts[5])
+
+
+class LuckTimelineTests(SimpleTestCase):
+    """大限、流年时间线"""
+
+    def test_series_matches_rules(self):
+        calc = ZhongZhouCalculator()
+        # 1990-01-20 在立春前，干支纪年为 1989 己巳年；阴女顺行
+        birth = {"year": 1990, "month": 1, "day": 20, "hour": 9, "gender": "female"}
+        record = calc.calculate_record(birth)
+        timeline = calc.calculate_timeline(birth)
+        self.assertEqual((timeline.birth_year, len(timeline.years)), (1989, 120))
+        self.assertIsNone(timeline.at_age(timeline.bureau - 1)["decade"])
+        for age in range(timeline.bureau, 121):
+            info = timeline.at_age(age)
+            year_stem, year_branch = GanZhiConverter.year_index(info["year"])
+            d = (age - timeline.bureau) // 10
+            branch = (record.life + d) % 12
+            self.assertEqual(info["decade"]["palace"], PALACES[(record.life - branch) % 12].value)
+            self.assertEqual(info["decade"]["ganzhi"][0], TIAN_GAN[branch_stem(record.year % 10, branch)])
+            self.assertEqual(list(info["annual"]["four_trans"].values()), list(YEAR_BY_STEM[year_stem]))
+            self.assertEqual(info["annual"]["life_palace"], PALACES[(record.life - year_branch) % 12].value)
+        with self.assertRaises(ValueError):
+            timeline.year_info(1989 + 120)
+        with self.assertRaises(ValueError):
+            record.luck_timeline(1990)
+
+        # 大限序号在长跨度下不溢出；跨度超出上限拒绝
+        long = record.luck_timeline(1989, 1200)
+        self.assertEqual((long.decade.min(), long.decade.max()), (-1, (1200 - long.bureau) // 10))
+        with self.assertRaises(ValueError):
+            record.luck_timeline(1989, 2000)
+
+
+class PurchaseDateTests(SimpleTestCase):
+    """吉日选购"""
+
+    def test_batch_matches_scalar_rules(self):
+        calc = ZhongZhouCalculator()
+        records = [calc.calculate_record({"year": 1970 + i, "month": 1 + i % 12, "day": 3 + i, "hour": i})
+                   for i in range(6)]
+        start = datetime.date(2026, 3, 1)
+        table = purchase_date.cycle_scores(records, "木")
+        for record, row in zip(records, table.tolist()):
+            weakest = record["wuxing_analysis"]["weakest"]
+            for offset in range(60):
+                gz = GanZhiConverter.get_day_ganzhi(start + datetime.timedelta(days=offset))
+                day = purchase_date.CYCLE_WUXING[JIAZI.index(gz)]
+                expected = (purchase_date.RELATION[day, WUXING_ORDER.index("木")]
+                            + purchase_date.WEAK_WEIGHT * purchase_date.RELATION[day, WUXING_ORDER.index(weakest)])
+                lu, _, _, ji = YEAR_BY_STEM[TIAN_GAN.index(gz[0])]
+                stars = dict(zip(StarSystem.ALL, record.stars))
+                expected += purchase_date.LU_BONUS * (stars[lu] == record.life)
+                expected -= purchase_date.JI_PENALTY * (stars[ji] == record.life)
+                expected -= purchase_date.CLASH_PENALTY * (DI_ZHI.index(gz[1]) == (record.life + 6) % 12)
+                self.assertAlmostEqual(row[JIAZI.index(gz)], expected)
+
+        order, scores = purchase_date.best_days_batch(records, "木", start, days=90, k=3)
+        self.assertEqual(order.shape, (6, 3))
+        top = purchase_date.best_days(records[0], "木", start, days=90, k=3)
+        self.assertEqual([d["score"] for d in top], [round(s, 4) for s in scores[0].tolist()])
+        self.assertEqual(scores[0].max(), table[0][purchase_date.day_cycles(start, 90)].max())
+
+    def test_non_positive_k(self):
+        record = ZhongZhouCalculator().calculate_record({"year": 1990, "month": 5, "day": 1, "hour": 8})
+        start = datetime.date(2026, 3, 1)
+        for k in (0, -3):
+            order, scores = purchase_date.best_days_batch([record, record], "金", start, days=30, k=k)
+            self.assertEqual((order.shape, scores.shape), ((2, 0), (2, 0)))
+            self.assertEqual(purchase_date.best_days(record, "金", start, days=30, k=k), [])
+
+
+class ChartIndexTests(SimpleTestCase):
+    """命盘反查索引"""
+
+    def test_query_matches_brute_force(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "atlas.bin")
+            start, end = datetime.date(1990, 1, 1), datetime.date(1990, 2, 28)
+            chart_atlas.build_atlas(path, start, end, workers=2, chunk_days=16)
+            with chart_atlas.ChartAtlas(path) as atlas:
+                index = ChartIndex(atlas)
+                records = [atlas.record(i) for i in range(len(atlas))]
+                births = [atlas.birth(i) for i in range(len(atlas))]
+                self.assertEqual([atlas.index(b) for b in births], list(range(len(atlas))))
+
+                pattern = max(PATTERN_LIST, key=lambda p: len(index.pattern_ids(p.value))).value
+                first, last = datetime.date(1990, 1, 10), datetime.date(1990, 2, 10)
+                got = index.query(patterns=[pattern], life="财帛", start=first, end=last)
+                expected = [i for i, (r, b) in enumerate(zip(records, births))
+                            if any(p["name"] == pattern for p in r["patterns"]) and r["life_palace"] == "财帛"
+                            and first <= datetime.date(b["year"], b["month"], b["day"]) <= last]
+                self.assertEqual(got.tolist(), expected)
+
+                ziwei, tianma = records[101]["major_pos"]["紫微"], records[101]["aux_pos"]["天马"]
+                got = index.query(stars={"紫微": ziwei, "天马": tianma}, gender="female")
+                expected = [i for i, (r, b) in enumerate(zip(records, births))
+                            if r["major_pos"]["紫微"] == ziwei and r["aux_pos"]["天马"] == tianma
+                            and b["gender"] == "female"]
+                self.assertIn(101, expected)
+                self.assertEqual(got.tolist(), expected)
+                with self.assertRaises(ValueError):
+                    index.query(patterns=["不存在的格局"])
+
+
+class CompatibilityTests(SimpleTestCase):
+    """合盘匹配"""
+
+    def test_blocked_top_k_matches_full_sort(self):
+        calc = ZhongZhouCalculator()
+        records = [calc.calculate_record({"year": 1960 + i % 40, "month": 1 + i % 12, "day": 1 + i * 7 % 28,
+                                          "hour": i * 5 % 24, "gender": "male" if i % 3 else "female"})
+                   for i in range(300)]
+        vectors = compatibility.encode(records)
+        full = compatibility.pair_scores(vectors, vectors)
+        self.assertTrue(np.allclose(full, full.T))
+
+        engine = compatibility.CompatibilityEngine(vectors, block=64)
+        everyone = engine.all_top_matches(k=5)
+        for i in range(0, 300, 17):
+            expected = sorted((j for j in range(300) if j != i), key=lambda j: (-full[i, j], j))[:5]
+            self.assertEqual([j for j, _ in everyone[i]], expected)
+            one = engine.top_matches(vectors.take(slice(i, i + 1)), k=5, exclude=i)
+            self.assertEqual([j for j, _ in one], expected)
+
+        self.assertEqual(engine.top_matches(vectors.take(slice(0, 1)), k=0), [])
+        self.assertEqual(engine.all_top_matches(k=0)[0], [])
+        with self.assertRaises(ValueError):
+            engine.top_matches(vectors.take(slice(0, 2)))
+
+
+class NumerologyScanTests(SimpleTestCase):
+    """数字能量批量分析"""
+
+    def test_scan_matches_per_string(self):
+        numbers = ["13912345678", "+86 138-0013-8000", "", "abc", "7", "2019-03-14"] + [
+            f"1{i * 7919 % 10 ** 10:010d}" for i in range(200)]
+        scans = list(numerology.scan_numbers(iter(numbers), chunk_size=64))
+        self.assertEqual([len(s.counts) for s in scans], [64, 64, 64, 14])
+        for i, number in enumerate(numbers):
+            scan, row = scans[i // 64], i % 64
+            expected = NumerologyAnalyzer.analyze_digits(number)
+            self.assertEqual([name for _, name in scan.positions(row)], [p["pattern"] for p in expected])
+            self.assertEqual(scan.counts[row].tolist(),
+                             [sum(p["pattern"] == name for p in expected) for name in numerology.PATTERN_NAMES])
+        self.assertEqual(NumerologyAnalyzer.analyze_patterns({"year": 2019, "month": 3, "day": 14}),
+                         NumerologyAnalyzer.analyze_digits("2019-03-14"))
+
+    def test_batch_dates_match_scalar(self):
+        dates = [datetime.date(1900, 1, 1) + datetime.timedelta(days=d) for d in range(0, 73000, 37)]
+        life, scan = numerology.analyze_dates([d.year for d in dates], [d.month for d in dates],
+                                              [d.day for d in dates])
+        for i, d in enumerate(dates):
+            birth = {"year": d.year, "month": d.month, "day": d.day}
+            digits = f"{d.year}{d.month:02d}{d.day:02d}"
+            s = sum(int(c) for c in digits)
+            while s > 9:
+                s = sum(int(c) for c in str(s))
+            self.assertEqual(NumerologyAnalyzer.calculate_life_number(birth), s)
+            self.assertEqual(life[i], s)
+            self.assertEqual(scan.patterns(i), NumerologyAnalyzer.analyze_patterns(birth))
+
+
+class JewelryIndexTests(SimpleTestCase):
+    """珠宝推荐目录位图编码"""
+
+    CATALOG = [
+        {"id": i, "name": f"珠宝{i}", "wuxing": "金木水火土"[i % 5], "price_tier": ("high", "mid", "low")[i % 3],
+         "digital_tags": [i % 9 + 1, ("天医", "延年", "绝命", "生气")[i % 4]][:1 + i % 2],
+         "fengshui_tags": [("东", "南", "西", "北")[i % 4], "金木水火土"[i * 3 % 5]]}
+        for i in range(60)
+    ]
+
+    @classmethod
+    def ranked(cls, scores, limit=None):
+        """参照实现：逐件计分，按得分、价格等级、数字标签数量、目录顺序排序"""
+        tiers = {"high": 0, "mid": 1, "low": 2}
+        keys = sorted((-score, tiers[j["price_tier"]], -len(j["digital_tags"]), pos)
+                      for pos, (j, score) in enumerate(zip(cls.CATALOG, scores)) if score)
+        return [cls.CATALOG[key[-1]] for key in keys[:limit]]
+
+    def test_paths_match_linear_scan(self):
+        engine = JewelryRecommendationEngine(self.CATALOG)
+        self.assertEqual(engine.recommend_by_year({"wuxing_bureau": "水二局"}),
+                         self.ranked([j["wuxing"] == "水" for j in self.CATALOG]))
+        self.assertEqual(engine.recommend_by_fengshui(["南", "土"]),
+                         self.ranked([len({"南", "土"} & set(j["fengshui_tags"])) for j in self.CATALOG]))
+        # 丙寅纳音炉中火、戊辰纳音大林木；生命数字默认权重 1.5
+        scores = [(j["wuxing"] == "火") + (j["wuxing"] == "木") + 1.5 * (4 in j["digital_tags"])
+                  + len({"天医", "生气"} & set(j["digital_tags"])) for j in self.CATALOG]
+        got = engine.recommend_by_month_day({"month_ganzhi": "丙寅", "day_ganzhi": "戊辰"}, 4,
+                                            [{"pattern": "天医"}, {"pattern": "生气"}])
+        self.assertEqual(got, self.ranked(scores))
+
+    def test_year_list_ranked_not_catalog_order(self):
+        # 年度推荐按排名输出（价格等级高者在前，同级数字标签多者在前，再按目录顺序），不再按目录顺序
+        engine = JewelryRecommendationEngine(self.CATALOG)
+        got = [j["id"] for j in engine.recommend_by_year({"wuxing_bureau": "水二局"})]
+        self.assertEqual(got, [27, 57, 12, 42, 7, 37, 22, 52, 17, 47, 2, 32])
+        self.assertEqual([j["id"] for j in engine.recommend_by_year({"wuxing_bureau": "水二局"}, limit=3)],
+                         [27, 57, 12])
+
+    def test_weights_and_limit(self):
+        engine = JewelryRecommendationEngine(self.CATALOG + [dict(self.CATALOG[5])],
+                                             weights={"life_number": 0.0, "patterns": 3.0})
+        scores = [(j["wuxing"] == "火") + (j["wuxing"] == "木") + 3.0 * len({"天医"} & set(j["digital_tags"]))
+                  for j in self.CATALOG]
+        got = engine.recommend({"wuxing_bureau": "金四局"}, {"month_ganzhi": "丙寅", "day_ganzhi": "戊辰"},
+                               4, [{"pattern": "天医"}], ["北"], limit=5)
+        # 末尾追加的重复 id 商品不会再出现
+        self.assertEqual(got["month_day_recommend"]["items"], self.ranked(scores, 5))
+        self.assertEqual(len(got["year_recommend"]["items"]), 5)
+        self.assertEqual(got["fengshui_recommend"]["items"],
+                         self.ranked([("北" in j["fengshui_tags"]) for j in self.CATALOG], 5))
+        with self.assertRaises(ValueError):
+            JewelryRecommendationEngine(self.CATALOG, weights={"unknown": 1.0})
+
+    def test_match_batch_counts(self):
+        # 超过 64 个风水标签时位图按字扩展
+        catalog = self.CATALOG + [dict(self.CATALOG[0], id=100 + t, fengshui_tags=[f"标签{t}"]) for t in range(80)]
+        engine = JewelryRecommendationEngine(catalog)
+        queries = [{"wuxing": ["金", "水"], "digital_tags": [3, "延年"], "fengshui_tags": ["东", "标签70", "无"]}, {}]
+        hits = engine.match_batch(queries)
+        self.assertEqual(hits.shape, (2, len(catalog)))
+        expected = [(j["wuxing"] in ("金", "水")) + len({3, "延年"} & set(j["digital_tags"]))
+                    + len({"东", "标签70"} & set(j["fengshui_tags"])) for j in catalog]
+        self.assertEqual(hits[0].tolist(), expected)
+        self.assertFalse(hits[1].any())
+
+
+class RefreshNumerologyTests(TestCase):
+    """批量刷新数字能量分析命令"""
+
+    BIRTHS = [(1990, 5, 1), (1985, 12, 31), (2001, 2, 3), (1972, 7, 19), (1999, 9, 9)]
+
+    def setUp(self):
+        self.users = [User.objects.create(username=f"user{i}", birth_datetime=datetime.datetime(
+            y, m, d, 8, tzinfo=datetime.timezone.utc)) for i, (y, m, d) in enumerate(self.BIRTHS)]
+        User.objects.create(username="no_birth")
+        # user0 已有正确的分析，user1 的分析已过期，其余没有分析
+        NumerologyAnalysis.objects.create(user=self.users[0], **self.expected(0))
+        self.stale = NumerologyAnalysis.objects.create(user=self.users[1], life_number=0, digital_patterns=[])
+
+    def expected(self, i):
+        y, m, d = self.BIRTHS[i]
+        birth = {"year": y, "month": m, "day": d}
+        return {"life_number": NumerologyAnalyzer.calculate_life_number(birth),
+                "digital_patterns": NumerologyAnalyzer.analyze_patterns(birth)}
+
+    def test_refresh_then_noop(self):
+        out = io.StringIO()
+        # 每块 2 人，共 3 块，验证主键分页
+        call_command("refresh_numerology", chunk_size=2, stdout=out)
+        self.assertIn("新建 3 条，更新 1 条，跳过 1 条", out.getvalue())
+        self.assertEqual(NumerologyAnalysis.objects.count(), 5)
+        for i, user in enumerate(self.users):
+            rows = list(NumerologyAnalysis.objects.filter(user=user).values("life_number", "digital_patterns"))
+            self.assertEqual(rows, [self.expected(i)])
+        self.stale.refresh_from_db()
+        self.assertEqual(self.stale.life_number, self.expected(1)["life_number"])
+
+        snapshot = list(NumerologyAnalysis.objects.order_by("id").values_list("id", "analyzed_at"))
+        out = io.StringIO()
+        call_command("refresh_numerology", chunk_size=2, stdout=out)
+        self.assertIn("新建 0 条，更新 0 条，跳过 5 条", out.getvalue())
+        self.assertEqual(list(NumerologyAnalysis.objects.order_by("id").values_list("id", "analyzed_at")), snapshot)